@@ -2,23 +2,59 @@
 __version__ = "0.0.0"
 
 __all__ = [
+    "AllocationSite",
+    "CallStats",
     "CannotDeriveNameError",
     "CannotRegisterPythonBuiltInError",
+    "Checkpoint",
+    "HierarchyStats",
     "InvalidNameError",
+    "InvalidPipelineError",
+    "InvalidVersionError",
     "KeyCollisionError",
+    "LazyEntry",
     "ModuleAliasError",
+    "OverlayRegistry",
+    "Pipeline",
+    "PoolMetrics",
+    "Prewarmer",
     "Registry",
+    "RegistryDiff",
     "RegistryError",
+    "RegistryEvent",
     "RegistryMeta",
+    "RegistryPool",
+    "RegistryStats",
+    "RegistryView",
+    "RegistryWatcher",
+    "ReloadEvent",
+    "Traversal",
     "InternalError",
+    "checkpoint",
+    "rollback",
 ]
 
+from ._calls import CallStats
+from ._checkpoint import Checkpoint, checkpoint, rollback
+from ._events import RegistryEvent
+from ._lazy import LazyEntry
+from ._overlay import OverlayRegistry
+from ._pipeline import Pipeline
+from ._pool import PoolMetrics, RegistryPool
+from ._prewarm import Prewarmer
 from ._registry import Registry, RegistryMeta
+from ._reload import RegistryWatcher, ReloadEvent
+from ._setops import RegistryDiff
+from ._stats import AllocationSite, HierarchyStats, RegistryStats
+from ._traverse import Traversal
+from ._views import RegistryView
 from .exceptions import (
     CannotDeriveNameError,
     CannotRegisterPythonBuiltInError,
     InternalError,
     InvalidNameError,
+    InvalidPipelineError,
+    InvalidVersionError,
     KeyCollisionError,
     ModuleAliasError,
     RegistryError,
@@ -0,0 +1,80 @@
+"""Sampled per-key statistics for calls made through ``Registry.call``.
+"""
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict
+
+# Number of most recent latency samples kept per key for percentiles.
+SAMPLE_WINDOW = 1024
+
+
+@dataclass
+class CallStats:
+    """Statistics of calls to a single registry key.
+
+    Calls and exceptions are always counted; latency is only measured for a
+    sample of calls, so ``total_time`` is an estimate.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    sampled: int = 0
+    # Cumulative latency of sampled calls, in seconds.
+    sampled_time: float = 0.0
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=SAMPLE_WINDOW))
+
+    @property
+    def mean(self) -> float:
+        """Mean latency of sampled calls, in seconds."""
+        return self.sampled_time / self.sampled if self.sampled else 0.0
+
+    @property
+    def total_time(self) -> float:
+        """Estimated cumulative latency of all calls, in seconds."""
+        return self.mean * self.calls
+
+    def percentile(self, q: float) -> float:
+        """Latency percentile ``q`` (0-100) over the most recent samples, in seconds."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(q / 100 * len(ordered)))
+        return ordered[index]
+
+
+class CallRecorder:
+    """Counts every call, and times every ``1 / sample_rate``-th call per key."""
+
+    __slots__ = ("period", "stats")
+
+    def __init__(self, sample_rate: float):
+        if not 0 < sample_rate <= 1:
+            raise ValueError(f"sample_rate must be in (0, 1]; got {sample_rate}.")
+        self.period = max(1, round(1 / sample_rate))
+        self.stats: Dict[Any, CallStats] = {}
+
+    def call(self, key: Any, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = CallStats()
+        stats.calls += 1
+
+        if stats.calls % self.period:
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                stats.errors += 1
+                raise
+
+        t_start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - t_start
+            stats.sampled += 1
+            stats.sampled_time += elapsed
+            stats.samples.append(elapsed)
@@ -0,0 +1,206 @@
+"""Cheap checkpoints and rollbacks of registry contents via an undo journal.
+"""
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ._events import ALIAS, CLEAR, OVERWRITE, REGISTER, UNREGISTER, RegistryEvent
+
+_MISSING = object()
+# Journal key of entries that hold a copy of a whole container.
+_SNAPSHOT = object()
+
+# ``(registry, container, key, previous value)``
+Entry = Tuple[Any, Dict[Any, Any], Any, Any]
+
+
+class Journal:
+    """Previous values of every registry mutation since the oldest checkpoint."""
+
+    def __init__(self):
+        self.entries: List[Entry] = []
+        self.checkpoints: List["Checkpoint"] = []
+        # Containers copied since the most recent checkpoint.
+        self._snapshotted: Set[int] = set()
+        self._lock = threading.RLock()
+
+    def record(self, registry, container: Dict[Any, Any], key: Any):
+        self.entries.append((registry, container, key, container.get(key, _MISSING)))
+
+    def record_removal(self, registry, container: Dict[Any, Any]):
+        # Re-inserting removed keys would change iteration order, so copy the
+        # whole container the first time keys are removed from it.
+        if id(container) not in self._snapshotted:
+            self._snapshotted.add(id(container))
+            self.entries.append((registry, container, _SNAPSHOT, dict(container)))
+
+    def rollback(self, position: int):
+        entries = self.entries
+        # ``id(registry) -> (registry, {key: value before rollback}, cleared)``
+        touched: Dict[int, Tuple[Any, Dict[Any, Any], List[bool]]] = {}
+        aliases: Dict[int, Set[Any]] = {}
+        while len(entries) > position:
+            registry, container, key, old = entries.pop()
+            state = touched.get(id(registry))
+            if state is None:
+                state = touched[id(registry)] = (registry, {}, [False])
+            if container is registry:
+                if key is _SNAPSHOT:
+                    state[2][0] = True
+                else:
+                    state[1].setdefault(key, dict.get(registry, key, _MISSING))
+            elif container is registry.alias_table and key is not _SNAPSHOT:
+                aliases.setdefault(id(registry), set()).add(key)
+
+            if key is _SNAPSHOT:
+                dict.clear(container)
+                dict.update(container, old)
+            elif old is _MISSING:
+                dict.pop(container, key, None)
+            else:
+                dict.__setitem__(container, key, old)
+        self._snapshotted.clear()
+
+        for registry, before, cleared in touched.values():
+            registry._changed()
+            events = registry._events
+            if events is None:
+                continue
+            with events:
+                if cleared[0]:
+                    events.emit(RegistryEvent(CLEAR, registry))
+                    before = {k: _MISSING for k in registry}
+                for key, old in before.items():
+                    obj = dict.get(registry, key, _MISSING)
+                    if obj is _MISSING:
+                        if old is not _MISSING:
+                            events.emit(RegistryEvent(UNREGISTER, registry, key, old))
+                    elif old is _MISSING:
+                        events.emit(RegistryEvent(REGISTER, registry, key, obj))
+                    elif obj is not old:
+                        events.emit(RegistryEvent(OVERWRITE, registry, key, obj, old))
+                for key in aliases.get(id(registry), ()):
+                    events.emit(RegistryEvent(ALIAS, registry, key))
+
+
+# Only allocated while a checkpoint is active, so mutations otherwise pay a
+# single ``is None`` check.
+journal: Optional[Journal] = None
+
+
+def record(registry, container: Dict[Any, Any], key: Any):
+    """Journal ``container[key]`` before it is set, if a checkpoint is active."""
+    if journal is not None:
+        journal.record(registry, container, key)
+
+
+def record_removal(registry, container: Dict[Any, Any]):
+    """Journal ``container`` before keys are removed, if a checkpoint is active."""
+    if journal is not None:
+        journal.record_removal(registry, container)
+
+
+class Checkpoint:
+    """State of all registries at the time :func:`checkpoint` was called.
+
+    Used as a context manager, changes made within the block are rolled back
+    on exit, unless :meth:`commit` was called.
+    """
+
+    def __init__(self, journal: Journal, position: int):
+        self._journal: Optional[Journal] = journal
+        self.position = position
+
+    @property
+    def active(self) -> bool:
+        """``False`` once committed, or rolled back past by an outer checkpoint."""
+        return self._journal is not None
+
+    @property
+    def changes(self) -> int:
+        """Number of journaled mutations since this checkpoint."""
+        if self._journal is None:
+            return 0
+        return len(self._journal.entries) - self.position
+
+    def rollback(self):
+        """Undo all registry changes made since this checkpoint.
+
+        Takes time proportional to the number of changes. The checkpoint stays
+        active, so it may be rolled back to again; checkpoints created after
+        it are released.
+
+        Raises
+        ------
+        RuntimeError
+            If this checkpoint is no longer active.
+        """
+        journal = self._journal
+        if journal is None:
+            raise RuntimeError("Checkpoint is no longer active.")
+        with journal._lock:
+            journal.rollback(self.position)
+            index = journal.checkpoints.index(self)
+            for checkpoint in journal.checkpoints[index + 1 :]:
+                checkpoint._journal = None
+            del journal.checkpoints[index + 1 :]
+
+    def commit(self):
+        """Keep all changes made since this checkpoint, and release it.
+
+        Changes remain subject to rollback by outer checkpoints.
+        """
+        global journal
+        current = self._journal
+        if current is None:
+            return
+        with current._lock:
+            current.checkpoints.remove(self)
+            self._journal = None
+            if not current.checkpoints and journal is current:
+                # No checkpoint left to roll back to; stop journaling.
+                journal = None
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.active:
+            self.rollback()
+            self.commit()
+
+    def __repr__(self):
+        state = f"{self.changes} changes" if self.active else "released"
+        return f"<Checkpoint: {state}>"
+
+
+def checkpoint() -> Checkpoint:
+    """Checkpoint the contents of all registries; costs O(1).
+
+    Until the checkpoint is committed or rolled back, every registry mutation
+    journals the previous value, so :meth:`Checkpoint.rollback` only has to
+    undo the changes made since.
+
+    .. code-block:: python
+
+        with autoregistry.checkpoint():
+            class Temporary(Pokemon):
+                pass
+
+        assert "temporary" not in Pokemon
+    """
+    global journal
+    if journal is None:
+        journal = Journal()
+    with journal._lock:
+        journal._snapshotted.clear()
+        cp = Checkpoint(journal, len(journal.entries))
+        journal.checkpoints.append(cp)
+    return cp
+
+
+def rollback(checkpoint: Checkpoint):
+    """Undo all registry changes made since ``checkpoint``.
+
+    See :meth:`Checkpoint.rollback`.
+    """
+    checkpoint.rollback()
@@ -0,0 +1,51 @@
+"""Helpers for running calls on an executor with bounded in-flight work.
+"""
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Tuple
+
+Call = Tuple[Callable, tuple, dict]
+
+DEFAULT_MAX_IN_FLIGHT = 128
+
+
+def ordered_results(
+    calls: Iterable[Call],
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Any]:
+    """Evaluate ``fn(*args, **kwargs)`` for each call, yielding results in order.
+
+    Parameters
+    ----------
+    calls: Iterable
+        Lazily consumed iterable of ``(fn, args, kwargs)`` tuples.
+    executor: Optional[concurrent.futures.Executor]
+        Thread or process pool to evaluate calls on.
+        If ``None``, calls are evaluated serially in the calling thread.
+    max_in_flight: Optional[int]
+        Maximum number of submitted-but-not-yet-yielded calls.
+        Bounds memory regardless of the length of ``calls``.
+    """
+    if executor is None:
+        for fn, args, kwargs in calls:
+            yield fn(*args, **kwargs)
+        return
+
+    if max_in_flight is None:
+        max_in_flight = DEFAULT_MAX_IN_FLIGHT
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be positive; got {max_in_flight}.")
+
+    futures: Deque = deque()
+    try:
+        for fn, args, kwargs in calls:
+            if len(futures) >= max_in_flight:
+                yield futures.popleft().result()
+            futures.append(executor.submit(fn, *args, **kwargs))
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        # Consumer stopped early or a call raised; don't leave work queued.
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,80 @@
+"""Cached keyword-argument binding for constructing registered objects.
+"""
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Tuple
+
+_BINDABLE = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+
+@dataclass(frozen=True)
+class BindingPlan:
+    """Pre-computed summary of a callable's signature.
+
+    Computing a signature via ``inspect.signature`` is expensive;
+    a plan is compiled once per registered callable and reused for every call.
+    """
+
+    # Parameter names that may be supplied as keyword arguments.
+    accepted: FrozenSet[str]
+
+    # Subset of ``accepted`` that has no default value.
+    required: Tuple[str, ...]
+
+    # Whether the callable accepts ``**kwargs``.
+    var_keyword: bool
+
+    @classmethod
+    def compile(cls, target: Callable) -> "BindingPlan":
+        try:
+            signature = inspect.signature(target)
+        except (TypeError, ValueError):
+            # Signature not introspectable (e.g. some builtins); pass everything.
+            return cls(accepted=frozenset(), required=(), var_keyword=True)
+
+        accepted, required, var_keyword = [], [], False
+        for param in signature.parameters.values():
+            if param.kind is inspect.Parameter.VAR_KEYWORD:
+                var_keyword = True
+            elif param.kind in _BINDABLE:
+                accepted.append(param.name)
+                if param.default is inspect.Parameter.empty:
+                    required.append(param.name)
+        return cls(
+            accepted=frozenset(accepted),
+            required=tuple(required),
+            var_keyword=var_keyword,
+        )
+
+    def bind(self, kwargs: Dict[str, Any], strict: bool = True) -> Dict[str, Any]:
+        """Validate and filter keyword arguments.
+
+        Parameters
+        ----------
+        kwargs: dict
+            Keyword arguments intended for the callable.
+        strict: bool
+            If ``True``, raise on unexpected keyword arguments.
+            Otherwise, silently drop them.
+
+        Raises
+        ------
+        TypeError
+            If a required argument is missing, or ``strict`` and an
+            unexpected argument is supplied.
+        """
+        missing = [x for x in self.required if x not in kwargs]
+        if missing:
+            raise TypeError(f"Missing required argument(s): {missing}")
+
+        if self.var_keyword:
+            return kwargs
+
+        accepted = self.accepted
+        if strict:
+            if not accepted.issuperset(kwargs):
+                unexpected = [x for x in kwargs if x not in accepted]
+                raise TypeError(f"Unexpected keyword argument(s): {unexpected}")
+            return kwargs
+
+        return {k: v for k, v in kwargs.items() if k in accepted}
@@ -0,0 +1,103 @@
+"""Subscribable mutation events for registries.
+"""
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+REGISTER = "register"
+OVERWRITE = "overwrite"
+ALIAS = "alias"
+UNREGISTER = "unregister"
+CLEAR = "clear"
+
+
+@dataclass
+class RegistryEvent:
+    """A single mutation of a registry.
+
+    Attributes
+    ----------
+    kind: str
+        One of ``"register"``, ``"overwrite"``, ``"alias"``, ``"unregister"``
+        or ``"clear"``.
+    registry: _Registry
+        The registry that was mutated.
+    key: Optional[str]
+        Affected key; ``None`` for ``"clear"``.
+    obj: Any
+        Newly stored object for ``"register"``, ``"overwrite"`` and ``"alias"``;
+        removed object for ``"unregister"``.
+    old: Any
+        Previously stored object for ``"overwrite"``.
+    """
+
+    kind: str
+    registry: Any
+    key: Optional[str] = None
+    obj: Any = None
+    old: Any = None
+
+
+class EventHub:
+    """Subscribers of a single registry.
+
+    Only allocated once something subscribes, so registries without
+    subscribers pay a single ``is not None`` check per mutation.
+    """
+
+    __slots__ = ("subscribers", "_depth", "_pending")
+
+    def __init__(self):
+        self.subscribers: List[Tuple[Callable, bool]] = []
+        self._depth = 0
+        self._pending: List[RegistryEvent] = []
+
+    def emit(self, event: RegistryEvent):
+        batch_subscribers = False
+        for callback, batch in self.subscribers:
+            if batch:
+                batch_subscribers = True
+            else:
+                callback(event)
+
+        if not batch_subscribers:
+            return
+
+        if self._depth:
+            self._pending.append(event)
+        else:
+            self._flush([event])
+
+    def _flush(self, events: List[RegistryEvent]):
+        for callback, batch in self.subscribers:
+            if batch:
+                callback(events)
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._depth -= 1
+        if not self._depth and self._pending:
+            events, self._pending = self._pending, []
+            self._flush(events)
+
+
+class WeakSubscriber:
+    """Forwards events to a bound method without keeping its object alive.
+
+    Unsubscribes itself from the emitting registry once the object is collected.
+    """
+
+    __slots__ = ("ref",)
+
+    def __init__(self, method: Callable[[RegistryEvent], Any]):
+        self.ref = weakref.WeakMethod(method)
+
+    def __call__(self, event: RegistryEvent):
+        method = self.ref()
+        if method is None:
+            event.registry.unsubscribe(self)
+            return
+        method(event)
@@ -0,0 +1,51 @@
+"""Placeholders for registry entries that are imported on first access.
+"""
+import importlib
+import threading
+from typing import Any
+
+_UNRESOLVED = object()
+
+
+class LazyEntry:
+    """Placeholder for an object referenced as ``"module:qualname"``.
+
+    The module is only imported when the entry is first accessed via
+    ``__getitem__``, ``get`` or ``create``, after which the placeholder is
+    replaced by the imported object. Resolution is thread-safe, and the module is
+    imported at most once; concurrent accesses block until the import finishes.
+    """
+
+    __slots__ = ("target", "_obj", "_lock")
+
+    def __init__(self, target: str):
+        module, sep, qualname = target.partition(":")
+        if not (module and sep and qualname):
+            raise ValueError(
+                f'Lazy target "{target}" must be of the form "module:qualname".'
+            )
+        self.target = target
+        self._obj = _UNRESOLVED
+        self._lock = threading.Lock()
+
+    @property
+    def resolved(self) -> bool:
+        return self._obj is not _UNRESOLVED
+
+    def resolve(self) -> Any:
+        """Import and return the referenced object."""
+        obj = self._obj
+        if obj is not _UNRESOLVED:
+            return obj
+
+        with self._lock:
+            if self._obj is _UNRESOLVED:
+                module, _, qualname = self.target.partition(":")
+                obj = importlib.import_module(module)
+                for attr in qualname.split("."):
+                    obj = getattr(obj, attr)
+                self._obj = obj
+        return self._obj
+
+    def __repr__(self):
+        return f"<LazyEntry: {self.target!r}>"
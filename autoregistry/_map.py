@@ -0,0 +1,109 @@
+"""Mapping registered functions over iterables on thread and process pools.
+"""
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from ._concurrency import Call, ordered_results
+from ._lazy import LazyEntry
+
+# Registries imported by process-pool workers, keyed by reference.
+_WORKER_REGISTRIES: Dict[str, Any] = {}
+
+
+def registry_reference(registry) -> str:
+    """Derive an importable ``"module:qualname"`` reference to ``registry``.
+
+    Raises
+    ------
+    ValueError
+        If ``registry`` isn't reachable as a module-level attribute.
+    """
+    cls = getattr(registry.__registry__, "cls", None)
+    if isinstance(registry, type) and cls is registry:
+        return f"{registry.__module__}:{registry.__qualname__}"
+
+    # Decorator registries: look for a module-level variable in the modules
+    # that registered objects were defined in.
+    modules = dict.fromkeys(
+        getattr(obj, "__module__", None) for obj in registry.__registry__.values()
+    )
+    for module_name in modules:
+        module = sys.modules.get(module_name) if module_name else None
+        if module is None:
+            continue
+        for name, value in vars(module).items():
+            if value is registry:
+                return f"{module_name}:{name}"
+
+    raise ValueError(
+        f"Cannot derive an importable reference to {registry!r}; "
+        'pass ref="module:qualname".'
+    )
+
+
+def _apply(fns: Sequence[Callable], single: bool, chunk: List[Any]) -> List[Any]:
+    if single:
+        fn = fns[0]
+        return [fn(x) for x in chunk]
+    return [tuple(fn(x) for fn in fns) for x in chunk]
+
+
+def _apply_ref(ref: str, keys: Sequence[str], single: bool, chunk: List[Any]):
+    # Runs in a worker process; the registry is imported once per process.
+    registry = _WORKER_REGISTRIES.get(ref)
+    if registry is None:
+        registry = _WORKER_REGISTRIES[ref] = LazyEntry(ref).resolve()
+    return _apply([registry[key] for key in keys], single, chunk)
+
+
+def _chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_(
+    registry,
+    keys,
+    iterable: Iterable[Any],
+    executor: Optional[Executor] = None,
+    chunksize: int = 1,
+    max_in_flight: Optional[int] = None,
+    ref: Optional[str] = None,
+) -> Iterator[Any]:
+    """See :meth:`_DictMixin.map`."""
+    single = isinstance(keys, str)
+    keys = [keys] if single else list(keys)
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be positive; got {chunksize}.")
+
+    # Resolve eagerly so that unknown keys raise before any work is submitted.
+    fns = [registry[key] for key in keys]
+
+    if executor is None:
+        if single:
+            return map(fns[0], iterable)
+        return (tuple(fn(x) for fn in fns) for x in iterable)
+
+    if ref is None and isinstance(executor, ProcessPoolExecutor):
+        ref = registry_reference(registry)
+
+    calls: Iterator[Call]
+    if ref is None:
+        calls = (
+            (_apply, (fns, single, chunk), {}) for chunk in _chunks(iterable, chunksize)
+        )
+    else:
+        # Only ship the reference and keys; workers look up the functions.
+        calls = (
+            (_apply_ref, (ref, keys, single, chunk), {})
+            for chunk in _chunks(iterable, chunksize)
+        )
+
+    results = ordered_results(calls, executor=executor, max_in_flight=max_in_flight)
+    return chain.from_iterable(results)
@@ -0,0 +1,197 @@
+"""Registries layered on top of other registries, like a ``ChainMap``.
+"""
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ._events import CLEAR, RegistryEvent, WeakSubscriber
+from ._lazy import LazyEntry
+from ._registry import (
+    _MISSING,
+    _PATH_INDEX_LIMIT,
+    RegistryDecorator,
+    _compose_mro,
+    _Registry,
+)
+from .config import RegistryConfig
+
+
+class _OverlayRegistry(_Registry):
+    """Storage for :class:`OverlayRegistry`.
+
+    The dict itself only holds local overrides. Keys that fall through to the
+    parents are cached as they are looked up, and evicted as parents change;
+    the parents' entries are never copied as a whole, so many overlays of a
+    large registry stay cheap.
+    """
+
+    def __init__(self, config: RegistryConfig, parents: List[_Registry]):
+        super().__init__(config)
+        self.parents = parents
+        # ``key -> obj`` of looked up keys found in the parents.
+        self._hits: Dict[str, Any] = {}
+        # Number of visible keys; counted on demand.
+        self._count: Optional[int] = None
+        self._subscriber = WeakSubscriber(self._parent_changed)
+        for parent in parents:
+            parent.subscribe(self._subscriber)
+
+    def _fallback(self, key: str) -> Any:
+        hits = self._hits
+        obj = hits.get(key, _MISSING)
+        if obj is not _MISSING:
+            return obj
+        obj = self._resolve_parents(key)
+        if obj is _MISSING:
+            return super()._fallback(key)
+        if len(hits) >= _PATH_INDEX_LIMIT:
+            hits.clear()
+        hits[key] = obj
+        return obj
+
+    def iter_keys(self) -> Iterator[str]:
+        """Yield visible keys, ordered like ``{**parents[-1], ..., **self}``."""
+        seen: Set[str] = set()
+        for layer in [*reversed(self.parents), self]:
+            if layer is not self and isinstance(layer, _OverlayRegistry):
+                keys: Iterator[str] = layer.iter_keys()
+            else:
+                keys = (key for key, _ in _Registry.iter_entries(layer))
+            for key in keys:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def iter_entries(self) -> Iterator[Tuple[str, Any]]:
+        for key in self.iter_keys():
+            yield key, self._resolve(key)
+
+    def count(self) -> int:
+        """Number of visible keys."""
+        if self._count is None:
+            self._count = sum(1 for _ in self.iter_keys())
+        return self._count
+
+    def _changed(self):
+        super()._changed()
+        # Local changes are rare (tenant setup); forget all cached lookups.
+        self._hits.clear()
+        self._count = None
+
+    def _resolve(self, key: str) -> Any:
+        """Visible entry of ``key``; local overrides take priority."""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        return self._resolve_parents(key)
+
+    def _resolve_parents(self, key: str) -> Any:
+        # Doesn't rely on the parents' caches, which may be mid-update.
+        for parent in self.parents:
+            if isinstance(parent, _OverlayRegistry):
+                value = parent._resolve(key)
+                if value is not _MISSING:
+                    return value
+            else:
+                value = parent.get(key, _MISSING)
+                if value is _MISSING:
+                    # Shared aliases.
+                    value = parent._fallback(key)
+                if value is not _MISSING:
+                    return value
+        return _MISSING
+
+    def _resolve_version(self, key: str, strict: bool = False) -> Any:
+        # The first layer with a version satisfying the constraint wins.
+        obj = super()._resolve_version(key, strict)
+        if obj is _MISSING:
+            for parent in self.parents:
+                obj = parent._resolve_version(key, strict)
+                if obj is not _MISSING:
+                    break
+        return obj
+
+    def type_layers(self) -> List[Dict[type, Any]]:
+        """Dispatch tables of this overlay and its parents, in priority order."""
+        layers = [self.types]
+        for parent in self.parents:
+            if isinstance(parent, _OverlayRegistry):
+                layers.extend(parent.type_layers())
+            else:
+                layers.append(parent.types)
+        return layers
+
+    def _resolve_type(self, cls: type) -> Any:
+        # The nearest base class in the MRO wins; ties go to the higher layer.
+        layers = self.type_layers()
+        for base in _compose_mro(cls, {x for types in layers for x in types}):
+            for types in layers:
+                if base in types:
+                    return types[base]
+        return _MISSING
+
+    def _parent_changed(self, event: RegistryEvent):
+        # Invalidate every cache derived from the parents, except cached
+        # lookups, of which only the changed key is evicted below.
+        _Registry._changed(self)
+        self._count = None
+
+        if event.kind != CLEAR and event.key in self:
+            # Shadowed by a local override; nothing visible changed.
+            return
+
+        if event.kind == CLEAR:
+            self._hits.clear()
+        else:
+            self._hits.pop(event.key, None)
+
+        # Propagate to overlays stacked on top of this one.
+        if self._events is not None:
+            self._events.emit(
+                RegistryEvent(event.kind, self, event.key, event.obj, event.old)
+            )
+
+
+class OverlayRegistry(RegistryDecorator, skip=True):
+    """Registry that stacks local overrides on top of one or more parent registries.
+
+    Only overridden entries are stored; all other lookups fall through to the
+    parents, in order; keys found there are cached per overlay as they are
+    looked up. Changes to the parents are reflected immediately.
+
+    .. code-block:: python
+
+        base = Registry(my_plugins)
+        tenant = OverlayRegistry(base)
+
+
+        @tenant(name="parse_csv")
+        def tenant_parse_csv(fn):
+            pass
+    """
+
+    def __init__(self, *parents, **config):
+        storages = [x.__registry__ for x in parents]
+        registry_config = storages[0].config.copy() if storages else RegistryConfig()
+        registry_config.update(config)
+        self.__registry__ = _OverlayRegistry(registry_config, storages)
+
+    def __iter__(self):
+        yield from self.__registry__.iter_keys()
+
+    def __len__(self) -> int:
+        return self.__registry__.count()
+
+    def keys(self):
+        return dict.fromkeys(self.__registry__.iter_keys()).keys()
+
+    def values(self):
+        for _, obj in self.items():
+            yield obj
+
+    def items(self):
+        for key, obj in self.__registry__.iter_entries():
+            if type(obj) is LazyEntry:
+                obj = obj.resolve()
+            yield key, obj
+
+    def __repr__(self):
+        return f"<OverlayRegistry: {list(self.keys())}>"
@@ -0,0 +1,134 @@
+"""Streaming pipelines composed of registered functions.
+"""
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, fields
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from ._concurrency import ordered_results
+from .exceptions import InvalidPipelineError
+
+StageSpec = Union[str, Dict[str, Any]]
+
+
+@dataclass
+class Stage:
+    """A single resolved step of a :class:`Pipeline`."""
+
+    # Registry key, possibly a dotted path.
+    key: str
+
+    fn: Callable
+
+    # If set, ``fn`` receives lists of up to this many records, and returns
+    # an iterable of output records.
+    batch_size: Optional[int] = None
+
+    # Run this stage on a dedicated thread pool with this many threads.
+    workers: Optional[int] = None
+
+    # Run this stage on an existing executor; takes priority over ``workers``.
+    executor: Optional[Executor] = None
+
+    # Maximum number of pending calls when running on a pool.
+    max_in_flight: Optional[int] = None
+
+    def __call__(self, upstream: Iterator[Any], executor: Optional[Executor]):
+        fn = self.fn
+        if self.batch_size is None:
+            if executor is None:
+                return map(fn, upstream)
+            calls = ((fn, (x,), {}) for x in upstream)
+            return ordered_results(calls, executor, self.max_in_flight)
+
+        batches = _batches(upstream, self.batch_size)
+        if executor is None:
+            return chain.from_iterable(map(fn, batches))
+        calls = ((_call_batch, (fn, x), {}) for x in batches)
+        return chain.from_iterable(ordered_results(calls, executor, self.max_in_flight))
+
+
+_OPTIONS = {f.name for f in fields(Stage)} - {"fn"}
+
+
+def _call_batch(fn: Callable, batch: List[Any]) -> List[Any]:
+    # Materialize in the worker, so the work isn't deferred to the consumer.
+    return list(fn(batch))
+
+
+def _batches(iterable: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    while True:
+        batch = list(islice(iterable, size))
+        if not batch:
+            return
+        yield batch
+
+
+class Pipeline:
+    """Chain of registered functions, applied lazily to a stream of records.
+
+    All stage keys are resolved once, when the pipeline is built, so invalid
+    configurations fail before any data flows and no lookups happen per record.
+
+    .. code-block:: python
+
+        pipeline = transforms.pipeline(["parse", "clean.strip", "enrich"])
+        for record in pipeline(source):
+            ...
+    """
+
+    def __init__(self, stages: List[Stage]):
+        self.stages = stages
+
+    @classmethod
+    def build(cls, registry, specs: Iterable[StageSpec]) -> "Pipeline":
+        """Resolve and validate stage specifications against ``registry``.
+
+        Raises
+        ------
+        InvalidPipelineError
+            If any stage key isn't registered, or a stage has invalid options.
+            All problems are reported at once.
+        """
+        stages, problems = [], []
+        for i, spec in enumerate(specs):
+            options = {"key": spec} if isinstance(spec, str) else dict(spec)
+            unknown = set(options) - _OPTIONS
+            if unknown:
+                problems.append(f"stage {i}: unknown options {sorted(unknown)}")
+                continue
+            key = options.get("key")
+            if not isinstance(key, str):
+                problems.append(f"stage {i}: missing key")
+                continue
+            for option in ("batch_size", "workers", "max_in_flight"):
+                value = options.get(option)
+                if value is not None and (not isinstance(value, int) or value < 1):
+                    problems.append(f"stage {i} ({key}): {option} must be positive")
+            fn = registry.get(key)
+            if fn is None:
+                problems.append(f'stage {i}: "{key}" is not registered')
+            elif not callable(fn):
+                problems.append(f'stage {i}: "{key}" is not callable')
+            else:
+                stages.append(Stage(fn=fn, **options))
+
+        if problems:
+            raise InvalidPipelineError("Invalid pipeline: " + "; ".join(problems))
+        return cls(stages)
+
+    def __call__(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Lazily apply all stages to ``records``."""
+        with ExitStack() as stack:
+            stream = iter(records)
+            for stage in self.stages:
+                executor = stage.executor
+                if executor is None and stage.workers is not None:
+                    executor = stack.enter_context(ThreadPoolExecutor(stage.workers))
+                stream = stage(stream, executor)
+            # Keep thread pools alive until the stream is exhausted or closed.
+            yield from stream
+
+    def __repr__(self):
+        return f"<Pipeline: {' -> '.join(x.key for x in self.stages)}>"
@@ -0,0 +1,346 @@
+"""Asynchronous pools of instances of registered classes.
+"""
+import asyncio
+import inspect
+import time
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+PoolKey = Tuple[str, tuple, Tuple[Tuple[str, Any], ...]]
+
+
+@dataclass
+class PoolMetrics:
+    """Usage statistics of the instances for a single pool key."""
+
+    max_size: int
+    # Instances currently alive, and how many of them are checked out.
+    size: int = 0
+    in_use: int = 0
+    created: int = 0
+    evicted: int = 0
+    acquires: int = 0
+    # Acquires that had to wait for an instance to be released.
+    waits: int = 0
+    # Seconds spent in ``acquire``, including construction.
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def idle(self) -> int:
+        return self.size - self.in_use
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the pool's capacity currently checked out."""
+        return self.in_use / self.max_size
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.acquires if self.acquires else 0.0
+
+
+class _Slot:
+    """Instances sharing a single pool key."""
+
+    __slots__ = ("idle", "waiters", "metrics")
+
+    def __init__(self, max_size: int):
+        # ``(obj, released_at)``; most recently released on the right.
+        self.idle: Deque[Tuple[Any, float]] = deque()
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.metrics = PoolMetrics(max_size=max_size)
+
+    @property
+    def empty(self) -> bool:
+        """No instances are alive or awaited, so the slot can be dropped."""
+        return not self.metrics.size and not self.waiters
+
+    def wake(self):
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+
+class _Acquire:
+    """Result of :meth:`RegistryPool.acquire`; await it or use ``async with``."""
+
+    __slots__ = ("pool", "key", "args", "kwargs", "obj")
+
+    def __init__(self, pool: "RegistryPool", key: str, args: tuple, kwargs: dict):
+        self.pool = pool
+        self.key = key
+        self.args = args
+        self.kwargs = kwargs
+        self.obj = None
+
+    def __await__(self):
+        return self.pool._acquire(self.key, self.args, self.kwargs).__await__()
+
+    async def __aenter__(self):
+        self.obj = await self
+        return self.obj
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.pool.release(self.obj)
+
+
+class RegistryPool:
+    """Bounded pools of instances of registered classes.
+
+    Instances are pooled per registry key and constructor arguments, so
+    ``pool.acquire("postgres", dsn=a)`` and ``pool.acquire("postgres", dsn=b)``
+    never share instances. Constructor arguments must be hashable.
+
+    .. code-block:: python
+
+        pool = RegistryPool(Database, max_size=8)
+
+        async with pool.acquire("postgres", dsn=DSN) as db:
+            await db.execute(query)
+
+    Parameters
+    ----------
+    registry
+        ``Registry`` subclass or decorator registry to construct instances from.
+    max_size: int
+        Maximum number of instances per key and constructor arguments.
+        Further acquires wait until an instance is released.
+    max_concurrent_creates: int
+        Maximum number of instances under construction at once, across all keys.
+    idle_timeout: Optional[float]
+        Evict instances that have been idle for this many seconds.
+        ``None`` keeps idle instances forever.
+    create_in_thread: bool
+        Construct instances on the event loop's default executor, so blocking
+        constructors don't stall the event loop. Registered coroutine functions
+        are always awaited on the event loop.
+    dispose: Optional[Callable]
+        Called with each evicted instance, e.g. to close connections.
+        May be a coroutine function.
+    """
+
+    def __init__(
+        self,
+        registry,
+        max_size: int = 8,
+        max_concurrent_creates: int = 4,
+        idle_timeout: Optional[float] = 300.0,
+        create_in_thread: bool = True,
+        dispose: Optional[Callable[[Any], Any]] = None,
+    ):
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive; got {max_size}.")
+        if max_concurrent_creates < 1:
+            raise ValueError(
+                "max_concurrent_creates must be positive; "
+                f"got {max_concurrent_creates}."
+            )
+        self.registry = registry
+        self.max_size = max_size
+        self.max_concurrent_creates = max_concurrent_creates
+        self.idle_timeout = idle_timeout
+        self.create_in_thread = create_in_thread
+        self.dispose = dispose
+        self._slots: Dict[PoolKey, _Slot] = {}
+        # Checked-out instances, by ``id``.
+        self._in_use: Dict[int, Tuple[PoolKey, Any]] = {}
+        # Created on first use, to bind to the running event loop.
+        self._create_semaphore: Optional[asyncio.Semaphore] = None
+        # Releases only evict from their own slot; all slots are swept at most
+        # once per ``idle_timeout``.
+        self._next_sweep = 0.0
+
+    def acquire(self, key: str, /, *args, **kwargs) -> _Acquire:
+        """Check out an instance of ``registry[key](*args, **kwargs)``.
+
+        Reuses an idle instance if available, constructs a new one if the pool
+        isn't full, and otherwise waits for one to be released.
+        """
+        return _Acquire(self, key, args, kwargs)
+
+    def _pool_key(self, key: str, args: tuple, kwargs: dict) -> PoolKey:
+        if not self.registry.__registry__.config.case_sensitive:
+            key = key.lower()
+        return (key, args, tuple(sorted(kwargs.items())))
+
+    async def _acquire(self, key: str, args: tuple, kwargs: dict) -> Any:
+        pool_key = self._pool_key(key, args, kwargs)
+        slot = self._slots.get(pool_key)
+        if slot is None:
+            slot = self._slots[pool_key] = _Slot(self.max_size)
+        metrics = slot.metrics
+
+        t_start = time.monotonic()
+        waited = False
+        while True:
+            if slot.idle:
+                obj, _ = slot.idle.pop()
+                break
+
+            if metrics.size < self.max_size:
+                metrics.size += 1
+                try:
+                    obj = await self._create(key, args, kwargs)
+                except BaseException:
+                    metrics.size -= 1
+                    slot.wake()
+                    self._drop_if_empty(pool_key, slot)
+                    raise
+                metrics.created += 1
+                break
+
+            waited = True
+            waiter = asyncio.get_running_loop().create_future()
+            slot.waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Woken, but cancelled before resuming; pass the wakeup on.
+                    slot.wake()
+                else:
+                    with suppress(ValueError):
+                        slot.waiters.remove(waiter)
+                self._drop_if_empty(pool_key, slot)
+                raise
+            # The slot may have been dropped while this waiter was being woken.
+            slot = self._slots.setdefault(pool_key, slot)
+            metrics = slot.metrics
+
+        elapsed = time.monotonic() - t_start
+        metrics.in_use += 1
+        metrics.acquires += 1
+        metrics.waits += waited
+        metrics.total_wait += elapsed
+        metrics.max_wait = max(metrics.max_wait, elapsed)
+        self._in_use[id(obj)] = (pool_key, obj)
+        return obj
+
+    async def _create(self, key: str, args: tuple, kwargs: dict) -> Any:
+        if self._create_semaphore is None:
+            self._create_semaphore = asyncio.Semaphore(self.max_concurrent_creates)
+
+        async with self._create_semaphore:
+            factory = self.registry[key]
+            if inspect.iscoroutinefunction(factory):
+                return await factory(*args, **kwargs)
+            if self.create_in_thread:
+                loop = asyncio.get_running_loop()
+                call = partial(factory, *args, **kwargs)
+                obj = await loop.run_in_executor(None, call)
+            else:
+                obj = factory(*args, **kwargs)
+            if inspect.isawaitable(obj):
+                obj = await obj
+            return obj
+
+    async def release(self, obj: Any, discard: bool = False):
+        """Return an instance obtained via :meth:`acquire` to the pool.
+
+        Parameters
+        ----------
+        obj
+            Instance to return.
+        discard: bool
+            Dispose of the instance instead of reusing it, e.g. because it is
+            known to be broken.
+        """
+        try:
+            pool_key, _ = self._in_use.pop(id(obj))
+        except KeyError:
+            raise ValueError(f"{obj!r} was not acquired from this pool.") from None
+
+        slot = self._slots[pool_key]
+        slot.metrics.in_use -= 1
+        now = time.monotonic()
+        evicted = [obj] if discard else []
+        if discard:
+            slot.metrics.size -= 1
+            slot.metrics.evicted += 1
+        else:
+            slot.idle.append((obj, now))
+        slot.wake()
+
+        max_idle = self.idle_timeout
+        if max_idle is not None:
+            if now >= self._next_sweep:
+                # Also catches slots that are no longer released to.
+                self._next_sweep = now + max_idle
+                await self._dispose(evicted)
+                await self.evict_idle()
+                return
+            self._evict_slot(slot, now - max_idle, evicted)
+        self._drop_if_empty(pool_key, slot)
+        await self._dispose(evicted)
+
+    async def evict_idle(self, max_idle: Optional[float] = None) -> int:
+        """Dispose of instances idle for longer than ``max_idle`` seconds.
+
+        Defaults to ``idle_timeout``. Releases evict from the released
+        instance's key, and from all keys at most once per ``idle_timeout``.
+        Keys without any instances are dropped, along with their metrics.
+
+        Returns
+        -------
+        int
+            Number of evicted instances.
+        """
+        if max_idle is None:
+            max_idle = self.idle_timeout
+            if max_idle is None:
+                return 0
+
+        deadline = time.monotonic() - max_idle
+        evicted: List[Any] = []
+        for pool_key, slot in list(self._slots.items()):
+            self._evict_slot(slot, deadline, evicted)
+            self._drop_if_empty(pool_key, slot)
+        await self._dispose(evicted)
+        return len(evicted)
+
+    @staticmethod
+    def _evict_slot(slot: _Slot, deadline: float, evicted: List[Any]):
+        idle = slot.idle
+        # Least recently released on the left.
+        while idle and idle[0][1] <= deadline:
+            evicted.append(idle.popleft()[0])
+            slot.metrics.size -= 1
+            slot.metrics.evicted += 1
+
+    def _drop_if_empty(self, pool_key: PoolKey, slot: _Slot):
+        if slot.empty and self._slots.get(pool_key) is slot:
+            del self._slots[pool_key]
+
+    async def close(self):
+        """Dispose of all idle instances.
+
+        Checked-out instances are disposed of as they are released.
+        """
+        self.idle_timeout = 0.0
+        await self.evict_idle()
+
+    async def _dispose(self, objs: List[Any]):
+        if self.dispose is None:
+            return
+        for obj in objs:
+            result = self.dispose(obj)
+            if inspect.isawaitable(result):
+                await result
+
+    def metrics(self) -> Dict[Hashable, PoolMetrics]:
+        """Usage statistics, keyed by ``(key, args, sorted kwargs items)``.
+
+        Only keys with instances alive or awaited are included.
+        """
+        return {k: v.metrics for k, v in self._slots.items()}
+
+    def __repr__(self):
+        in_use = sum(x.metrics.in_use for x in self._slots.values())
+        size = sum(x.metrics.size for x in self._slots.values())
+        return f"<RegistryPool: {in_use}/{size} in use>"
@@ -0,0 +1,122 @@
+"""Background importing of lazily registered entries.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ._lazy import LazyEntry
+
+DEFAULT_MAX_WORKERS = 2
+
+
+def pending_keys(registry, order: Optional[Iterable[str]] = None) -> List[str]:
+    """Keys of unresolved lazy entries; keys in ``order`` first, in that order."""
+    pending = [k for k, v in registry.items() if type(v) is LazyEntry]
+    if order is None:
+        return pending
+    remaining = dict.fromkeys(pending)
+    first = []
+    for key in order:
+        if key in remaining:
+            del remaining[key]
+            first.append(key)
+    return first + list(remaining)
+
+
+class Prewarmer:
+    """Imports lazy entries of a registry on a background thread pool.
+
+    Entries are submitted in priority order. A foreground lookup of an entry that
+    hasn't started importing yet imports it directly instead of waiting in the
+    queue; a lookup of an entry that is mid-import waits only for that import.
+
+    Attributes
+    ----------
+    total: int
+        Number of entries to import.
+    completed: int
+        Number of entries processed so far, including failures and entries
+        that were already imported by a foreground lookup.
+    timings: Dict[str, float]
+        Seconds spent importing each entry imported by the prewarmer.
+    errors: Dict[str, BaseException]
+        Exceptions raised while importing, by key.
+    """
+
+    def __init__(
+        self,
+        registry,
+        keys: List[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        callback: Optional[Callable[[str, Optional[float]], Any]] = None,
+    ):
+        self.registry = registry
+        self.keys = keys
+        self.callback = callback
+        self.total = len(keys)
+        self.completed = 0
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, BaseException] = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self.elapsed: Optional[float] = None
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="autoregistry-prewarm"
+        )
+        # Worker threads exit once the queue is drained.
+        self._futures = [executor.submit(self._load, key) for key in keys]
+        executor.shutdown(wait=False)
+        if not keys:
+            self.elapsed = 0.0
+
+    def _load(self, key: str):
+        entry = self.registry.get(key)
+        elapsed = None
+        if type(entry) is LazyEntry:
+            t_start = time.perf_counter()
+            try:
+                self.registry._materialize(key, entry)
+            except Exception as e:
+                self.errors[key] = e
+            else:
+                elapsed = self.timings[key] = time.perf_counter() - t_start
+
+        with self._lock:
+            self.completed += 1
+            if self.completed == self.total:
+                self.elapsed = time.perf_counter() - self._start
+        if self.callback is not None:
+            self.callback(key, elapsed)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of entries processed, between 0 and 1."""
+        return self.completed / self.total if self.total else 1.0
+
+    def done(self) -> bool:
+        return self.completed == self.total
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until all entries are processed; returns ``False`` on timeout."""
+        _, not_done = wait(self._futures, timeout=timeout)
+        return not not_done
+
+    def cancel(self):
+        """Cancel entries that haven't started importing yet."""
+        with self._lock:
+            for future in self._futures:
+                if future.cancel():
+                    self.total -= 1
+            if self.completed == self.total and self.elapsed is None:
+                self.elapsed = time.perf_counter() - self._start
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.wait()
+
+    def __repr__(self):
+        return f"<Prewarmer: {self.completed}/{self.total}>"
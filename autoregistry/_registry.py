@@ -1,20 +1,93 @@
+import sys
+import threading
+import weakref
 from abc import ABCMeta
 from collections.abc import KeysView, ValuesView
-from functools import partial
+from concurrent.futures import Executor
+from contextlib import nullcontext, suppress
+from functools import (
+    _compose_mro,  # pyright: ignore[reportAttributeAccessIssue]
+    partial,
+)
 from inspect import ismodule
-from pathlib import Path
 from types import MethodType
-from typing import Any, Callable, Generator, Iterable, Type, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
+from . import _checkpoint
+from ._calls import CallRecorder, CallStats
+from ._create import BindingPlan
+from ._events import (
+    ALIAS,
+    CLEAR,
+    OVERWRITE,
+    REGISTER,
+    UNREGISTER,
+    EventHub,
+    RegistryEvent,
+    WeakSubscriber,
+)
+from ._lazy import LazyEntry
+from ._map import map_ as _map
+from ._pipeline import Pipeline, StageSpec
+from ._prewarm import DEFAULT_MAX_WORKERS, Prewarmer, pending_keys
+from ._reload import ModuleRecord, RegistryWatcher, ReloadEvent
+from ._reload import reload as _reload
+from ._setops import ERROR, RegistryDiff
+from ._setops import diff as _diff
+from ._setops import intersection as _intersection
+from ._setops import merge as _merge
+from ._stats import HierarchyStats
+from ._stats import stats as _stats
+from ._stream import Records
+from ._stream import stream as _stream
+from ._traverse import Traversal, module_members
+from ._versions import Version, VersionIndex, parse_constraint
+from ._views import RegistryView
 from .config import RegistryConfig
 from .exceptions import (
     CannotDeriveNameError,
     CannotRegisterPythonBuiltInError,
     InternalError,
     InvalidNameError,
+    InvalidVersionError,
     KeyCollisionError,
     ModuleAliasError,
 )
+from .regex import key_split
+
+_MISSING = object()
+_NO_ALIAS = (None, _MISSING)
+
+# Bounds memory if lookups use many spellings of the same keys.
+_PATH_INDEX_LIMIT = 65536
+
+
+def _load_entry(owner: Optional["_Registry"], key: str, entry: LazyEntry) -> Any:
+    """Import ``entry``, replacing its placeholder if stored in registry ``owner``."""
+    if owner is None:
+        return entry.resolve()
+    return owner._materialize(key, entry)
+
+
+class AliasTable(Dict[str, Tuple[str, Any]]):
+    """Maps alias -> (canonical name, obj); shared by a whole class hierarchy."""
+
+    # Bumped whenever any registry sharing the table changes, which may change
+    # the aliases visible in each of them.
+    version = 0
 
 
 class _Registry(dict):
@@ -28,12 +101,461 @@ class _Registry(dict):
         # These will be populated later
         self.cls: Any = None
 
+        # Modules traversed into this registry, keyed by module name.
+        self.sources: Dict[str, ModuleRecord] = {}
+
+        # Type-based dispatch table and its per-concrete-type resolution cache.
+        self.types: Dict[type, Any] = {}
+        self._dispatch_cache: Dict[type, Any] = {}
+
+        # Allocated on first subscription.
+        self._events: Optional[EventHub] = None
+
+        # Incremented on every mutation; lets views detect stale caches.
+        self._version = 0
+
+        # Signature binding plans for ``create``, keyed by registered object.
+        self._plans: Dict[Any, BindingPlan] = {}
+
+        # Full dotted path -> terminal object, for lookups into nested registries.
+        # Allocated on the first nested lookup.
+        self._paths: Optional[Dict[str, Any]] = None
+        self._path_deps: Dict[int, Any] = {}
+
+        # Recently missed normalized keys, oldest first.
+        # Only used when configured with ``negative_cache > 0``.
+        self._misses: Optional[Dict[str, None]] = (
+            {} if config.negative_cache > 0 else None
+        )
+
+        # Resolved callables for ``call``, keyed by the raw key passed in.
+        self._calls: Dict[Any, Any] = {}
+
+        # Only used when configured with ``call_sample_rate > 0``.
+        self._recorder: Optional[CallRecorder] = (
+            CallRecorder(config.call_sample_rate) if config.call_sample_rate else None
+        )
+
+        # Most recent registration of a module into this registry.
+        self.traversal: Optional[Traversal] = None
+
+        # Sorted versions of keys registered with ``version``, and resolved
+        # ``name@constraint`` lookups. Allocated on the first versioned registration.
+        self.versions: Optional[Dict[str, VersionIndex]] = None
+        self._resolved_versions: Optional[Dict[str, Any]] = None
+
+        # Set when a ``LazyEntry`` placeholder is stored; cleared by ``load``.
+        self._lazy = False
+
+        # Registry methods bound to ``cls``, per redirecting ``MethodDescriptor``.
+        # Kept here rather than on the shared descriptor, so they don't keep
+        # ``cls`` alive. Allocated on first use.
+        self._bound: Optional[Dict["MethodDescriptor", MethodType]] = None
+
+        # Maps alias -> (canonical name, obj). Shared by a whole class hierarchy.
+        # Only used when configured with ``shared_aliases=True``.
+        self.alias_table: Optional[AliasTable] = (
+            AliasTable() if config.shared_aliases else None
+        )
+        # ``(alias_table.version, [(alias, obj), ...])`` of visible aliases.
+        self._aliases: Optional[Tuple[int, List[Tuple[str, Any]]]] = None
+
+    def __missing__(self, key: str) -> Any:
+        # Only invoked by ``self[key]`` on a miss, so hits pay nothing extra.
+        obj = self._fallback(key)
+        if obj is _MISSING:
+            raise KeyError(key)
+        return obj
+
+    def _fallback(self, key: str) -> Any:
+        """Resolve a key not stored directly in this registry, or ``_MISSING``."""
+        if self.alias_table is not None:
+            name, obj = self.alias_table.get(key, _NO_ALIAS)
+            if obj is not _MISSING and self.get(name, _MISSING) is obj:
+                return obj
+        return _MISSING
+
+    def iter_aliases(self) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(alias, obj)`` for aliases in the shared alias table visible here.
+
+        An alias is visible in every registry its canonical name is registered to.
+        """
+        return iter(self.visible_aliases())
+
+    def visible_aliases(self) -> List[Tuple[str, Any]]:
+        """List of ``(alias, obj)`` visible here; cached until the hierarchy changes."""
+        table = self.alias_table
+        if table is None:
+            return []
+        cached = self._aliases
+        if cached is not None and cached[0] == table.version:
+            return cached[1]
+        aliases = [
+            (alias, obj)
+            for alias, (name, obj) in table.items()
+            if self.get(name, _MISSING) is obj
+        ]
+        self._aliases = (table.version, aliases)
+        return aliases
+
+    def _drop_aliases(self, targets: Dict[str, Any]):
+        """Remove shared aliases of the removed ``{name: obj}`` entries."""
+        table = self.alias_table
+        if table is None:
+            return
+        stale = [
+            alias
+            for alias, (name, obj) in table.items()
+            if targets.get(name, _MISSING) is obj
+        ]
+        if not stale:
+            return
+        _checkpoint.record_removal(self, table)
+        for alias in stale:
+            obj = table.pop(alias)[1]
+            if self._events is not None:
+                self._events.emit(RegistryEvent(UNREGISTER, self, alias, obj))
+
+    @staticmethod
+    def peek_nested(obj: Any) -> Union["_Registry", None, bool]:
+        """Registry of ``obj`` if it is a registry, without allocating it.
+
+        Returns ``None`` for classes whose registry isn't allocated yet, and
+        ``False`` if ``obj`` isn't a registry.
+        """
+        if isinstance(obj, RegistryMeta):
+            registry = vars(obj).get("__registry__")
+            return registry if isinstance(registry, _Registry) else None
+        if isinstance(obj, RegistryDecorator):
+            return obj.__registry__
+        return False
+
+    def iter_descriptors(self) -> Iterator["MethodDescriptor"]:
+        """Yield the redirecting method descriptors defined on ``cls``."""
+        if self.cls is None:
+            return
+        for value in vars(self.cls).values():
+            if isinstance(value, MethodDescriptor):
+                yield value
+
+    def _changed(self):
+        """Invalidate caches derived from this registry's contents."""
+        self._version += 1
+        self._dispatch_cache.clear()
+        self._plans.clear()
+        self._calls.clear()
+        self._paths = None
+        if self._misses:
+            self._misses.clear()
+        if self.alias_table is not None:
+            self.alias_table.version += 1
+        if self._resolved_versions:
+            self._resolved_versions.clear()
+
+    def resolve(self, key: str, default: Any = _MISSING, load: bool = True) -> Any:
+        """Look up ``key``, which may be a dotted path into nested registries.
+
+        Unlike ``getitem``, returns ``default`` (an internal sentinel unless given)
+        instead of raising on a miss, so that ``in`` and ``get`` don't pay for
+        exception handling.
+        If ``load`` is ``False``, a ``LazyEntry`` stored at ``key`` is returned
+        as-is instead of being imported.
+        """
+        if not self.config.case_sensitive:
+            key = key.lower()
+
+        misses = self._misses
+        if misses is not None and key in misses:
+            return default
+
+        if "@" in key:
+            obj = self._resolve_version(key)
+            if obj is _MISSING and ("." in key or "/" in key):
+                # Keys of registries without versions may contain "@".
+                obj = self._resolve_path(key, load)
+        elif "." in key or "/" in key:
+            obj = self._resolve_path(key, load)
+        else:
+            obj = self.get(key, _MISSING)
+            if obj is _MISSING:
+                obj = self._fallback(key)
+
+        if obj is _MISSING:
+            if misses is not None:
+                # Evict the oldest misses. Threads missing concurrently may race
+                # to evict the same key, or resize the dict mid-iteration, so
+                # loop until there's room.
+                while misses and len(misses) >= self.config.negative_cache:
+                    with suppress(RuntimeError):
+                        misses.pop(next(iter(misses), None), None)
+                misses[key] = None
+            return default
+        if load and type(obj) is LazyEntry:
+            return self._materialize(key, obj)
+        return obj
+
+    def _resolve_version(self, key: str, strict: bool = False) -> Any:
+        """Resolve ``name@constraint`` to the highest matching version of ``name``.
+
+        An invalid constraint is a miss, unless ``strict``.
+        In registries without versions, ``key`` is looked up as-is.
+        """
+        path, _, spec = key.partition("@")
+        if "." in path or "/" in path:
+            # Resolved and cached by the nested registry, so its own mutations
+            # invalidate the result.
+            head, _, name = path.replace("/", ".").rpartition(".")
+            parent = self._resolve_path(head)
+            registry = parent if parent is self else getattr(parent, "__registry__", 0)
+            if not isinstance(registry, _Registry):
+                return _MISSING
+            return registry._resolve_version(f"{name}@{spec}", strict)
+
+        if not self.versions:
+            # Nothing registered with a version, so "@" is part of the key.
+            obj = self.get(key, _MISSING)
+            return self._fallback(key) if obj is _MISSING else obj
+        cache = self._resolved_versions
+        obj = cache.get(key, _MISSING)  # pyright: ignore[reportOptionalMemberAccess]
+        if obj is not _MISSING:
+            return obj
+        index = self.versions.get(path)
+        if index is None:
+            return _MISSING
+        try:
+            constraint = parse_constraint(spec)
+        except InvalidVersionError:
+            if strict:
+                raise
+            return _MISSING
+        obj = index.resolve(constraint, _MISSING)
+        if obj is not _MISSING:
+            if len(cache) >= _PATH_INDEX_LIMIT:
+                cache.clear()
+            cache[key] = obj
+        return obj
+
+    def iter_entries(self) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(key, obj)`` for all entries, including visible shared aliases."""
+        yield from self.items()
+        yield from self.iter_aliases()
+
+    def getitem(self, key: str) -> Any:
+        """Look up ``key``, which may be a dotted path into nested registries.
+
+        Raises
+        ------
+        KeyError
+            If ``key`` is not registered.
+        """
+        obj = self.resolve(key)
+        if obj is _MISSING:
+            if "@" in key:
+                # Invalid constraints are misses for ``in`` and ``get``, but
+                # errors here.
+                if not self.config.case_sensitive:
+                    key = key.lower()
+                self._resolve_version(key, strict=True)
+            raise KeyError(key)
+        return obj
+
+    def _resolve_path(self, key: str, load: bool = True) -> Any:
+        # Resolved paths are memoized in a flattened index, so repeated deep
+        # lookups cost a single hash probe regardless of depth. The index is
+        # invalidated whenever this registry, or any nested registry along an
+        # indexed path, is modified; paths through other mappings, whose
+        # changes aren't observable, are never indexed.
+        paths = self._paths
+        if paths is not None:
+            obj = paths.get(key, _MISSING)
+            if obj is not _MISSING:
+                return obj
+        else:
+            paths = self._paths = {}
+
+        obj = self
+        # Registry holding ``obj`` and its key there; ``None`` for plain mappings.
+        owner: Optional[_Registry] = None
+        owner_key = ""
+        indexable = True
+        for segment in key_split(key):
+            if type(obj) is LazyEntry:
+                # Traversing into a lazy entry requires importing it.
+                obj = _load_entry(owner, owner_key, obj)
+            registry = obj if obj is self else getattr(obj, "__registry__", None)
+            if registry is None:
+                try:
+                    obj = obj[segment]
+                except KeyError:
+                    return _MISSING
+                owner = None
+                indexable = False
+                continue
+
+            if registry is not self:
+                self._watch_path(registry)
+                if not registry.config.case_sensitive:
+                    # Normalized by each nested registry's own config.
+                    segment = segment.lower()
+            obj = registry.get(segment, _MISSING)
+            if obj is _MISSING:
+                obj = registry._fallback(segment)
+                if obj is _MISSING:
+                    return _MISSING
+            owner, owner_key = registry, segment
+
+        if type(obj) is LazyEntry:
+            if not load:
+                # Not indexed, so a later lookup still imports it.
+                return obj
+            obj = _load_entry(owner, owner_key, obj)
+
+        if indexable:
+            if len(paths) >= _PATH_INDEX_LIMIT:
+                paths.clear()
+            paths[key] = obj
+        return obj
+
+    def cacheable(self, key: Any) -> bool:
+        """Whether the lookup of ``key`` stays valid until this registry changes.
+
+        Dotted paths only do if they were indexed, i.e. only pass through
+        watched registries.
+        """
+        if not isinstance(key, str):
+            return True
+        key = key.split("://")[0]
+        if "." not in key and "/" not in key:
+            return True
+        if "@" in key:
+            # Resolved by the nested registry, which isn't watched.
+            return False
+        if not self.config.case_sensitive:
+            key = key.lower()
+        return self._paths is not None and key in self._paths
+
+    def _watch_path(self, registry: "_Registry"):
+        """Invalidate path-derived caches when nested ``registry`` changes."""
+        ref = self._path_deps.get(id(registry))
+        if ref is not None and ref() is registry:
+            return
+        self._path_deps[id(registry)] = weakref.ref(registry)
+        registry.subscribe(WeakSubscriber(self._nested_changed))
+
+    def _nested_changed(self, event: RegistryEvent):
+        self._paths = None
+        self._calls.clear()
+        if self._misses:
+            self._misses.clear()
+
+    def _materialize(self, key: str, entry: LazyEntry) -> Any:
+        """Import ``entry`` and replace the placeholder wherever it is stored.
+
+        A lazily registered class entry is stored in the registries of all its
+        parents; these are updated together so shared aliases stay consistent.
+        """
+        obj = entry.resolve()
+        registries = [self]
+        if self.cls is not None:
+            registries += [
+                x.__registry__
+                for x in self.cls.__mro__
+                if isinstance(vars(x).get("__registry__"), _Registry)
+            ]
+        for registry in registries:
+            if registry.get(key) is entry:
+                # Not a mutation, so caches and subscribers are left untouched,
+                # except for derived counts, e.g. of filtered views.
+                dict.__setitem__(registry, key, obj)
+                registry._version += 1
+        table = self.alias_table
+        if table is not None:
+            for alias, (name, value) in list(table.items()):
+                if value is entry:
+                    table[alias] = (name, obj)
+            table.version += 1
+        return obj
+
+    def load(self) -> Dict[str, Any]:
+        """Import all ``LazyEntry`` placeholders in this registry.
+
+        Returns
+        -------
+        dict
+            Mapping of keys to newly imported objects.
+        """
+        loaded = {}
+        if not self._lazy:
+            return loaded
+        for key, obj in list(self.items()):
+            if type(obj) is LazyEntry:
+                loaded[key] = self._materialize(key, obj)
+        self._lazy = False
+        return loaded
+
+    def _store(self, key: str, obj: Any, kind: str = REGISTER):
+        """Write ``obj`` to ``key``, then notify subscribers."""
+        events = self._events
+        if events is None:
+            self[key] = obj
+            return
+        old = self.get(key, _MISSING)
+        self[key] = obj
+        if old is not _MISSING and kind == REGISTER:
+            events.emit(RegistryEvent(OVERWRITE, self, key, obj, old))
+        else:
+            events.emit(RegistryEvent(kind, self, key, obj))
+
+    def subscribe(self, callback: Callable, batch: bool = False) -> Callable:
+        """Invoke ``callback`` whenever this registry is mutated.
+
+        Registrations propagate up the class hierarchy, so subscribing to a parent
+        registry also reports classes registered via its descendants.
+
+        Parameters
+        ----------
+        callback: Callable
+            Invoked with a :class:`RegistryEvent`.
+        batch: bool
+            If ``True``, ``callback`` is instead invoked with a list of events.
+            Events emitted within a :meth:`batch` block, such as when traversing a
+            module, are coalesced into a single list.
+
+        Returns
+        -------
+        Callable
+            ``callback``, so this method may be used as a decorator.
+        """
+        if self._events is None:
+            self._events = EventHub()
+        self._events.subscribers.append((callback, batch))
+        return callback
+
+    def unsubscribe(self, callback: Callable):
+        """Remove a callback previously added via :meth:`subscribe`."""
+        if self._events is None:
+            raise ValueError(f"{callback} is not subscribed.")
+        subscribers = [x for x in self._events.subscribers if x[0] != callback]
+        if len(subscribers) == len(self._events.subscribers):
+            raise ValueError(f"{callback} is not subscribed.")
+        self._events.subscribers = subscribers
+        if not subscribers:
+            self._events = None
+
+    def batch(self):
+        """Context manager that coalesces events for batch subscribers."""
+        if self._events is None:
+            return nullcontext()
+        return self._events
+
     def register(
         self,
         obj: Any,
         name: str = "",
         aliases: Union[str, None, Iterable[str]] = None,
         root: bool = False,
+        types: Union[type, None, Iterable[type]] = None,
+        version: Union[str, Version, None] = None,
     ):
         """Register an object to a registry, subject to configuration.
 
@@ -50,6 +572,14 @@ class _Registry(dict):
         root: bool
             Set to ``True`` when calling initial ``__register__``.
             Force register to immediate parent(s).
+        types: Union[type, None, Iterable[type]]
+            If provided, also register ``obj`` as the handler for these types.
+            See :meth:`dispatch`.
+        version: Union[str, Version, None]
+            If provided, register ``obj`` as this version of ``name``, e.g.
+            ``"2.3.1"``. Several versions may share a name; ``name`` itself
+            resolves to the highest release, and ``name@constraint`` to the
+            highest version satisfying ``constraint``.
         """
         # Derive/Validate Name
         if not name:
@@ -63,8 +593,41 @@ class _Registry(dict):
         elif "." in name or "/" in name:
             raise InvalidNameError(f'Name "{name}" cannot contain "." or "/".')
 
-        if not self.config.overwrite and name in self:
-            raise KeyCollisionError(f'"{name}" already registered to {self}')
+        # "@" separates constraints from names, once versions are used.
+        versioned = version is not None or bool(self.versions)
+        if versioned and "@" in name:
+            raise InvalidNameError(
+                f'Name "{name}" cannot contain "@" in a registry with versions.'
+            )
+        if version is not None and not self.versions:
+            # The first version turns "@" in existing keys into constraints.
+            taken = next((x for x, _ in self.iter_entries() if "@" in x), None)
+            if taken is not None:
+                raise InvalidNameError(
+                    f'Cannot register versions to a registry with key "{taken}".'
+                )
+
+        table = self.alias_table
+
+        index = None
+        if version is not None:
+            if not isinstance(version, Version):
+                version = Version(version)
+            index = self.versions.get(name) if self.versions else None
+
+        if not self.config.overwrite and (
+            name in self or (table is not None and name in table)
+        ):
+            if index is not None:
+                # New versions may be added to an already versioned name.
+                if index.get(version, _MISSING) is not _MISSING:
+                    raise KeyCollisionError(
+                        f'"{name}@{version}" already registered to {self}'
+                    )
+            # A class declared via ``register_lazy`` replaces its placeholder
+            # once its module is imported.
+            elif type(self.get(name)) is not LazyEntry or type(obj) is LazyEntry:
+                raise KeyCollisionError(f'"{name}" already registered to {self}')
 
         # Validate aliases and massage it into a list.
         if aliases is None:
@@ -72,44 +635,230 @@ class _Registry(dict):
         elif isinstance(aliases, str):
             aliases = [aliases]
 
+        if self.config.compact:
+            # Share a single string object for each key across all registries.
+            name = sys.intern(name)
+            aliases = [sys.intern(x) for x in aliases]
+
         for alias in aliases:
             if "." in alias or "/" in alias:
                 raise InvalidNameError(f'Alias "{alias}" cannot contain "." or "/".')
-            if not self.config.overwrite and alias in self:
-                raise KeyCollisionError(f'"{alias}" already registered to {self}')
+            if versioned and "@" in alias:
+                raise InvalidNameError(
+                    f'Alias "{alias}" cannot contain "@" in a registry with versions.'
+                )
+            if not self.config.overwrite:
+                if alias in self:
+                    raise KeyCollisionError(f'"{alias}" already registered to {self}')
+                if table is not None:
+                    entry = table.get(alias)
+                    if entry is not None and entry[1] is not obj:
+                        raise KeyCollisionError(
+                            f'"{alias}" already registered to {entry[1]}'
+                        )
+
+        if types is None:
+            types = ()
+        elif isinstance(types, type):
+            types = (types,)
+        else:
+            types = tuple(types)
+
+        if not self.config.overwrite:
+            for type_ in types:
+                if type_ in self.types:
+                    raise KeyCollisionError(
+                        f"{type_} already registered to {self.types[type_]}"
+                    )
 
         # Check if should register self
-        if obj == self.cls:
-            if self.config.register_self:
-                self[name] = obj
-        else:
-            self[name] = obj
+        stored = obj != self.cls or self.config.register_self
+        if stored:
+            if type(obj) is LazyEntry:
+                self._lazy = True
+            if _checkpoint.journal is not None:
+                for type_ in types:
+                    _checkpoint.record(self, self.types, type_)
+                _checkpoint.record(self, self, name)
+            for type_ in types:
+                self.types[type_] = obj
+            value = obj
+            if version is not None:
+                # ``name`` itself resolves to the highest version.
+                value = self._store_version(name, version, obj, index)
+            elif self.versions and name in self.versions:
+                # Overwritten by an unversioned object.
+                _checkpoint.record_removal(self, self.versions)
+                del self.versions[name]
+            if self._events is None:
+                self[name] = value
+            else:
+                self._store(name, value)
 
         # Register to parents if one of the following conditions are met:
         #     1. This is the root ``__recursive__`` call.
         #     2. Both this.recursive is True, and parent.recursive is True.
         if (root or self.config.recursive) and self.cls is not None:
-            for parent_cls in self.cls.__bases__:
-                try:
-                    parent_registry = parent_cls.__registry__
-                except AttributeError:
-                    # Not a Registry object
-                    continue
-
-                if parent_cls is Registry:
-                    # Never register to the base Registry class.
-                    # Unwanted cross-library interactions may occur, otherwise.
-                    continue
-
-                if root or parent_registry.config.recursive:
-                    parent_registry.register(obj, name=name, aliases=aliases)
+            _register_to_bases(self.cls, obj, name, aliases, types, root, version)
 
         # Register aliases
+        if table is not None:
+            # Stored once for the whole hierarchy; resolved via ``__missing__``.
+            for alias in aliases:
+                if alias not in table or self.config.overwrite:
+                    _checkpoint.record(self, table, alias)
+                    table[alias] = (name, obj)
+                if stored and self._events is not None:
+                    self._events.emit(RegistryEvent(ALIAS, self, alias, obj))
+            aliases = ()
+
         for alias in aliases:
             if not self.config.overwrite and alias in self:
                 raise KeyCollisionError(f'"{alias}" already registered to {self}')
 
-            self[alias] = obj
+            _checkpoint.record(self, self, alias)
+            if self._events is None:
+                self[alias] = obj
+            else:
+                self._store(alias, obj, ALIAS)
+
+        self._changed()
+
+    def _store_version(
+        self, name: str, version: Version, obj: Any, index: Optional[VersionIndex]
+    ) -> Any:
+        """Add ``obj`` to the version index of ``name``; return its highest version."""
+        if self.versions is None:
+            self.versions = {}
+            self._resolved_versions = {}
+        index = (index or VersionIndex()).insert(version, obj)
+        _checkpoint.record(self, self.versions, name)
+        # Indexes are replaced rather than mutated, so checkpoints can restore them.
+        self.versions[name] = index
+        return index.latest()
+
+    def update_entries(self, entries: Dict[str, Any]):
+        """Write already-validated ``entries`` in a single bulk update.
+
+        Unlike :meth:`register`, names are not validated or propagated to parents.
+        """
+        if not entries:
+            return
+        if _checkpoint.journal is not None:
+            for key in entries:
+                _checkpoint.record(self, self, key)
+        if self._events is None:
+            self.update(entries)
+        else:
+            with self._events:
+                for key, obj in entries.items():
+                    self._store(key, obj)
+        if not self._lazy:
+            # E.g. placeholders copied by ``merge``; imported by ``load``.
+            self._lazy = any(type(x) is LazyEntry for x in entries.values())
+        self._changed()
+
+    def unregister(self, name: str) -> Any:
+        """Remove ``name`` from this registry.
+
+        Parameters
+        ----------
+        name: str
+            Registry key to remove.
+
+        Returns
+        -------
+        object
+            The object that was registered to ``name``.
+        """
+        if (
+            self.alias_table is not None
+            and name not in self
+            and name in self.alias_table
+        ):
+            obj = self[name]  # Raises KeyError if not visible in this registry.
+            _checkpoint.record_removal(self, self.alias_table)
+            del self.alias_table[name]
+            if self._events is not None:
+                self._events.emit(RegistryEvent(UNREGISTER, self, name, obj))
+            self._changed()
+            return obj
+
+        if name in self:
+            _checkpoint.record_removal(self, self)
+        obj = self.pop(name)
+        if self._events is not None:
+            self._events.emit(RegistryEvent(UNREGISTER, self, name, obj))
+        if self.alias_table:
+            # Otherwise they would keep reserving their alias, invisibly.
+            self._drop_aliases({name: obj})
+        if obj not in self.values():
+            # Drop type handlers that are no longer reachable by any key.
+            for type_ in [t for t, o in self.types.items() if o is obj]:
+                _checkpoint.record_removal(self, self.types)
+                del self.types[type_]
+        if self.versions and name in self.versions:
+            _checkpoint.record_removal(self, self.versions)
+            del self.versions[name]
+        self._changed()
+        return obj
+
+    def clear(self):
+        if self.alias_table:
+            self._drop_aliases(dict(self))
+        _checkpoint.record_removal(self, self)
+        _checkpoint.record_removal(self, self.types)
+        super().clear()
+        self.types.clear()
+        if self.versions:
+            _checkpoint.record_removal(self, self.versions)
+            self.versions.clear()
+        if self._events is not None:
+            self._events.emit(RegistryEvent(CLEAR, self))
+        self._changed()
+
+    def plan(self, obj: Callable) -> BindingPlan:
+        """Get the cached :class:`BindingPlan` for a registered callable."""
+        try:
+            return self._plans[obj]
+        except KeyError:
+            plan = self._plans[obj] = BindingPlan.compile(obj)
+            return plan
+        except TypeError:
+            # Unhashable callable; cannot be cached.
+            return BindingPlan.compile(obj)
+
+    def dispatch(self, cls: type) -> Any:
+        """Get the handler registered for ``cls``, or its nearest base class.
+
+        Similar to ``functools.singledispatch``, the method resolution order of
+        ``cls`` is walked and the first registered type wins. Results are cached
+        per concrete type until the registry is modified.
+
+        Raises
+        ------
+        KeyError
+            If no handler is registered for ``cls`` or any of its bases.
+        """
+        obj = self._dispatch(cls)
+        if obj is _MISSING:
+            raise KeyError(cls)
+        return obj
+
+    def _dispatch(self, cls: type) -> Any:
+        obj = self._dispatch_cache.get(cls, _MISSING)
+        if obj is _MISSING:
+            obj = self._dispatch_cache[cls] = self._resolve_type(cls)
+        return obj
+
+    def _resolve_type(self, cls: type) -> Any:
+        types = self.types
+        # Registered ABCs, e.g. ``collections.abc.Mapping``, are merged into the
+        # MRO like ``functools.singledispatch`` does, so they win over ``object``.
+        for base in _compose_mro(cls, types):
+            if base in types:
+                return types[base]
+        return _MISSING
 
 
 class _DictMixin:
@@ -118,38 +867,65 @@ class _DictMixin:
     __registry__: _Registry
 
     def __getitem__(self, key: str) -> Type:
+        if isinstance(key, type):
+            return self.__registry__.dispatch(key)
+
         # If passed a URI, use the URI's scheme as the regsitry key str
         # E.g. convert "snowflake://abcd1234" into "snowflake"
         key = key.split("://")[0]
-        return self.__registry__.config.getitem(self.__registry__, key)
+        return self.__registry__.getitem(key)
 
     def __iter__(self) -> Generator[str, None, None]:
         yield from self.__registry__
+        for alias, _ in self.__registry__.iter_aliases():
+            yield alias
 
     def __len__(self) -> int:
-        return len(self.__registry__)
+        registry = self.__registry__
+        if registry.alias_table is None:
+            return len(registry)
+        return len(registry) + len(registry.visible_aliases())
 
     def __contains__(self, key: str) -> bool:
-        try:
-            self.__registry__.config.getitem(self.__registry__, key)
-        except KeyError:
-            return False
-        return True
+        if isinstance(key, type):
+            return self.__registry__._dispatch(key) is not _MISSING
+        return self.__registry__.resolve(key, load=False) is not _MISSING
 
     def keys(self) -> KeysView:
-        return self.__registry__.keys()
+        registry = self.__registry__
+        if registry.alias_table is None:
+            return registry.keys()
+        return dict(registry.iter_entries()).keys()
 
     def values(self) -> ValuesView:
-        return self.__registry__.values()
+        registry = self.__registry__
+        registry.load()
+        if registry.alias_table is None:
+            return registry.values()
+        return dict(self.items()).values()
 
     def items(self):
-        yield from self.__registry__.items()
+        registry = self.__registry__
+        registry.load()
+        yield from registry.iter_entries()
 
-    def get(self, key: Union[str, Type], default=None) -> Type:
-        try:
-            return self[key]
-        except KeyError:
-            pass
+    def get(
+        self, key: Union[str, Type], default=None, version: Optional[str] = None
+    ) -> Type:
+        """Look up ``key``, returning ``default`` if not registered.
+
+        With ``version``, a constraint like ``">=2.1"``, look up the highest
+        version of ``key`` satisfying it; same as ``get(f"{key}@{version}")``.
+        """
+        if isinstance(key, type):
+            obj = self.__registry__._dispatch(key)
+        else:
+            key = key.split("://")[0]
+            if version is not None:
+                key = f"{key}@{version}"
+            obj = self.__registry__.resolve(key)
+        if obj is not _MISSING:
+            return obj
         if isinstance(default, str):
             return self[default]
         else:
@@ -158,6 +934,338 @@ class _DictMixin:
     def clear(self):
         self.__registry__.clear()
 
+    def create(self, key: str, /, **kwargs) -> Any:
+        """Look up ``key`` and call it with the keyword arguments it accepts.
+
+        The callable's signature is inspected once and cached.
+        Required arguments are validated before calling.
+        Unexpected keyword arguments raise a ``TypeError``, unless the registry
+        is configured with ``filter_kwargs=True``, in which case they are dropped.
+        This makes config-driven construction straightforward:
+
+        .. code-block:: python
+
+            model = Model.create(cfg["type"], **cfg)
+        """
+        obj = self[key]
+        registry = self.__registry__
+        strict = not registry.config.filter_kwargs
+        return obj(**registry.plan(obj).bind(kwargs, strict=strict))
+
+    def call(self, key: Union[str, Type], /, *args, **kwargs) -> Any:
+        """Call the object registered at ``key`` with the given arguments.
+
+        Equivalent to ``registry[key](*args, **kwargs)``, but the resolved
+        callable is cached per ``key``, so dispatch-table style usage skips
+        URI splitting and key normalization on every call.
+
+        If the registry is configured with ``call_sample_rate``, per-key
+        statistics are recorded; see :meth:`call_stats`.
+        """
+        registry = self.__registry__
+        fn = registry._calls.get(key, _MISSING)
+        if fn is _MISSING:
+            fn = self[key]
+            if registry.cacheable(key):
+                if len(registry._calls) >= _PATH_INDEX_LIMIT:
+                    registry._calls.clear()
+                registry._calls[key] = fn
+
+        recorder = registry._recorder
+        if recorder is None:
+            return fn(*args, **kwargs)
+        return recorder.call(key, fn, args, kwargs)
+
+    def call_stats(self) -> Dict[Any, CallStats]:
+        """Per-key statistics of :meth:`call`, keyed by the key passed to ``call``.
+
+        Only recorded when configured with ``call_sample_rate > 0``.
+        """
+        recorder = self.__registry__._recorder
+        if recorder is None:
+            return {}
+        return dict(recorder.stats)
+
+    def map(
+        self,
+        keys: Union[str, Iterable[str]],
+        iterable: Iterable[Any],
+        /,
+        executor: Optional[Executor] = None,
+        chunksize: int = 1,
+        max_in_flight: Optional[int] = None,
+        ref: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """Lazily apply registered function(s) to each item of ``iterable``.
+
+        Parameters
+        ----------
+        keys: Union[str, Iterable[str]]
+            Key of the function to apply. If multiple keys are given, each item
+            yields a tuple with the result of every function.
+        iterable: Iterable
+            Inputs; consumed lazily.
+        executor: Optional[concurrent.futures.Executor]
+            Thread or process pool to run on.
+            Defaults to running serially in the calling thread.
+        chunksize: int
+            Number of items sent to the executor per task.
+            Larger chunks amortize per-task overhead, especially for process pools.
+        max_in_flight: Optional[int]
+            Maximum number of pending chunks when using an ``executor``.
+            Memory use is constant regardless of the length of ``iterable``.
+        ref: Optional[str]
+            Importable ``"module:qualname"`` reference to this registry.
+            For process pools, only this reference and the keys are sent to
+            workers, which import the registry once and look up the functions
+            themselves. Derived automatically for ``Registry`` subclasses and for
+            decorator registries that are module-level variables.
+
+        Returns
+        -------
+        Iterator
+            Results, in the same order as ``iterable``.
+        """
+        return _map(
+            self,
+            keys,
+            iterable,
+            executor=executor,
+            chunksize=chunksize,
+            max_in_flight=max_in_flight,
+            ref=ref,
+        )
+
+    def stats(self, trace: bool = False) -> HierarchyStats:
+        """Memory use and shape of this registry and all registries nested in it.
+
+        Costs a single pass over the keys of every registry in the hierarchy;
+        nothing is imported, and registries of leaf classes aren't allocated.
+
+        Parameters
+        ----------
+        trace: bool
+            Additionally group the memory allocated by autoregistry by the line
+            of code that caused it, e.g. a ``class`` statement or a decorator.
+            Covers all registries in the process, and requires ``tracemalloc``
+            to have been started, with enough frames, before those lines ran.
+
+        Returns
+        -------
+        HierarchyStats
+            Statistics of each registry, breadth-first from this one.
+        """
+        return _stats(self.__registry__, trace=trace)
+
+    def stream(
+        self,
+        records: Records,
+        /,
+        key_field: str = "type",
+        executor: Optional[Executor] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Lazily construct objects from a stream of records.
+
+        Each record is a dictionary like ``{"type": "linear", "in_features": 16}``;
+        the ``key_field`` entry selects the registered object, and the remaining
+        entries are passed as keyword arguments, like :meth:`create`.
+        Each distinct key is only looked up once.
+
+        Parameters
+        ----------
+        records: Union[Iterable[dict], IO, str, PathLike]
+            Iterable of dictionaries, or a JSONL file object or path.
+        key_field: str
+            Record entry containing the registry key.
+        executor: Optional[concurrent.futures.Executor]
+            Thread or process pool to construct objects on.
+            Defaults to constructing serially in the calling thread.
+        max_in_flight: Optional[int]
+            Maximum number of pending constructions when using an ``executor``.
+            Memory use is constant regardless of the number of records.
+
+        Returns
+        -------
+        Iterator
+            Constructed objects, in the same order as ``records``.
+        """
+        return _stream(
+            self,
+            records,
+            key_field=key_field,
+            executor=executor,
+            max_in_flight=max_in_flight,
+        )
+
+    def diff(self, other) -> RegistryDiff:
+        """Compare the contents of this registry against ``other``.
+
+        Nested subregistries are compared recursively; objects are compared by identity.
+
+        Returns
+        -------
+        RegistryDiff
+            Dotted keys ``added`` in ``other``, ``removed`` from ``other``,
+            and ``changed`` between the two.
+        """
+        return _diff(self, other)
+
+    def merge(self, other, policy: str = ERROR):
+        """Copy all entries of ``other`` into this registry.
+
+        Entries are copied directly, without re-validating names, using a single
+        bulk write per registry. For class registries, entries are only written to
+        this class's registry, not propagated to parents.
+
+        Parameters
+        ----------
+        other
+            Registry to copy entries from.
+        policy: str
+            How to handle keys present in both registries:
+
+            * ``"error"`` - raise ``KeyCollisionError`` (default).
+            * ``"keep"`` - keep this registry's entry.
+            * ``"replace"`` - take ``other``'s entry.
+
+            Nested subregistries present in both are merged recursively.
+        """
+        _merge(self, other, policy, _new_registry)
+
+    def union(self, *others, policy: str = ERROR) -> "RegistryDecorator":
+        """Create a new registry containing the entries of this and ``others``.
+
+        See :meth:`merge` for ``policy``.
+        """
+        out = _new_registry(self.__registry__.config.copy())
+        for registry in (self, *others):
+            _merge(out, registry, policy, _new_registry)
+        return out
+
+    def intersection(self, *others) -> "RegistryDecorator":
+        """Create a new registry with the entries whose keys are in all ``others``."""
+        out = _new_registry(self.__registry__.config.copy())
+        _intersection(out, [self, *others], _new_registry)
+        return out
+
+    def pipeline(self, stages: Iterable[StageSpec]) -> Pipeline:
+        """Compile registered functions into a streaming pipeline.
+
+        Parameters
+        ----------
+        stages: Iterable[Union[str, dict]]
+            Registry keys (dotted paths allowed) of the functions to apply,
+            in order. A stage may also be a dictionary with a ``"key"`` and any of:
+
+            * ``"batch_size"`` - pass lists of up to this many records to the
+              function, which returns an iterable of output records.
+            * ``"workers"`` - run the stage on a thread pool of this size.
+            * ``"executor"`` - run the stage on an existing executor.
+            * ``"max_in_flight"`` - maximum number of pending calls on a pool.
+
+            Since stages are plain strings and dictionaries, they can be declared
+            in configuration files.
+
+        Raises
+        ------
+        InvalidPipelineError
+            If any stage is invalid; raised before any data flows.
+        """
+        return Pipeline.build(self, stages)
+
+    def prewarm(
+        self,
+        order: Optional[Iterable[str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        callback: Optional[Callable[[str, Optional[float]], Any]] = None,
+    ) -> Prewarmer:
+        """Import lazily registered entries on a background thread pool.
+
+        Call after startup so that the first request for a key doesn't pay for
+        its import. Foreground lookups are never queued behind the prewarmer.
+
+        Parameters
+        ----------
+        order: Optional[Iterable[str]]
+            Keys to import first, in priority order, e.g. the hottest keys
+            from usage counters. Remaining entries follow in registration order.
+        max_workers: int
+            Number of background threads.
+        callback: Optional[Callable[[str, Optional[float]], Any]]
+            Called from a background thread as ``callback(key, seconds)`` after
+            each entry; ``seconds`` is ``None`` if it failed or was already imported.
+
+        Returns
+        -------
+        Prewarmer
+            Handle reporting progress and per-entry timings.
+        """
+        registry = self.__registry__
+        keys = pending_keys(registry, order)
+        return Prewarmer(registry, keys, max_workers=max_workers, callback=callback)
+
+    def register_lazy(
+        self,
+        name: str,
+        target: str,
+        /,
+        aliases: Union[str, None, Iterable[str]] = None,
+    ):
+        """Register ``target`` under ``name`` without importing it.
+
+        ``target`` is a ``"module:qualname"`` string, e.g.
+        ``"myorg.io.parquet:ParquetReader"``. The module is imported on first
+        access via ``[]``, ``get`` or ``create``, and the placeholder is
+        transparently replaced by the imported object.
+        Iterating over keys and ``in`` never import.
+
+        For class registries, the placeholder is also registered to parent classes,
+        and is replaced when the implementing class is defined.
+        """
+        self.__registry__.register(LazyEntry(target), name, aliases=aliases, root=True)
+
+    def view(
+        self,
+        prefix: Optional[str] = None,
+        base: Optional[type] = None,
+        predicate: Optional[Callable[[str, Any], bool]] = None,
+    ) -> RegistryView:
+        """Create a live, set-like view of this registry's keys.
+
+        Unlike building a filtered dict, nothing is copied: the view reads the
+        registry on demand, so it stays consistent as entries are added or removed.
+        ``len`` is cached until the registry is modified.
+
+        Parameters
+        ----------
+        prefix: Optional[str]
+            Only keys starting with ``prefix``.
+        base: Optional[type]
+            Only classes that are subclasses of ``base``.
+        predicate: Optional[Callable[[str, Any], bool]]
+            Only entries for which ``predicate(key, obj)`` is truthy.
+        """
+        return RegistryView(self.__registry__).filter(prefix, base, predicate)
+
+    def subscribe(self, callback: Callable, batch: bool = False) -> Callable:
+        """Invoke ``callback`` whenever this registry is mutated.
+
+        See :meth:`_Registry.subscribe`.
+        """
+        return self.__registry__.subscribe(callback, batch=batch)
+
+    def unsubscribe(self, callback: Callable):
+        self.__registry__.unsubscribe(callback)
+
+    def dispatch(self, obj: Any) -> Any:
+        """Get the handler registered for ``type(obj)``.
+
+        Handlers are registered with the ``types`` keyword, and the method
+        resolution order of ``type(obj)`` is searched for the nearest match.
+        """
+        return self.__registry__.dispatch(type(obj))
+
 
 class MethodDescriptor:
     """
@@ -168,15 +1276,140 @@ class MethodDescriptor:
         self.user_method = user_method
         self.registry_method = registry_method
 
-    def __get__(self, obj, objtype):
+    def __get__(self, obj, objtype=None):
         if obj is None:
-            # invoked from class
-            return MethodType(self.registry_method, objtype)
+            # invoked from class; the bound registry method is cached on the
+            # class's registry, to avoid allocating one on every ``Cls.get(...)``.
+            registry = objtype.__registry__
+            bound = registry._bound
+            if bound is None:
+                bound = registry._bound = {}
+            method = bound.get(self)
+            if method is None:
+                method = bound[self] = MethodType(self.registry_method, objtype)
+            return method
         else:
             # invoked from instance of class
             return MethodType(self.user_method, obj)
 
 
+def _redirect_methods(metacls, namespace):
+    """Wrap user methods colliding with the dict-like interface in ``namespace``."""
+    for method_name in [
+        "__getitem__",
+        "__iter__",
+        "__len__",
+        "__contains__",
+        "keys",
+        "values",
+        "items",
+        "get",
+        "call",
+        "call_stats",
+        "clear",
+        "create",
+        "diff",
+        "dispatch",
+        "intersection",
+        "map",
+        "merge",
+        "pipeline",
+        "prewarm",
+        "register_lazy",
+        "stats",
+        "stream",
+        "subscribe",
+        "union",
+        "unsubscribe",
+        "view",
+    ]:
+        user_method = namespace.get(method_name)
+        # Plain attributes, like ``stats = {...}``, aren't methods to redirect.
+        if callable(user_method) and not isinstance(
+            user_method, (staticmethod, classmethod)
+        ):
+            namespace[method_name] = MethodDescriptor(
+                user_method, getattr(metacls, method_name)
+            )
+
+
+class _LazyRegistry:
+    """Placeholder ``__registry__`` shared by classes without a registry yet.
+
+    Most registry classes are leaves that never get subclasses, so their
+    registry would stay empty. On first access through the class or an instance,
+    the class's own registry is allocated and replaces the placeholder.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, obj, objtype=None):
+        return _allocate_registry(objtype)
+
+
+_LAZY_REGISTRY = _LazyRegistry()
+_allocate_lock = threading.Lock()
+
+
+def _is_lazy(cls) -> bool:
+    return vars(cls).get("__registry__") is _LAZY_REGISTRY
+
+
+def _allocate_registry(cls) -> "_Registry":
+    with _allocate_lock:
+        registry = vars(cls)["__registry__"]
+        if registry is not _LAZY_REGISTRY:
+            # Allocated by another thread.
+            return registry
+
+        for parent_cls in cls.__bases__:
+            try:
+                parent_registry = parent_cls.__registry__
+                break
+            except AttributeError:
+                pass
+        else:
+            raise InternalError("Should never happen.")  # pragma: no cover
+
+        config = parent_registry.config.copy()
+        registry = _Registry(config, name=config.format(cls.__name__))
+        registry.cls = cls
+        if config.shared_aliases:
+            for parent_cls in cls.__bases__:
+                table = getattr(
+                    getattr(parent_cls, "__registry__", None), "alias_table", None
+                )
+                if table is not None:
+                    registry.alias_table = table
+                    break
+        type.__setattr__(cls, "__registry__", registry)
+        return registry
+
+
+def _register_to_bases(cls, obj, name, aliases, types, root, version=None):
+    """Register ``obj`` to the registries of ``cls``'s direct parents.
+
+    With ``root``, always register to direct parents; otherwise only to
+    parents configured with ``recursive``.
+    """
+    for parent_cls in cls.__bases__:
+        try:
+            parent_registry = parent_cls.__registry__
+        except AttributeError:
+            # Not a Registry object
+            continue
+
+        if parent_cls is Registry:
+            # Never register to the base Registry class.
+            # Unwanted cross-library interactions may occur, otherwise.
+            continue
+
+        if root or parent_registry.config.recursive:
+            parent_registry.register(
+                obj, name=name, aliases=aliases, types=types, version=version
+            )
+
+
 class RegistryMeta(ABCMeta, _DictMixin):
     __registry__: _Registry
 
@@ -188,6 +1421,8 @@ class RegistryMeta(ABCMeta, _DictMixin):
         name: Union[str, None] = None,
         aliases: Union[str, None, Iterable[str]] = None,
         skip: bool = False,
+        types: Union[type, None, Iterable[type]] = None,
+        version: Union[str, None] = None,
         **config,
     ):
         """Create Class Constructor.
@@ -201,6 +1436,10 @@ class RegistryMeta(ABCMeta, _DictMixin):
             Additionally, register this class under these string(s).
         skip : bool
             Do **not** register this class to the appropriate registry(s).
+        types : type or list or None
+            Additionally, register this class as the handler for these type(s).
+        version : str or None
+            Register this class as this version of its name, e.g. ``"2.3.1"``.
         """
         # Manipulate namespace instead of modifying attributes after calling __new__ so
         # that hooks like __init_subclass__ have appropriately set registry attributes.
@@ -217,13 +1456,28 @@ class RegistryMeta(ABCMeta, _DictMixin):
         # Copy the nearest parent config, then update it with new params
         for parent_cls in bases:
             try:
-                registry_config = parent_cls.__registry__.config.copy()
+                parent_config = parent_cls.__registry__.config
                 break
             except AttributeError:
                 pass
         else:
             raise InternalError("Should never happen.")  # pragma: no cover
 
+        if not (config or aliases or parent_config.register_self) and name is None:
+            # Most classes are leaves that never get subclasses or registrations;
+            # defer allocating their registry until it is first accessed.
+            return cls._new_lazy(
+                cls_name,
+                bases,
+                namespace,
+                parent_config,
+                skip=skip,
+                types=types,
+                version=version,
+            )
+
+        registry_config = parent_config.copy()
+
         # Derive registry name before updating registry config, since a classes own name is
         # subject to it's parents configuration, not its own.
         registry_name = registry_config.format(cls_name) if name is None else name
@@ -232,24 +1486,19 @@ class RegistryMeta(ABCMeta, _DictMixin):
 
         namespace["__registry__"] = _Registry(registry_config, name=registry_name)
 
+        if registry_config.shared_aliases:
+            # Share the nearest ancestor's alias table across the hierarchy.
+            for parent_cls in bases:
+                try:
+                    table = parent_cls.__registry__.alias_table
+                except AttributeError:
+                    continue
+                if table is not None:
+                    namespace["__registry__"].alias_table = table
+                    break
+
         if namespace["__registry__"].config.redirect:
-            for method_name in [
-                "__getitem__",
-                "__iter__",
-                "__len__",
-                "__contains__",
-                "keys",
-                "values",
-                "items",
-                "get",
-                "clear",
-            ]:
-                if method_name in namespace and not isinstance(
-                    namespace[method_name], (staticmethod, classmethod)
-                ):
-                    namespace[method_name] = MethodDescriptor(
-                        namespace[method_name], getattr(cls, method_name)
-                    )
+            _redirect_methods(cls, namespace)
 
         # We cannot defer class creation any further.
         # This will call hooks like __init_subclass__
@@ -265,11 +1514,34 @@ class RegistryMeta(ABCMeta, _DictMixin):
             name=new_cls.__registry__.name,
             aliases=aliases,
             root=True,  # Always register to direct parents
+            types=types,
+            version=version,
         )
 
         return new_cls
 
+    @classmethod
+    def _new_lazy(
+        cls, cls_name, bases, namespace, parent_config, skip, types, version=None
+    ):
+        """Create a class whose ``__registry__`` is allocated on first access."""
+        namespace["__registry__"] = _LAZY_REGISTRY
+        if parent_config.redirect:
+            _redirect_methods(cls, namespace)
+
+        # This will call hooks like __init_subclass__
+        # Validate the name now rather than on first access, even if skipped.
+        name = parent_config.format(cls_name)
+        new_cls = super().__new__(cls, cls_name, bases, namespace)
+        if not skip:
+            # Same as ``register(..., root=True)``, which only propagates to
+            # parents, but without needing this class's own registry.
+            _register_to_bases(new_cls, new_cls, name, (), types, True, version)
+        return new_cls
+
     def __repr__(cls):
+        if _is_lazy(cls):
+            return f"<{cls.__name__}: []>"
         try:
             return f"<{cls.__name__}: {list(cls.__registry__.keys())}>"
         except Exception:
@@ -282,11 +1554,28 @@ class Registry(metaclass=RegistryMeta):
     __getitem__: Callable[[str], Type]
     __iter__: Callable
     __len__: Callable[..., int]
+    call: Callable[..., Any]
+    call_stats: Callable[[], Dict[Any, CallStats]]
     clear: Callable[[], None]
+    create: Callable[..., Any]
+    diff: Callable[..., RegistryDiff]
+    dispatch: Callable[[Any], Any]
     get: Callable[..., Type]
+    intersection: Callable[..., "RegistryDecorator"]
     items: Callable
     keys: Callable[[], KeysView]
+    map: Callable[..., Iterator[Any]]
+    merge: Callable[..., None]
+    pipeline: Callable[..., Pipeline]
+    prewarm: Callable[..., Prewarmer]
+    register_lazy: Callable[..., None]
+    stats: Callable[..., HierarchyStats]
+    stream: Callable[..., Iterator[Any]]
+    subscribe: Callable[..., Callable]
+    union: Callable[..., "RegistryDecorator"]
+    unsubscribe: Callable[[Callable], None]
     values: Callable[[], ValuesView]
+    view: Callable[..., RegistryView]
 
     def __new__(cls, *args, **kwargs):
         if cls is Registry:
@@ -321,19 +1610,23 @@ class RegistryDecorator(Registry, _DictMixin, skip=True):
         *,
         name: str = "",
         aliases: Union[str, None, Iterable[str]] = None,
+        types: Union[type, None, Iterable[type]] = None,
+        version: Optional[str] = None,
     ) -> Any:
-        config = self.__registry__.config
-
         if obj is None:
             # Was called @my_registry(**config_params)
             # Maybe copy config and update and pass it through
-            return partial(self.__call__, name=name, aliases=aliases)
+            return partial(
+                self.__call__, name=name, aliases=aliases, types=types, version=version
+            )
 
         if not ismodule(obj):
-            self.__registry__.register(obj, name=name, aliases=aliases)
+            self.__registry__.register(
+                obj, name=name, aliases=aliases, types=types, version=version
+            )
             return obj
 
-        if aliases:
+        if aliases or types or version:
             raise ModuleAliasError
 
         try:
@@ -345,34 +1638,133 @@ class RegistryDecorator(Registry, _DictMixin, skip=True):
                 f"Cannot register Python BuiltIn {obj}"
             )
 
-        obj_folder = str(Path(obj_file).parent)
-        # Skip private and magic attributes
-        elem_names = [x for x in dir(obj) if not x.startswith("_")]
-        for elem_name in elem_names:
-            handle = getattr(obj, elem_name)
-            if ismodule(handle):
-                if not config.recursive:
-                    continue
-                try:
-                    handle_file = handle.__file__
-                except AttributeError:
-                    handle_file = None
+        traversal = Traversal(self.__registry__.traversal)
+        self._traverse(obj, traversal)
+        self.__registry__.traversal = traversal
 
-                if handle_file is None:  # handle is a python built-in
-                    continue
+        return obj
+
+    def _traverse(self, obj, traversal: Traversal):
+        with traversal.visit(obj, self), self.__registry__.batch():
+            self._register_module(obj, traversal=traversal)
 
-                handle_folder = str(Path(handle_file).parent)
-                if not handle_folder.startswith(obj_folder):
-                    # Only traverse direct submodules
+    def _register_module(self, obj, subregistries=None, traversal=None):
+        """Traverse module ``obj``, registering its public attributes.
+
+        Parameters
+        ----------
+        obj: module
+            Module to traverse.
+        subregistries: dict
+            Existing subregistries, keyed by attribute name, to reuse instead of
+            re-traversing the submodule. Used when reloading.
+        traversal: Traversal
+            Memo of the modules already traversed by this registration.
+        """
+        config = self.__registry__.config
+        if subregistries is None:
+            subregistries = {}
+        if traversal is None:
+            traversal = Traversal()
+
+        record = ModuleRecord.from_module(obj)
+        _checkpoint.record(self.__registry__, self.__registry__.sources, obj.__name__)
+        self.__registry__.sources[obj.__name__] = record
+
+        registry = self.__registry__
+        table = registry.alias_table
+        # Attribute names are valid keys; only check for collisions, then
+        # write all entries in a single update.
+        entries = {}
+        for elem_name, handle, is_submodule in module_members(obj, config):
+            if is_submodule:
+                subregistry = subregistries.get(elem_name)
+                if (
+                    subregistry is None
+                    or handle.__name__ not in subregistry.__registry__.sources
+                ):
+                    subregistry = traversal.lookup(handle, config)
+                    if subregistry is not None and traversal.active(handle):
+                        traversal.cycles.append((obj.__name__, handle.__name__))
+                if subregistry is None:
+                    # Subregistries share their parent's config object if compact.
+                    subregistry = _new_registry(
+                        config if config.compact else config.copy()
+                    )
+                    subregistry._traverse(handle, traversal)
+                handle = subregistry
+            if not config.overwrite and (
+                elem_name in registry or (table is not None and elem_name in table)
+            ):
+                raise KeyCollisionError(f'"{elem_name}" already registered to {self}')
+            if config.compact:
+                elem_name = sys.intern(elem_name)
+            entries[elem_name] = handle
+            record.keys.append(elem_name)
+        registry.update_entries(entries)
+
+    def _reload_module(self, obj):
+        """Replace the entries populated from an already re-imported module."""
+        _checkpoint.record_removal(self.__registry__, self.__registry__.sources)
+        record = self.__registry__.sources.pop(obj.__name__)
+        subregistries = {}
+        with self.__registry__.batch():
+            for key in record.keys:
+                if key not in self.__registry__:
                     continue
+                value = self.__registry__.unregister(key)
+                if isinstance(value, RegistryDecorator):
+                    subregistries[key] = value
+            self._register_module(obj, subregistries)
+
+    def reload(self) -> ReloadEvent:
+        """Re-import modules whose files changed since they were registered.
+
+        Only the changed modules are re-imported, and only their keys (and the
+        subregistries they populated) are updated; unchanged subregistries are
+        kept as-is.
+
+        Returns
+        -------
+        ReloadEvent
+            Summary of the modules reloaded and the keys that changed.
+            Evaluates to ``False`` if nothing changed.
+        """
+        return _reload(self)
 
-                subregistry = RegistryDecorator(**config.asdict())
-                subregistry(handle)
-                self(subregistry, name=elem_name)
-            else:
-                self(handle, name=elem_name)
+    def watch(
+        self,
+        interval: float = 1.0,
+        callback: Union[Callable[[ReloadEvent], Any], None] = None,
+        lock: Union[ContextManager, None] = None,
+    ) -> RegistryWatcher:
+        """Poll module files in a background thread and reload them when modified.
 
-        return obj
+        Reloads mutate the registry from the background thread; other threads
+        iterating over the registry must hold the watcher's ``lock``.
+
+        Parameters
+        ----------
+        interval: float
+            Seconds between polls.
+        callback: Callable
+            Invoked with a :class:`ReloadEvent` whenever a reload changed something.
+        lock: Optional[ContextManager]
+            Held while reloading. Defaults to a new ``threading.RLock``.
+
+        Returns
+        -------
+        RegistryWatcher
+            Already-started watcher; call ``stop()`` or use it as a context manager.
+        """
+        watcher = RegistryWatcher(self, interval=interval, callback=callback, lock=lock)
+        return watcher.start()
 
     def __repr__(self):
         return f"<Registry: {list(self.__registry__.keys())}>"
+
+
+def _new_registry(config: RegistryConfig) -> RegistryDecorator:
+    registry = RegistryDecorator()
+    registry.__registry__ = _Registry(config)
+    return registry
@@ -0,0 +1,207 @@
+"""Hot-reloading of module-backed registries by polling file modification times.
+"""
+import importlib
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, ContextManager, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class ModuleRecord:
+    """Bookkeeping for a module that was traversed into a registry."""
+
+    module: ModuleType
+    path: str
+    mtime: int
+    # Registry keys that were populated from this module.
+    keys: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_module(cls, module: ModuleType) -> "ModuleRecord":
+        path = str(module.__file__)
+        return cls(module=module, path=path, mtime=_mtime(path))
+
+    def changed(self) -> bool:
+        return _mtime(self.path) != self.mtime
+
+
+@dataclass
+class ReloadEvent:
+    """Summary of the changes applied by a single reload.
+
+    Keys are dotted paths relative to the registry that was reloaded.
+    """
+
+    modules: List[str] = field(default_factory=list)
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.modules)
+
+
+def _mtime(path: str) -> int:
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        # File was deleted; treat as changed so the reload surfaces the error.
+        return -1
+
+
+def iter_records(registry) -> Iterator[Tuple[Any, str, ModuleRecord]]:
+    """Yield ``(registry_decorator, path_prefix, record)`` for all traversed modules.
+
+    Parameters
+    ----------
+    registry: RegistryDecorator
+        Root registry to walk; nested subregistries are walked recursively.
+    """
+    seen = set()
+    stack = [(registry, "")]
+    while stack:
+        reg, prefix = stack.pop()
+        if id(reg) in seen:
+            continue
+        seen.add(id(reg))
+        for record in reg.__registry__.sources.values():
+            yield reg, prefix, record
+        for key, value in reg.__registry__.items():
+            sub = getattr(value, "__registry__", None)
+            if sub is not None and sub.sources:
+                stack.append((value, f"{prefix}{key}."))
+
+
+def reload(registry, records: Optional[List[Tuple[Any, str, ModuleRecord]]] = None):
+    """Re-import changed modules and update their registries in place.
+
+    Parameters
+    ----------
+    registry: RegistryDecorator
+        Root registry to reload.
+    records: list
+        Pre-computed output of :func:`iter_records`; avoids re-walking the
+        registry on every poll.
+
+    Returns
+    -------
+    ReloadEvent
+    """
+    if records is None:
+        records = list(iter_records(registry))
+
+    changed = [x for x in records if x[2].changed()]
+    event = ReloadEvent()
+    if not changed:
+        return event
+
+    # Reload deepest modules first so that parent packages re-importing
+    # their children pick up the fresh objects.
+    changed.sort(key=lambda x: x[2].module.__name__.count("."), reverse=True)
+    error = None
+    for i, (_, _, record) in enumerate(changed):
+        # Update the timestamp first so a module that fails to import isn't
+        # retried on every poll until it is modified again.
+        record.mtime = _mtime(record.path)
+        # ``importlib.reload`` re-executes the module in its existing namespace;
+        # drop previously registered attributes so deleted definitions disappear.
+        namespace = vars(record.module)
+        popped = {}
+        for key in record.keys:
+            if key in namespace and not isinstance(namespace[key], ModuleType):
+                popped[key] = namespace.pop(key)
+        try:
+            importlib.reload(record.module)
+        except BaseException as e:
+            # Leave the module as the registry still serves it.
+            namespace.update(popped)
+            error = e
+            del changed[i:]
+            break
+        event.modules.append(record.module.__name__)
+
+    for reg, prefix, record in changed:
+        before = {k: reg.__registry__[k] for k in record.keys if k in reg.__registry__}
+        reg._reload_module(record.module)
+        after = reg.__registry__.sources[record.module.__name__].keys
+        for key in after:
+            if key not in before:
+                event.added.append(prefix + key)
+            elif before[key] is not reg.__registry__[key]:
+                event.updated.append(prefix + key)
+        for key in before:
+            if key not in after:
+                event.removed.append(prefix + key)
+
+    if error is not None:
+        # Modules reloaded before the failure are applied; re-raise the failure.
+        raise error
+    return event
+
+
+class RegistryWatcher:
+    """Background thread that periodically polls a registry for changed modules.
+
+    The list of watched files is cached between polls and only recomputed
+    after a reload, so an idle poll costs a single ``stat`` per module.
+
+    Reloads mutate the registry from the watcher thread while holding ``lock``.
+    Hold the same lock while iterating over the registry (or its subregistries)
+    from other threads; otherwise iteration may fail with ``RuntimeError:
+    dictionary changed size during iteration``, and lookups may briefly miss
+    keys that are being reloaded.
+    """
+
+    def __init__(
+        self,
+        registry,
+        interval: float = 1.0,
+        callback: Optional[Callable[[ReloadEvent], Any]] = None,
+        lock: Optional[ContextManager] = None,
+    ):
+        self.registry = registry
+        self.interval = interval
+        self.callback = callback
+        self.lock = threading.RLock() if lock is None else lock
+        self._records = list(iter_records(registry))
+        self.exception: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="autoregistry-watcher", daemon=True
+        )
+
+    def poll(self) -> ReloadEvent:
+        with self.lock:
+            event = reload(self.registry, self._records)
+            if event:
+                self._records = list(iter_records(self.registry))
+        # Outside the lock, so the callback may wait on threads that take it.
+        if event and self.callback is not None:
+            self.callback(event)
+        return event
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                # Keep watching; a subsequent edit may fix the module.
+                self.exception = e
+
+    def start(self) -> "RegistryWatcher":
+        if self._thread.ident is None:
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,180 @@
+"""Diff, merge and set operations between registries.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .exceptions import KeyCollisionError
+
+ERROR = "error"
+KEEP = "keep"
+REPLACE = "replace"
+POLICIES = (ERROR, KEEP, REPLACE)
+
+
+@dataclass
+class RegistryDiff:
+    """Differences between two registries.
+
+    Keys are dotted paths; nested subregistries are compared recursively.
+    """
+
+    # Keys only in the other registry.
+    added: List[str] = field(default_factory=list)
+
+    # Keys only in this registry.
+    removed: List[str] = field(default_factory=list)
+
+    # Keys in both registries, mapping to different objects.
+    changed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _storage(obj) -> Dict[str, Any]:
+    """Get the underlying ``_Registry`` from a registry-like object."""
+    return getattr(obj, "__registry__", obj)
+
+
+def _is_subregistry(obj) -> bool:
+    # Nested decorator registries, as created by module traversal.
+    # Registry classes are compared by identity.
+    return not isinstance(obj, type) and hasattr(obj, "__registry__")
+
+
+def diff(a, b, prefix: str = "", out=None, seen=None) -> RegistryDiff:
+    if out is None:
+        out = RegistryDiff()
+    if seen is None:
+        seen = set()
+    a, b = _storage(a), _storage(b)
+    if (id(a), id(b)) in seen:
+        # Compared already, via another path or a cycle.
+        return out
+    seen.add((id(a), id(b)))
+
+    for key, value in a.items():
+        other = b.get(key, a)  # ``a`` doubles as a sentinel.
+        if other is a:
+            out.removed.append(prefix + key)
+        elif other is value:
+            continue
+        elif _is_subregistry(value) and _is_subregistry(other):
+            diff(value, other, f"{prefix}{key}.", out, seen)
+        else:
+            out.changed.append(prefix + key)
+
+    out.added.extend(prefix + key for key in b if key not in a)
+    return out
+
+
+def collisions(target, source, prefix: str = "", out=None, seen=None) -> List[str]:
+    """Dotted keys present in both registries, mapping to different objects.
+
+    Nested subregistries present in both are compared recursively, since
+    :func:`merge` merges them instead of treating them as collisions.
+    """
+    if out is None:
+        out = []
+    if seen is None:
+        seen = set()
+    target, source = _storage(target), _storage(source)
+    if (id(target), id(source)) in seen:
+        return out
+    seen.add((id(target), id(source)))
+
+    for key, value in source.items():
+        existing = target.get(key, target)
+        if existing is target or existing is value:
+            continue
+        if _is_subregistry(existing) and _is_subregistry(value):
+            collisions(existing, value, f"{prefix}{key}.", out, seen)
+        else:
+            out.append(prefix + key)
+    return out
+
+
+def merge(target, source, policy: str = ERROR, new_registry: Optional[Callable] = None):
+    """Bulk-copy entries of ``source`` into ``target``.
+
+    Parameters
+    ----------
+    target
+        Registry to write into.
+    source
+        Registry to read from; not modified.
+    policy: str
+        How to handle keys present in both registries:
+        ``"error"`` raises ``KeyCollisionError``, ``"keep"`` keeps the entry of
+        ``target``, ``"replace"`` takes the entry of ``source``.
+        Nested subregistries present in both are merged recursively.
+        With ``"error"``, all collisions are found before anything is written,
+        so ``target`` is left unchanged if any are found.
+    new_registry: Callable
+        Creates an empty decorator registry from a config; used to copy
+        subregistries only present in ``source``.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown merge policy {policy!r}; expected {POLICIES}.")
+
+    if policy == ERROR:
+        found = collisions(target, source)
+        if found:
+            keys = ", ".join(f'"{x}"' for x in found)
+            raise KeyCollisionError(f"{keys} already registered to {_storage(target)}")
+    _merge(target, source, policy, new_registry, set(), {})
+    return _storage(target)
+
+
+def _merge(target, source, policy: str, new_registry: Optional[Callable], seen, copies):
+    target, source = _storage(target), _storage(source)
+    if (id(target), id(source)) in seen:
+        # Subregistries shared by several parents are only merged once.
+        return
+    seen.add((id(target), id(source)))
+
+    updates = {}
+    for key, value in source.items():
+        existing = target.get(key, target)
+        if existing is target:
+            if _is_subregistry(value) and new_registry is not None:
+                # Subregistries shared by several parents, or by a cycle, are
+                # copied once, and the copy is shared likewise.
+                copy = copies.get(id(_storage(value)))
+                if copy is None:
+                    copy = new_registry(_storage(value).config.copy())
+                    copies[id(_storage(value))] = copy
+                    _merge(copy, value, policy, new_registry, seen, copies)
+                value = copy
+            updates[key] = value
+        elif existing is value:
+            continue
+        elif _is_subregistry(existing) and _is_subregistry(value):
+            _merge(existing, value, policy, new_registry, seen, copies)
+        elif policy == REPLACE:
+            updates[key] = value
+
+    target.update_entries(updates)
+
+
+def intersection(target, sources, new_registry: Callable, copies=None) -> None:
+    """Populate ``target`` with entries of the first source whose keys are in all."""
+    if copies is None:
+        copies = {}
+    target = _storage(target)
+    first, *rest = (_storage(x) for x in sources)
+    updates = {}
+    for key, value in first.items():
+        others = [x.get(key, x) for x in rest]
+        if any(other is x for other, x in zip(others, rest)):
+            continue
+        if _is_subregistry(value) and all(_is_subregistry(x) for x in others):
+            # Intersected once per combination of subregistries, so cycles end.
+            ids = tuple(id(_storage(x)) for x in (value, *others))
+            copy = copies.get(ids)
+            if copy is None:
+                copy = copies[ids] = new_registry(_storage(value).config.copy())
+                intersection(copy, [value, *others], new_registry, copies)
+            value = copy
+        updates[key] = value
+    target.update_entries(updates)
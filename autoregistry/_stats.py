@@ -0,0 +1,274 @@
+"""Memory accounting and shape statistics of registry hierarchies.
+"""
+import sys
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+PACKAGE_DIR = str(Path(__file__).absolute().parent)
+_IMPORTLIB = "<frozen importlib"
+
+# Per-registry containers, counted shallowly.
+_CONTAINERS = (
+    "types",
+    "_dispatch_cache",
+    "_plans",
+    "_paths",
+    "_path_deps",
+    "_misses",
+    "_calls",
+    "sources",
+    "_aliases",
+    "versions",
+    "_resolved_versions",
+    "_events",
+    "_recorder",
+    "_bound",
+    # Overlays only.
+    "_hits",
+)
+
+
+@dataclass
+class RegistryStats:
+    """Statistics of a single registry in a hierarchy."""
+
+    # Dotted path of keys from the root registry; ``""`` for the root itself.
+    path: str
+    # Distance from the root registry.
+    depth: int
+    # Number of keys, including aliases.
+    keys: int = 0
+    # Number of distinct registered objects.
+    entries: int = 0
+    # Number of keys, including visible shared aliases, that aren't the only
+    # key of their object.
+    aliases: int = 0
+    # Entries propagated from indirect subclasses via ``recursive=True``.
+    propagated: int = 0
+    # Number of direct child registries.
+    fan_out: int = 0
+    # Approximate bytes allocated by autoregistry for this registry: the
+    # registry, its keys, config, caches and method descriptors.
+    # Registered objects aren't included. Shared objects are only counted once.
+    bytes: int = 0
+    # ``True`` if this is a class whose registry isn't allocated yet.
+    lazy: bool = False
+
+
+@dataclass
+class AllocationSite:
+    """Memory allocated by autoregistry on behalf of a single line of code."""
+
+    filename: str
+    lineno: int
+    # Bytes currently allocated, and number of allocations.
+    size: int
+    count: int
+
+
+@dataclass
+class HierarchyStats:
+    """Statistics of a registry and all registries nested in it.
+
+    Each registry is visited once, so classes reachable via several parents
+    (e.g. in diamond inheritance) are only counted under the first.
+    """
+
+    # Breadth-first; the root registry comes first.
+    registries: List[RegistryStats]
+    # Only populated by ``stats(trace=True)``; largest first.
+    allocations: Optional[List[AllocationSite]] = field(default=None)
+
+    @property
+    def nested(self) -> int:
+        """Number of registries nested in the root registry."""
+        return len(self.registries) - 1
+
+    @property
+    def lazy(self) -> int:
+        """Number of nested classes whose registry isn't allocated yet."""
+        return sum(x.lazy for x in self.registries)
+
+    @property
+    def max_depth(self) -> int:
+        return max(x.depth for x in self.registries)
+
+    @property
+    def max_fan_out(self) -> int:
+        return max(x.fan_out for x in self.registries)
+
+    @property
+    def mean_fan_out(self) -> float:
+        """Mean number of children of registries that have children."""
+        parents = [x.fan_out for x in self.registries if x.fan_out]
+        return sum(parents) / len(parents) if parents else 0.0
+
+    @property
+    def bytes(self) -> int:
+        """Approximate bytes allocated by autoregistry for the whole hierarchy."""
+        return sum(x.bytes for x in self.registries)
+
+
+class _Sizer:
+    """Shallow ``sys.getsizeof``, counting each object only once."""
+
+    __slots__ = ("seen",)
+
+    def __init__(self):
+        self.seen: Set[int] = set()
+
+    def __call__(self, obj: Any) -> int:
+        if obj is None or id(obj) in self.seen:
+            return 0
+        self.seen.add(id(obj))
+        return sys.getsizeof(obj)
+
+
+def _approx_bytes(registry, sizeof: _Sizer) -> int:
+    total = sizeof(registry) + sizeof(vars(registry))
+    # Propagated keys are shared with the parent registries.
+    seen = sizeof.seen
+    for key in dict.keys(registry):
+        if id(key) not in seen:
+            seen.add(id(key))
+            total += sys.getsizeof(key)
+    total += sizeof(registry.config) + sizeof(vars(registry.config))
+    for name in _CONTAINERS:
+        total += sizeof(getattr(registry, name, None))
+
+    table = registry.alias_table
+    if table is not None and id(table) not in sizeof.seen:
+        # Shared by the whole hierarchy; counted at the first registry.
+        total += sizeof(table)
+        total += sum(sizeof(alias) + sizeof(entry) for alias, entry in table.items())
+
+    for descriptor in registry.iter_descriptors():
+        total += sizeof(descriptor) + sizeof(vars(descriptor))
+    return total
+
+
+def _alias_counts(table: Dict[str, Tuple[str, Any]]) -> Dict[Tuple[str, int], int]:
+    """Number of shared aliases per ``(canonical name, id(obj))``."""
+    counts: Dict[Tuple[str, int], int] = {}
+    for name, obj in table.values():
+        target = (name, id(obj))
+        counts[target] = counts.get(target, 0) + 1
+    return counts
+
+
+def _registry_stats(
+    registry, path: str, depth: int, sizeof: _Sizer, alias_counts
+) -> Tuple[RegistryStats, List[Tuple[Any, Any, str]]]:
+    cls = registry.cls
+    stats = RegistryStats(path=path, depth=depth, keys=len(registry))
+
+    # Canonical names are stored before aliases, so the first key of each object.
+    names: Dict[int, str] = {}
+    children = []
+    peek = registry.peek_nested
+    for key, obj in dict.items(registry):
+        if id(obj) in names:
+            continue
+        names[id(obj)] = key
+        if obj is cls:
+            continue
+        if cls is not None and isinstance(obj, type) and cls not in obj.__bases__:
+            # Propagated from a deeper subclass; visited under its direct parent.
+            stats.propagated += 1
+            continue
+        child = peek(obj)
+        if child is not False:
+            children.append((obj, child, f"{path}.{key}" if path else key))
+    stats.entries = len(names)
+    stats.aliases = stats.keys - stats.entries
+
+    if registry.alias_table is not None:
+        table_id = id(registry.alias_table)
+        counts = alias_counts.get(table_id)
+        if counts is None:
+            counts = alias_counts[table_id] = _alias_counts(registry.alias_table)
+        if counts:
+            stats.aliases += sum(
+                counts.get((key, id(obj)), 0) for key, obj in dict.items(registry)
+            )
+
+    stats.fan_out = len(children)
+    stats.bytes = _approx_bytes(registry, sizeof)
+    return stats, children
+
+
+def allocation_sites(snapshot: tracemalloc.Snapshot) -> List[AllocationSite]:
+    """Group memory allocated within autoregistry by the calling line of code.
+
+    Each allocation is attributed to the line of code that called into
+    autoregistry, e.g. a ``class`` statement or a ``@registry`` decorator.
+    Tracebacks too short to reach outside of autoregistry are attributed to
+    their oldest frame. Allocations made while importing autoregistry itself
+    are excluded.
+    """
+    pattern = str(Path(PACKAGE_DIR, "*"))
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(True, pattern, all_frames=True)]
+    )
+
+    sites: Dict[Tuple[str, int], AllocationSite] = {}
+    for trace in snapshot.traces:
+        # Oldest frame first.
+        frames = trace.traceback
+        inside = [x.filename.startswith(PACKAGE_DIR) for x in frames]
+        if any(
+            inside[i] and frames[i + 1].filename.startswith(_IMPORTLIB)
+            for i in range(len(frames) - 1)
+        ):
+            # An ``import`` statement of autoregistry's own modules.
+            continue
+        i = inside.index(True)
+        site = frames[i - 1] if i else frames[0]
+        if site.filename.startswith(_IMPORTLIB):
+            # Importing autoregistry itself.
+            continue
+        key = (site.filename, site.lineno)
+        record = sites.get(key)
+        if record is None:
+            record = sites[key] = AllocationSite(site.filename, site.lineno, 0, 0)
+        record.size += trace.size
+        record.count += 1
+    return sorted(sites.values(), key=lambda x: x.size, reverse=True)
+
+
+def stats(registry, trace: bool = False) -> HierarchyStats:
+    """See :meth:`_DictMixin.stats`."""
+    snapshot = None
+    if trace:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError(
+                "tracemalloc is not tracing; call tracemalloc.start(nframes) "
+                "before defining registries, e.g. with nframes=25."
+            )
+        snapshot = tracemalloc.take_snapshot()
+
+    sizeof = _Sizer()
+    alias_counts: Dict[int, Dict[Tuple[str, int], int]] = {}
+    records = []
+    visited = {id(registry)}
+    queue = deque([(registry, "", 0)])
+    while queue:
+        current, path, depth = queue.popleft()
+        if current is None:
+            records.append(RegistryStats(path, depth, lazy=True))
+            continue
+        record, children = _registry_stats(current, path, depth, sizeof, alias_counts)
+        records.append(record)
+        for obj, child, child_path in children:
+            key = id(obj) if child is None else id(child)
+            if key not in visited:
+                visited.add(key)
+                queue.append((child, child_path, depth + 1))
+
+    result = HierarchyStats(registries=records)
+    if snapshot is not None:
+        result.allocations = allocation_sites(snapshot)
+    return result
@@ -0,0 +1,56 @@
+"""Streaming construction of registered objects from record streams.
+"""
+import json
+import os
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from ._concurrency import Call, ordered_results
+
+Records = Union[Iterable[Dict[str, Any]], IO, str, "os.PathLike[str]"]
+
+
+def iter_records(records: Records) -> Iterator[Dict[str, Any]]:
+    """Lazily yield dict records from an iterable, JSONL file object, or path."""
+    if isinstance(records, (str, os.PathLike)):
+        with Path(records).open() as f:
+            yield from iter_records(f)
+        return
+
+    if hasattr(records, "read"):
+        for line in records:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+        return
+
+    yield from records
+
+
+def stream(
+    registry,
+    records: Records,
+    key_field: str = "type",
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Any]:
+    """See :meth:`_DictMixin.stream`."""
+    reg = registry.__registry__
+    strict = not reg.config.filter_kwargs
+    # Raw key -> (obj, plan); each distinct key is only looked up once.
+    resolved: Dict[str, Tuple[Any, Any]] = {}
+
+    def calls() -> Iterator[Call]:
+        for record in iter_records(records):
+            kwargs = dict(record)
+            key = kwargs.pop(key_field)
+            try:
+                obj, plan = resolved[key]
+            except KeyError:
+                obj = registry[key]
+                plan = reg.plan(obj)
+                resolved[key] = (obj, plan)
+            yield obj, (), plan.bind(kwargs, strict=strict)
+
+    return ordered_results(calls(), executor=executor, max_in_flight=max_in_flight)
@@ -0,0 +1,202 @@
+"""Traversal of modules into registries.
+"""
+import re
+from contextlib import contextmanager
+from fnmatch import translate
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Tuple, Union
+
+from .config import RegistryConfig
+
+Patterns = Union[str, Iterable[str]]
+
+
+def package_name(module: ModuleType) -> str:
+    """Name of the package whose modules count as submodules of ``module``.
+
+    That is the module itself for packages, and its parent package otherwise.
+    """
+    spec = getattr(module, "__spec__", None)
+    if spec is not None:
+        if spec.submodule_search_locations is not None:
+            return spec.name
+        return spec.parent
+    name = module.__name__
+    return name if hasattr(module, "__path__") else name.rpartition(".")[0]
+
+
+def in_package(name: str, package: str) -> bool:
+    """Whether the module named ``name`` lives in ``package``, or is ``package``."""
+    return bool(package) and (name == package or name.startswith(package + "."))
+
+
+@lru_cache(maxsize=None)
+def _compile(patterns: Tuple[str, ...]) -> Optional[Pattern]:
+    if not patterns:
+        return None
+    return re.compile("|".join(translate(x) for x in patterns))
+
+
+def _patterns(patterns: Patterns) -> Optional[Pattern]:
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    return _compile(tuple(patterns))
+
+
+def module_members(
+    module: ModuleType, config: RegistryConfig
+) -> List[Tuple[str, Any, bool]]:
+    """Select the attributes of ``module`` to register, subject to ``config``.
+
+    Reads ``vars(module)`` directly; submodules are identified by comparing
+    module names against the package of ``module``, not by filesystem paths.
+
+    Returns
+    -------
+    list
+        ``(name, obj, is_submodule)`` tuples, sorted by name.
+        Submodules are only included with ``config.recursive``.
+    """
+    namespace = vars(module)
+    names: Iterable[str] = namespace
+    if config.module_all:
+        names = namespace.get("__all__", namespace)
+
+    include = _patterns(config.module_include)
+    exclude = _patterns(config.module_exclude)
+    predicate = config.module_filter
+    package = package_name(module)
+    # Objects defined in ``module`` itself count as local for top-level modules.
+    local = package or module.__name__
+    origins: Dict[str, bool] = {}
+
+    members = []
+    for name in names:
+        if name.startswith("_"):
+            # Skip private and magic attributes
+            continue
+        if include is not None and not include.match(name):
+            continue
+        if exclude is not None and exclude.match(name):
+            continue
+        try:
+            obj = namespace[name]
+        except KeyError:
+            # Listed in ``__all__``, but not defined.
+            continue
+
+        if isinstance(obj, ModuleType):
+            # Only traverse modules of the same package that have a file;
+            # skips built-ins and namespace packages.
+            if (
+                config.recursive
+                and obj is not module
+                and in_package(obj.__name__, package)
+                and getattr(obj, "__file__", None) is not None
+            ):
+                members.append((name, obj, True))
+            continue
+
+        if config.module_local:
+            origin = getattr(obj, "__module__", None)
+            if isinstance(origin, str):
+                is_local = origins.get(origin)
+                if is_local is None:
+                    is_local = origins[origin] = in_package(origin, local)
+                if not is_local:
+                    # Imported from another package.
+                    continue
+        if predicate is not None and not predicate(name, obj):
+            continue
+        members.append((name, obj, False))
+
+    members.sort(key=_name)
+    return members
+
+
+def _name(member: Tuple[str, Any, bool]) -> str:
+    return member[0]
+
+
+class Traversal:
+    """Bookkeeping shared by all modules traversed by a single registration.
+
+    Each module is traversed once: a module reachable from several parents, or
+    already traversed into the same registry by an earlier registration,
+    shares a single subregistry, as long as the configuration matches.
+    A module referencing another module that is still being traversed, e.g.
+    two sibling modules importing each other, is a cycle; the reference shares
+    the subregistry still being populated, and is recorded.
+
+    Available as ``registry.__registry__.traversal`` after registering a module.
+
+    Attributes
+    ----------
+    visited: int
+        Number of modules traversed.
+    reused: int
+        Number of references to modules whose subregistry was shared instead of
+        traversing them again.
+    cycles: List[Tuple[str, str]]
+        ``(module, referenced module)`` names of references to modules that
+        were still being traversed.
+    """
+
+    def __init__(self, previous: Optional["Traversal"] = None):
+        self.visited = 0
+        self.reused = 0
+        self.cycles: List[Tuple[str, str]] = []
+        # ``id(module) -> (module, subregistry)``; shared with the previous
+        # registration into the same registry, so that each registration only
+        # adds the modules it traverses.
+        self._memo: Dict[int, Tuple[ModuleType, Any]] = (
+            {} if previous is None else previous._memo
+        )
+        self._active: Set[int] = set()
+
+    def lookup(self, module: ModuleType, config: RegistryConfig) -> Optional[Any]:
+        """Subregistry already populated from ``module`` with ``config``, if any."""
+        entry = self._memo.get(id(module))
+        if entry is None or entry[0] is not module:
+            return None
+        registry = entry[1]
+        record = registry.__registry__.sources.get(module.__name__)
+        if record is None or record.module is not module:
+            # Since unregistered or rolled back.
+            return None
+        other = registry.__registry__.config
+        if other is not config and other != config:
+            return None
+        self.reused += 1
+        return registry
+
+    def active(self, module: ModuleType) -> bool:
+        """Whether ``module`` is still being traversed."""
+        return id(module) in self._active
+
+    @contextmanager
+    def visit(self, module: ModuleType, registry):
+        # Memoized up front, so that cycles share ``registry``.
+        previous = self._memo.get(id(module))
+        self._memo[id(module)] = (module, registry)
+        outermost = not self._active
+        self._active.add(id(module))
+        self.visited += 1
+        try:
+            yield
+        finally:
+            self._active.discard(id(module))
+            if outermost:
+                # The registry a module is registered into directly may hold
+                # other entries too, so it's only shared within this traversal.
+                if previous is None:
+                    del self._memo[id(module)]
+                else:
+                    self._memo[id(module)] = previous
+
+    def __repr__(self):
+        return (
+            f"<Traversal: {self.visited} visited, {self.reused} reused, "
+            f"{len(self.cycles)} cycles>"
+        )
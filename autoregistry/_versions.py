@@ -0,0 +1,229 @@
+"""Versions of entries registered under a shared key, and constraints on them.
+"""
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, total_ordering
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from .exceptions import InvalidVersionError
+
+_VERSION = re.compile(r"(\d+(?:\.\d+)*)(?:-([0-9A-Za-z.-]+))?")
+_COMPARATOR = re.compile(r"(\^|~|>=|<=|==|!=|>|<|=)?\s*(\S+)")
+
+
+@total_ordering
+class Version:
+    """A version like ``2.3.1`` or ``3.0.0-rc.1``, ordered like semantic versions.
+
+    Missing release components are zero, so ``2`` equals ``2.0.0``.
+    Pre-releases order before their release.
+    """
+
+    __slots__ = ("text", "release", "pre", "_key")
+
+    def __init__(self, text: str):
+        match = _VERSION.fullmatch(text.strip())
+        if match is None:
+            raise InvalidVersionError(f'Invalid version "{text}".')
+        self.text = text.strip()
+        release = tuple(int(x) for x in match[1].split("."))
+        self.release = release + (0,) * (3 - len(release))
+        while len(self.release) > 3 and self.release[-1] == 0:
+            self.release = self.release[:-1]
+        self.pre: Tuple[Any, ...] = ()
+        if match[2]:
+            # Numeric identifiers order before alphanumeric ones.
+            self.pre = tuple(
+                (0, int(x), "") if x.isdigit() else (1, 0, x)
+                for x in match[2].split(".")
+            )
+        # Releases order after all of their pre-releases.
+        self._key = (self.release, not self.pre, self.pre)
+
+    @property
+    def prerelease(self) -> bool:
+        return bool(self.pre)
+
+    def __eq__(self, other):
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key == other._key
+
+    def __lt__(self, other):
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key < other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f'Version("{self.text}")'
+
+
+class Bound(NamedTuple):
+    version: Version
+    inclusive: bool
+
+
+class Constraint(NamedTuple):
+    """Intersection of comparators, e.g. ``>=2.1,<3``."""
+
+    lower: Optional[Bound]
+    upper: Optional[Bound]
+    excluded: Tuple[Version, ...]
+    # Pre-releases only satisfy constraints that mention one.
+    prerelease: bool
+
+    def admits(self, version: Version) -> bool:
+        if version.prerelease and not self.prerelease:
+            return False
+        if version in self.excluded:
+            return False
+        lower, upper = self.lower, self.upper
+        if lower is not None and (
+            version < lower.version
+            or (version == lower.version and not lower.inclusive)
+        ):
+            return False
+        return upper is None or not (
+            version > upper.version
+            or (version == upper.version and not upper.inclusive)
+        )
+
+
+def _bump(version: Version, index: int) -> Version:
+    release = list(version.release[: index + 1])
+    release[index] += 1
+    return Version(".".join(str(x) for x in release) + "-0")
+
+
+def _caret_upper(version: Version, given: int) -> Version:
+    # Allow changes that don't modify the left-most non-zero given component.
+    for index, part in enumerate(version.release[:given]):
+        if part != 0:
+            return _bump(version, index)
+    return _bump(version, given - 1)
+
+
+@lru_cache(maxsize=1024)
+def parse_constraint(spec: str) -> Constraint:
+    """Parse a version constraint.
+
+    Comparators are separated by commas or whitespace, and must all hold:
+
+    * ``2.3.1``, ``=2.3.1`` or ``==2.3.1``: exactly this version.
+    * ``!=2.3.1``: any version but this one.
+    * ``>=2.1``, ``>2.1``, ``<=3``, ``<3``: comparisons.
+    * ``^2.1``: compatible versions, ``>=2.1.0,<3.0.0``; for ``^0.2`` that
+      is ``>=0.2.0,<0.3.0``.
+    * ``~2.1``: patch-level changes, ``>=2.1.0,<2.2.0``; ``~2`` is ``^2``.
+    * ``*`` or empty: any version.
+
+    Raises
+    ------
+    InvalidVersionError
+        If ``spec`` can't be parsed.
+    """
+    lower: Optional[Bound] = None
+    upper: Optional[Bound] = None
+    excluded: List[Version] = []
+    prerelease = False
+
+    def raise_lower(bound: Bound):
+        nonlocal lower
+        if lower is None or (bound.version, not bound.inclusive) > (
+            lower.version,
+            not lower.inclusive,
+        ):
+            lower = bound
+
+    def lower_upper(bound: Bound):
+        nonlocal upper
+        if upper is None or (bound.version, bound.inclusive) < (
+            upper.version,
+            upper.inclusive,
+        ):
+            upper = bound
+
+    for comparator in spec.replace(",", " ").split():
+        if comparator == "*":
+            continue
+        match = _COMPARATOR.fullmatch(comparator)
+        if match is None:
+            raise InvalidVersionError(f'Invalid version constraint "{spec}".')
+        op, text = match[1] or "==", match[2]
+        version = Version(text)
+        prerelease |= version.prerelease
+        given = len(text.split("-")[0].split("."))
+        if op == "^":
+            raise_lower(Bound(version, True))
+            lower_upper(Bound(_caret_upper(version, min(given, 3)), False))
+        elif op == "~":
+            raise_lower(Bound(version, True))
+            lower_upper(Bound(_bump(version, min(given, 2) - 1), False))
+        elif op in ("==", "="):
+            raise_lower(Bound(version, True))
+            lower_upper(Bound(version, True))
+        elif op == "!=":
+            excluded.append(version)
+        elif op == ">=":
+            raise_lower(Bound(version, True))
+        elif op == ">":
+            raise_lower(Bound(version, False))
+        elif op == "<=":
+            lower_upper(Bound(version, True))
+        else:
+            lower_upper(Bound(version, False))
+    return Constraint(lower, upper, tuple(excluded), prerelease)
+
+
+class VersionIndex(NamedTuple):
+    """Versions registered under a single key, sorted in ascending order.
+
+    Immutable; :meth:`insert` returns an updated copy.
+    """
+
+    versions: Tuple[Version, ...] = ()
+    objs: Tuple[Any, ...] = ()
+
+    def insert(self, version: Version, obj: Any) -> "VersionIndex":
+        """Copy with ``obj`` registered as ``version``, replacing any existing one."""
+        i = bisect_left(self.versions, version)
+        end = i + 1 if i < len(self.versions) and self.versions[i] == version else i
+        return VersionIndex(
+            self.versions[:i] + (version,) + self.versions[end:],
+            self.objs[:i] + (obj,) + self.objs[end:],
+        )
+
+    def get(self, version: Version, default: Any = None) -> Any:
+        i = bisect_left(self.versions, version)
+        if i < len(self.versions) and self.versions[i] == version:
+            return self.objs[i]
+        return default
+
+    def resolve(self, constraint: Constraint, default: Any = None) -> Any:
+        """Object of the highest version satisfying ``constraint``."""
+        versions = self.versions
+        lo, hi = 0, len(versions)
+        # Narrow down to the bounded range, then scan down from its top.
+        if constraint.lower is not None:
+            bisect = bisect_left if constraint.lower.inclusive else bisect_right
+            lo = bisect(versions, constraint.lower.version)
+        if constraint.upper is not None:
+            bisect = bisect_right if constraint.upper.inclusive else bisect_left
+            hi = bisect(versions, constraint.upper.version)
+        for i in range(hi - 1, lo - 1, -1):
+            if constraint.admits(versions[i]):
+                return self.objs[i]
+        return default
+
+    def latest(self) -> Any:
+        """Object of the highest release, or highest pre-release if there's none."""
+        for version, obj in zip(reversed(self.versions), reversed(self.objs)):
+            if not version.prerelease:
+                return obj
+        return self.objs[-1]
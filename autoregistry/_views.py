@@ -0,0 +1,149 @@
+"""Live, filtered, set-like views over registries.
+"""
+from collections.abc import Set
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from ._lazy import LazyEntry
+
+Filter = Callable[[str, Any], bool]
+
+
+class RegistryView(Set):
+    """Live, set-like view of the keys of a registry, optionally filtered.
+
+    Nothing is copied; iteration and membership tests read the registry
+    directly, so a view always reflects the registry's current contents.
+    Views are created via ``registry.view(...)`` and may be narrowed further
+    via :meth:`filter`.
+
+    .. code-block:: python
+
+        plugins = Registry.view(prefix="io_")
+        readers = plugins.filter(base=Reader)
+
+        assert "io_csv" in readers
+        len(readers)  # Cached until the registry is modified.
+    """
+
+    def __init__(
+        self,
+        registry,
+        filters: Tuple[Filter, ...] = (),
+        key_filters: Tuple[Callable[[str], bool], ...] = (),
+    ):
+        self._registry = registry
+        # Filters of objects; lazy entries are imported before being filtered.
+        self._filters = filters
+        # Filters of keys only, which don't import lazy entries.
+        self._key_filters = key_filters
+        self._count = 0
+        self._count_version = -1
+
+    def filter(
+        self,
+        prefix: Optional[str] = None,
+        base: Optional[type] = None,
+        predicate: Optional[Filter] = None,
+    ) -> "RegistryView":
+        """Create a narrower view; all given conditions must hold.
+
+        Parameters
+        ----------
+        prefix: Optional[str]
+            Only keys starting with ``prefix``.
+        base: Optional[type]
+            Only classes that are subclasses of ``base``.
+        predicate: Optional[Callable[[str, Any], bool]]
+            Only entries for which ``predicate(key, obj)`` is truthy.
+        """
+        filters = list(self._filters)
+        key_filters = list(self._key_filters)
+        if prefix is not None:
+            if not self._registry.config.case_sensitive:
+                prefix = prefix.lower()
+            key_filters.append(lambda key: key.startswith(prefix))
+        if base is not None:
+            filters.append(lambda key, obj: _is_subclass(obj, base))
+        if predicate is not None:
+            filters.append(predicate)
+        return type(self)(self._registry, tuple(filters), tuple(key_filters))
+
+    def _match(self, key: str, obj: Any) -> bool:
+        if not all(f(key) for f in self._key_filters):
+            return False
+        if not self._filters:
+            return True
+        if type(obj) is LazyEntry:
+            # Filters always see the imported object, whichever way the entry
+            # is accessed.
+            obj = self._registry._materialize(key, obj)
+        return all(f(key, obj) for f in self._filters)
+
+    def _lookup(self, key: str, load: bool = True) -> Any:
+        """Get the object for ``key`` if it is in this view, else ``self``."""
+        if not isinstance(key, str) or "." in key or "/" in key:
+            # Views only contain direct entries.
+            return self
+        registry = self._registry
+        if not registry.config.case_sensitive:
+            key = key.lower()
+        obj = registry.resolve(key, self, load)
+        if obj is self or not self._match(key, obj):
+            return self
+        return obj
+
+    def __contains__(self, key) -> bool:
+        return self._lookup(key, load=False) is not self
+
+    def __getitem__(self, key: str) -> Any:
+        obj = self._lookup(key)
+        if obj is self:
+            raise KeyError(key)
+        return obj
+
+    def get(self, key: str, default=None) -> Any:
+        obj = self._lookup(key)
+        return default if obj is self else obj
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self._iter_matching():
+            yield key
+
+    def _iter_matching(self) -> Iterator[Tuple[str, Any]]:
+        # Lazy entries are only imported if a filter needs the object.
+        if not self._filters and not self._key_filters:
+            yield from self._registry.iter_entries()
+            return
+        for key, obj in self._registry.iter_entries():
+            if self._match(key, obj):
+                yield key, obj
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        registry = self._registry
+        for key, obj in self._iter_matching():
+            if type(obj) is LazyEntry:
+                obj = registry._materialize(key, obj)
+            yield key, obj
+
+    def values(self) -> Iterator[Any]:
+        for _, obj in self.items():
+            yield obj
+
+    def __len__(self) -> int:
+        if self._count_version != self._registry._version:
+            self._count = sum(1 for _ in self._iter_matching())
+            # Read after counting, which may import lazy entries.
+            self._count_version = self._registry._version
+        return self._count
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # Results of set operations (``&``, ``|``, ``-``) are plain sets.
+        return set(it)
+
+    def __repr__(self):
+        return f"<RegistryView: {list(self)}>"
+
+
+def _is_subclass(obj: Any, base: type) -> bool:
+    return isinstance(obj, type) and issubclass(obj, base)
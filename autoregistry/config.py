@@ -1,10 +1,10 @@
 import dataclasses
 import re
 from dataclasses import asdict, dataclass
-from typing import Callable, Optional
+from typing import Any, Callable, Optional, Tuple, Union
 
 from .exceptions import InvalidNameError
-from .regex import hyphenate, key_split, to_snake_case
+from .regex import hyphenate, to_snake_case
 
 
 @dataclass
@@ -40,6 +40,34 @@ class RegistryConfig:
     # Redirect vanilla methods that would collide with the dict-like interface.
     redirect: bool = True
 
+    # ``create`` drops keyword arguments the target doesn't accept, instead of raising.
+    filter_kwargs: bool = False
+
+    # Intern keys and share configs with subregistries to reduce memory.
+    compact: bool = False
+
+    # Store aliases once in a hierarchy-wide table instead of in every registry.
+    shared_aliases: bool = False
+
+    # Remember up to this many recently missed keys; 0 disables.
+    negative_cache: int = 0
+
+    # Fraction of ``call``s whose latency is measured for ``call_stats``; 0 disables.
+    call_sample_rate: float = 0.0
+
+    # Module traversal: only register names listed in a module's ``__all__``.
+    module_all: bool = False
+
+    # Module traversal: skip objects imported from outside the traversed package.
+    module_local: bool = False
+
+    # Module traversal: glob patterns that attribute names must (not) match.
+    module_include: Union[str, Tuple[str, ...]] = ()
+    module_exclude: Union[str, Tuple[str, ...]] = ()
+
+    # Module traversal: only register attributes for which ``f(name, obj)`` is true.
+    module_filter: Optional[Callable[[str, Any], bool]] = None
+
     def __post_init__(self):
         if self.regex:
             self._regex_validator = re.compile(self.regex)
@@ -58,15 +86,6 @@ class RegistryConfig:
             if hasattr(self, key):
                 setattr(self, key, value)
 
-    def getitem(self, registry: dict, key: str):
-        keys = key_split(key)
-        for key in keys:
-            if not self.case_sensitive:
-                key = key.lower()
-
-            registry = registry[key]
-        return registry
-
     def format(self, name: str) -> str:
         """Convert and validate a function or class name to a registry key.
 
@@ -6,6 +6,10 @@ class InvalidNameError(RegistryError):
     """Registered object has an invalid name."""
 
 
+class InvalidVersionError(RegistryError):
+    """Invalid version or version constraint."""
+
+
 class CannotDeriveNameError(RegistryError):
     """Cannot derive registry name from object."""
 
@@ -18,6 +22,10 @@ class ModuleAliasError(RegistryError):
     """Cannot assign aliases when recursively traversing a module."""
 
 
+class InvalidPipelineError(RegistryError):
+    """Pipeline stages are invalid or not registered."""
+
+
 class CannotRegisterPythonBuiltInError(RegistryError):
     """AutoRegistry doesn't work with python built-ins."""
 
@@ -0,0 +1,22 @@
+"""Pytest helpers for code that defines or registers to registries.
+
+Enable the fixtures in a ``conftest.py``:
+
+.. code-block:: python
+
+    pytest_plugins = ["autoregistry.testing"]
+"""
+import pytest
+
+from ._checkpoint import checkpoint
+
+
+@pytest.fixture
+def registry_checkpoint():
+    """Roll back all registry changes made during the test.
+
+    Yields the :class:`~autoregistry.Checkpoint`, e.g. to roll back midway
+    through a test.
+    """
+    with checkpoint() as cp:
+        yield cp
@@ -0,0 +1,58 @@
+"""Memory and class-creation time of alias-heavy class hierarchies.
+
+Builds ``--width`` leaf classes under a chain of ``--depth`` intermediate classes,
+each leaf with ``--aliases`` aliases, with and without ``shared_aliases``.
+
+Usage::
+
+    python benchmarks/bench_aliases.py --depth 8 --width 1000 --aliases 8
+"""
+import argparse
+import time
+import tracemalloc
+
+from autoregistry import Registry
+
+
+def build(depth, width, n_aliases, **config):
+    class Root(Registry, **config):
+        pass
+
+    parent = Root
+    for d in range(depth - 1):
+        parent = type(parent)(f"Level{d}", (parent,), {})
+
+    for i in range(width):
+        aliases = [f"alias_{i}_{j}" for j in range(n_aliases)]
+        type(parent)(f"Leaf{i}", (parent,), {}, aliases=aliases)
+
+    return Root
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--aliases", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'mode':>8} {'MB':>8} {'create (ms)':>12} {'root keys':>10}")
+    for mode, config in [("default", {}), ("shared", {"shared_aliases": True})]:
+        # Time and memory are measured in separate runs; tracemalloc is slow.
+        t_start = time.perf_counter()
+        build(args.depth, args.width, args.aliases, **config)
+        elapsed = time.perf_counter() - t_start
+
+        tracemalloc.start()
+        root = build(args.depth, args.width, args.aliases, **config)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{mode:>8} {current / 2**20:>8.2f} {elapsed * 1000:>12.1f}"
+            f" {len(root.__registry__):>10}"
+        )
+        assert f"alias_0_{args.aliases - 1}" in root  # noqa: S101
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Dispatch-table calls: ``reg[key](...)`` versus ``reg.call(key, ...)``.
+
+Usage::
+
+    python benchmarks/bench_call.py --number 500000
+"""
+import argparse
+import timeit
+
+from autoregistry import Registry
+
+
+def make(**config):
+    registry = Registry(**config)
+
+    @registry
+    def normalize(x):
+        return x
+
+    return registry
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=500_000)
+    args = parser.parse_args()
+    number = args.number
+
+    plain = make()
+    sampled = make(call_sample_rate=0.01)
+    every = make(call_sample_rate=1.0)
+    fn = plain["normalize"]
+    cases = {
+        "direct function call": lambda: fn(1),
+        "reg[key](x)": lambda: plain["normalize"](1),
+        "reg.call(key, x)": lambda: plain.call("normalize", 1),
+        "reg.call, 1% sampled": lambda: sampled.call("normalize", 1),
+        "reg.call, all sampled": lambda: every.call("normalize", 1),
+    }
+
+    print(f"{'case':>22} {'ns/call':>8}")
+    for label, stmt in cases.items():
+        t = min(timeit.repeat(stmt, number=number, repeat=5)) / number
+        print(f"{label:>22} {t * 1e9:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
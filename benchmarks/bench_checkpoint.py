@@ -0,0 +1,78 @@
+"""Saving and restoring the state of a large class hierarchy.
+
+Builds a hierarchy of ``--classes`` classes, then repeatedly saves its state,
+defines ``--changes`` new subclasses and restores the saved state; once by
+copying every registry in the hierarchy, as test suites tend to do by hand,
+and once via :func:`autoregistry.checkpoint`.
+
+Usage::
+
+    python benchmarks/bench_checkpoint.py --classes 20000 --changes 10
+"""
+import argparse
+import copy
+import time
+
+import autoregistry
+from autoregistry import Registry
+
+
+def build(n: int, fan_out: int):
+    class Base(Registry):
+        pass
+
+    classes = [Base]
+    for i in range(1, n):
+        parent = classes[(i - 1) // fan_out]
+        classes.append(type(Base)(f"Class{i}", (parent,), {}))
+    return classes
+
+
+def define(classes, n: int):
+    for i in range(n):
+        type(classes[0])(f"New{i}", (classes[i % len(classes)],), {})
+
+
+def copy_restore(classes, changes: int):
+    registries = [vars(x)["__registry__"] for x in classes]
+    saved = [
+        (x, copy.deepcopy(dict(x)), copy.deepcopy(x.types))
+        for x in registries
+        if isinstance(x, dict)
+    ]
+    define(classes, changes)
+    for registry, entries, types in saved:
+        dict.clear(registry)
+        dict.update(registry, entries)
+        registry.types = types
+        registry._changed()
+
+
+def checkpoint_restore(classes, changes: int):
+    with autoregistry.checkpoint():
+        define(classes, changes)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--classes", type=int, default=20_000)
+    parser.add_argument("--fan-out", type=int, default=20)
+    parser.add_argument("--changes", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    classes = build(args.classes, args.fan_out)
+    expected = len(classes[0])
+    print(f"classes: {args.classes:,}, changes per round: {args.changes}")
+    for name, func in [("copy", copy_restore), ("checkpoint", checkpoint_restore)]:
+        t_start = time.perf_counter()
+        for _ in range(args.repeat):
+            func(classes, args.changes)
+        elapsed = (time.perf_counter() - t_start) / args.repeat
+        if len(classes[0]) != expected:
+            raise RuntimeError(f"{name} didn't restore the hierarchy.")
+        print(f"{name + ':':<12} {elapsed * 1e3:>10.2f} ms/round")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compare ``create()`` against filtering kwargs with ``inspect.signature`` per call.
+
+Usage::
+
+    python benchmarks/bench_create.py
+"""
+import inspect
+import timeit
+from dataclasses import dataclass
+
+from autoregistry import Registry
+
+
+class Model(Registry, filter_kwargs=True):
+    pass
+
+
+@dataclass
+class Linear(Model):
+    in_features: int
+    out_features: int
+    bias: bool = True
+
+
+CFG = {"type": "linear", "in_features": 16, "out_features": 32, "dropout": 0.1}
+
+
+def naive():
+    cls = Model[CFG["type"]]
+    params = inspect.signature(cls).parameters
+    return cls(**{k: v for k, v in CFG.items() if k in params})
+
+
+def create():
+    return Model.create(CFG["type"], **CFG)
+
+
+def main():
+    number = 100_000
+    for name, fn in [("inspect.signature", naive), ("create", create)]:
+        best = min(timeit.repeat(fn, number=number, repeat=5))
+        print(f"{name:>20}: {best / number * 1e6:.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
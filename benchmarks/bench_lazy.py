@@ -0,0 +1,79 @@
+"""Startup time of eagerly importing plugin modules versus lazy registration.
+
+Generates a package of plugin modules in a temporary directory, then times
+building a registry by importing every module versus declaring each entry via
+``register_lazy``, and the cost of the first and subsequent lookups.
+
+Usage::
+
+    python benchmarks/bench_lazy.py --modules 200
+"""
+import argparse
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from autoregistry import Registry
+
+# Stand-in for import-time work of a real plugin (parsing tables, compiling regexes).
+PLUGIN = """
+TABLE = {{i: str(i) * 8 for i in range(20_000)}}
+
+
+class Plugin{i}:
+    pass
+"""
+
+
+def make_package(root: Path, n: int, name: str):
+    pkg = root / name
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    for i in range(n):
+        (pkg / f"plugin_{i}.py").write_text(PLUGIN.format(i=i))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", type=int, default=200)
+    args = parser.parse_args()
+    n = args.modules
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+        make_package(Path(tmp), n, "eager_plugins")
+        make_package(Path(tmp), n, "lazy_plugins")
+        importlib.invalidate_caches()
+
+        t_start = time.perf_counter()
+        eager = Registry()
+        for i in range(n):
+            module = importlib.import_module(f"eager_plugins.plugin_{i}")
+            eager(getattr(module, f"Plugin{i}"), name=f"plugin_{i}")
+        t_eager = time.perf_counter() - t_start
+
+        t_start = time.perf_counter()
+        lazy = Registry()
+        for i in range(n):
+            lazy.register_lazy(f"plugin_{i}", f"lazy_plugins.plugin_{i}:Plugin{i}")
+        t_lazy = time.perf_counter() - t_start
+
+        t_start = time.perf_counter()
+        lazy["plugin_0"]
+        t_first = time.perf_counter() - t_start
+
+        t_start = time.perf_counter()
+        for _ in range(10_000):
+            lazy["plugin_0"]
+        t_hit = (time.perf_counter() - t_start) / 10_000
+
+    print(f"eager startup:      {t_eager * 1000:>9.2f} ms")
+    print(f"lazy startup:       {t_lazy * 1000:>9.2f} ms")
+    print(f"lazy first lookup:  {t_first * 1000:>9.2f} ms")
+    print(f"lazy later lookups: {t_hit * 1e9:>9.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Memory per class of large, mostly-leaf class hierarchies.
+
+Builds a hierarchy of ``--classes`` classes in which 5% are intermediate
+classes with subclasses, and the rest are leaves. Reports the memory allocated
+per leaf in total, and the part of it allocated by autoregistry itself.
+Leaf registries are only allocated once accessed; ``--touch`` accesses
+every leaf's ``__registry__`` to show the cost without that deferral.
+
+Usage::
+
+    python benchmarks/bench_leaf_memory.py --classes 40000
+"""
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+import autoregistry
+from autoregistry import Registry
+
+PACKAGE_DIR = str(Path(autoregistry.__file__).parent)
+
+
+def build(n: int, leaf_fraction: float):
+    class Base(Registry, recursive=False):
+        pass
+
+    n_groups = max(1, round(n * (1 - leaf_fraction)))
+    groups = [type(Base)(f"Group{i}", (Base,), {}) for i in range(n_groups)]
+    leaves = [
+        type(Base)(f"Leaf{i}", (groups[i % n_groups],), {}) for i in range(n - n_groups)
+    ]
+    return Base, groups, leaves
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--classes", type=int, default=40_000)
+    parser.add_argument("--leaf-fraction", type=float, default=0.95)
+    parser.add_argument("--touch", action="store_true")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    t_start = time.perf_counter()
+    base, groups, leaves = build(args.classes, args.leaf_fraction)
+    if args.touch:
+        for leaf in leaves:
+            leaf.__registry__
+    elapsed = time.perf_counter() - t_start
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    total = sum(x.size for x in snapshot.statistics("filename"))
+    ours = sum(
+        x.size
+        for x in snapshot.statistics("filename")
+        if x.traceback[0].filename.startswith(PACKAGE_DIR)
+    )
+    n = args.classes
+    print(f"classes: {n:,} ({len(leaves):,} leaves), built in {elapsed:.2f}s")
+    print(f"bytes/class:          {total / n:>8.0f}")
+    print(f"bytes/class (ours):   {ours / n:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
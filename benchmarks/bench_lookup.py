@@ -0,0 +1,60 @@
+"""Hit and miss latency of ``in`` and ``get``, with and without a negative cache.
+
+Usage::
+
+    python benchmarks/bench_lookup.py --entries 1000
+"""
+import argparse
+import timeit
+
+from autoregistry import Registry
+
+
+def make(n, **config):
+    registry = Registry(**config)
+    for i in range(n):
+
+        def f():
+            pass
+
+        registry(f, name=f"flag_{i}")
+    nested = Registry(**config)
+    registry(nested, name="nested")
+    return registry
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+    number = args.number
+
+    cases = {
+        "hit": "Flag_0",
+        "miss": "Flag_missing",
+        "dotted miss": "Nested.Flag_missing",
+    }
+    configs = {"default": {}, "negative_cache": {"negative_cache": 1024}}
+
+    print(f"{'config':>14} {'case':>12} {'in (ns)':>8} {'get (ns)':>9}")
+    for label, config in configs.items():
+        registry = make(args.entries, **config)
+        for case, key in cases.items():
+
+            def contains(key=key, registry=registry):
+                return key in registry
+
+            def get(key=key, registry=registry):
+                return registry.get(key)
+
+            t_in = min(timeit.repeat(contains, number=number, repeat=5))
+            t_get = min(timeit.repeat(get, number=number, repeat=5))
+            print(
+                f"{label:>14} {case:>12} {t_in / number * 1e9:>8.1f}"
+                f" {t_get / number * 1e9:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Mapping a registered function over a large input on thread and process pools.
+
+Usage::
+
+    python benchmarks/bench_map.py --items 20000 --workers 4
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from autoregistry import Registry
+
+registry = Registry()
+
+
+@registry
+def normalize(x):
+    # Stand-in for CPU-bound work.
+    total = 0
+    for i in range(200):
+        total += (x * i) % 7
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    data = range(args.items)
+
+    def run(label, **kwargs):
+        t_start = time.perf_counter()
+        for _ in registry.map("normalize", data, **kwargs):
+            pass
+        elapsed = time.perf_counter() - t_start
+        print(f"{label:>28} {elapsed * 1000:>9.1f} ms")
+
+    t_start = time.perf_counter()
+    for x in data:
+        registry["normalize"](x)
+    elapsed = time.perf_counter() - t_start
+    print(f"{'loop over reg[key](x)':>28} {elapsed * 1000:>9.1f} ms")
+
+    run("serial")
+    with ThreadPoolExecutor(args.workers) as executor:
+        run("threads, chunksize=256", executor=executor, chunksize=256)
+    with ProcessPoolExecutor(args.workers) as executor:
+        # Warm up worker processes.
+        list(registry.map("normalize", range(args.workers), executor=executor))
+        for chunksize in (1, 64, 1024):
+            label = f"processes, chunksize={chunksize}"
+            run(label, executor=executor, chunksize=chunksize)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Memory per entry and lookup latency of large decorator registries.
+
+Compares the default storage against ``compact=True`` for 10k to 1M keys.
+Function names are interned, as they are for functions defined in source code.
+
+Usage::
+
+    python benchmarks/bench_memory_scaling.py
+"""
+import argparse
+import sys
+import timeit
+import tracemalloc
+
+from autoregistry import Registry
+
+
+def make_functions(n):
+    functions = []
+    for i in range(n):
+
+        def op():
+            pass
+
+        op.__name__ = sys.intern(f"op_{i}")
+        functions.append(op)
+    return functions
+
+
+def measure(n, functions, **config):
+    tracemalloc.start()
+    registry = Registry(**config)
+    for f in functions:
+        registry(f)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    keys = [f"op_{i}" for i in range(0, n, max(1, n // 1000))]
+    number = 100
+    elapsed = min(
+        timeit.repeat(lambda: [registry[k] for k in keys], number=number, repeat=5)
+    )
+    latency_ns = elapsed / (number * len(keys)) * 1e9
+    return current / n, latency_ns
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'keys':>10} {'mode':>8} {'bytes/entry':>12} {'lookup (ns)':>12}")
+    for n in args.sizes:
+        functions = make_functions(n)
+        for mode, config in [("default", {}), ("compact", {"compact": True})]:
+            per_entry, latency_ns = measure(n, functions, **config)
+            print(f"{n:>10,} {mode:>8} {per_entry:>12.1f} {latency_ns:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Per-tenant overlays versus copying a large base registry.
+
+Memory is measured after every tenant looked up ``--lookups`` keys of the base,
+so caches built by lookups are included.
+
+Usage::
+
+    python benchmarks/bench_overlay.py --entries 100000 --tenants 50
+"""
+import argparse
+import time
+import timeit
+import tracemalloc
+
+from autoregistry import OverlayRegistry, Registry
+
+
+def make_base(n):
+    base = Registry()
+    for i in range(n):
+
+        def f():
+            pass
+
+        base(f, name=f"op_{i}")
+    return base
+
+
+def override(tenant, i):
+    def f():
+        pass
+
+    tenant(f, name=f"op_{i}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--overrides", type=int, default=5)
+    parser.add_argument("--lookups", type=int, default=100)
+    args = parser.parse_args()
+
+    base = make_base(args.entries)
+    strategies = {
+        "copy": lambda: base.union(Registry(), policy="replace"),
+        "overlay": lambda: OverlayRegistry(base, overwrite=True),
+    }
+
+    print(f"{'strategy':>8} {'MB':>8} {'build (ms)':>11} {'lookup (ns)':>12}")
+    for label, make in strategies.items():
+        tracemalloc.start()
+        t_start = time.perf_counter()
+        tenants = []
+        for _ in range(args.tenants):
+            tenant = make()
+            tenant.__registry__.config.overwrite = True
+            for i in range(args.overrides):
+                override(tenant, i)
+            tenants.append(tenant)
+        elapsed = time.perf_counter() - t_start
+        for tenant in tenants:
+            for i in range(args.lookups):
+                tenant[f"op_{args.entries - 1 - i}"]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        tenant = tenants[0]
+        tenant["op_0"]  # Warm any caches.
+        number = 100_000
+        key = f"op_{args.entries - 1}"
+        latency = min(
+            timeit.repeat(
+                lambda tenant=tenant, key=key: tenant[key], number=number, repeat=5
+            )
+        )
+        print(
+            f"{label:>8} {current / 2**20:>8.2f} {elapsed * 1000:>11.1f}"
+            f" {latency / number * 1e9:>12.1f}"
+        )
+
+    number = 100_000
+    latency = min(timeit.repeat(lambda: base[key], number=number, repeat=5))
+    print(f"{'base':>8} {'':>8} {'':>11} {latency / number * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
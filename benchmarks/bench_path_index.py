@@ -0,0 +1,64 @@
+"""Dotted-path lookups: flattened path index versus the per-level walk.
+
+Usage::
+
+    python benchmarks/bench_path_index.py --number 200000
+"""
+import argparse
+import timeit
+
+from autoregistry import Registry
+from autoregistry.regex import key_split
+
+
+def walk_path(registry, key):
+    """Reference per-level walk, as done before paths were indexed."""
+    for part in key_split(key):
+        registry = registry[part.lower()]
+    return registry
+
+
+def make_nested(depth):
+    root = Registry()
+    registry = root
+    for i in range(depth - 1):
+        child = Registry()
+        registry(child, name=f"level{i}")
+        registry = child
+
+    @registry
+    def leaf():
+        pass
+
+    path = ".".join([f"level{i}" for i in range(depth - 1)] + ["leaf"])
+    return root, path
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+    number = args.number
+
+    print(f"{'depth':>5} {'walk (ns)':>10} {'indexed (ns)':>13} {'speedup':>8}")
+    for depth in range(2, 9):
+        root, path = make_nested(depth)
+        storage = root.__registry__
+
+        def walk(storage=storage, path=path):
+            return walk_path(storage, path)
+
+        def indexed(root=root, path=path):
+            return root[path]
+
+        indexed()  # Populate the index.
+        t_walk = min(timeit.repeat(walk, number=number, repeat=5)) / number
+        t_index = min(timeit.repeat(indexed, number=number, repeat=5)) / number
+        print(
+            f"{depth:>5} {t_walk * 1e9:>10.1f} {t_index * 1e9:>13.1f}"
+            f" {t_walk / t_index:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
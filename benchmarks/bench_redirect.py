@@ -0,0 +1,64 @@
+"""Class-level access to registry methods, with and without redirection.
+
+With ``redirect=True``, a user-defined ``get`` is wrapped in a descriptor that
+dispatches between the registry method (class access) and the user method
+(instance access).
+
+Usage::
+
+    python benchmarks/bench_redirect.py --number 500000
+"""
+import argparse
+import timeit
+
+from autoregistry import Registry
+
+
+class Plain(Registry):
+    pass
+
+
+class Redirected(Registry):
+    def get(self, key, default=None):
+        return default
+
+
+class NotRedirected(Registry, redirect=False):
+    pass
+
+
+class Handler(Plain):
+    pass
+
+
+class RedirectedHandler(Redirected):
+    pass
+
+
+class NotRedirectedHandler(NotRedirected):
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=500_000)
+    args = parser.parse_args()
+    number = args.number
+
+    instance = RedirectedHandler()
+    cases = {
+        "plain class.get": lambda: Plain.get("handler"),
+        "redirected class.get": lambda: Redirected.get("redirectedhandler"),
+        "redirect=False class.get": lambda: NotRedirected.get("notredirectedhandler"),
+        "redirected attribute only": lambda: Redirected.get,
+        "redirected instance.get": lambda: instance.get("foo"),
+    }
+
+    print(f"{'case':>26} {'ns/call':>8}")
+    for label, stmt in cases.items():
+        t = min(timeit.repeat(stmt, number=number, repeat=5)) / number
+        print(f"{label:>26} {t * 1e9:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Cost of ``stats()`` on large hierarchies, e.g. when polled by a metrics endpoint.
+
+Usage::
+
+    python benchmarks/bench_stats.py --classes 40000
+"""
+import argparse
+import timeit
+
+from autoregistry import Registry
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--classes", type=int, default=40_000)
+    parser.add_argument("--groups", type=int, default=2_000)
+    args = parser.parse_args()
+
+    class Base(Registry):
+        pass
+
+    groups = [type(Base)(f"Group{i}", (Base,), {}) for i in range(args.groups)]
+    for i in range(args.classes - args.groups):
+        type(Base)(f"Leaf{i}", (groups[i % args.groups],), {})
+
+    stats = Base.stats()
+    number = 5
+    elapsed = min(timeit.repeat(Base.stats, number=number, repeat=3)) / number
+    print(
+        f"registries: {len(stats.registries):,} ({stats.lazy:,} lazy), "
+        f"max depth {stats.max_depth}, ~{stats.bytes / 1e6:.1f}MB"
+    )
+    print(f"stats(): {elapsed * 1e3:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Throughput of ``stream()`` on large record streams.
+
+Records are generated on the fly, so memory use should stay flat
+regardless of ``--records``. The baseline resolves each record one at a time,
+filtering keyword arguments with ``inspect.signature``.
+Pools only pay off when construction is expensive or releases the GIL;
+for these trivial dataclasses they mostly measure scheduling overhead.
+
+Usage::
+
+    python benchmarks/bench_stream.py --records 2000000
+"""
+import argparse
+import inspect
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from autoregistry import Registry
+
+
+@dataclass
+class Component(Registry, filter_kwargs=True):
+    name: str
+    size: int = 0
+
+
+class Reader(Component):
+    pass
+
+
+class Writer(Component):
+    pass
+
+
+class Parser(Component):
+    pass
+
+
+TYPES = ["reader", "writer", "parser"]
+
+
+def records(n):
+    for i in range(n):
+        yield {"type": TYPES[i % 3], "name": "component", "size": i, "unused": None}
+
+
+def naive(n):
+    for record in records(n):
+        cls = Component[record["type"]]
+        params = inspect.signature(cls).parameters
+        yield cls(**{k: v for k, v in record.items() if k in params})
+
+
+def run(label, it, n):
+    t_start = time.perf_counter()
+    count = sum(1 for _ in it)
+    elapsed = time.perf_counter() - t_start
+    assert count == n  # noqa: S101
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{label:>28}: {n / elapsed:>12,.0f} records/s  (max RSS {max_rss_mb:.0f} MB)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Also benchmark a process pool (slow for cheap constructors).",
+    )
+    args = parser.parse_args()
+    n = args.records
+
+    run("per-record lookup", naive(n), n)
+    run("stream (serial)", Component.stream(records(n)), n)
+    with ThreadPoolExecutor(args.workers) as executor:
+        run(
+            f"stream (threads={args.workers})",
+            Component.stream(records(n), executor=executor, max_in_flight=1024),
+            n,
+        )
+    if args.processes:
+        with ProcessPoolExecutor(args.workers) as executor:
+            run(
+                f"stream (processes={args.workers})",
+                Component.stream(records(n), executor=executor, max_in_flight=1024),
+                n,
+            )
+
+
+if __name__ == "__main__":
+    main()
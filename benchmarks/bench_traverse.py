@@ -0,0 +1,96 @@
+"""Time to register a large generated package by traversing its modules.
+
+Each module defines ``--attrs`` functions and classes, re-exports names
+imported from the standard library, and imports ``--shared`` utility modules of
+the same package, as real packages commonly do. Compares the default traversal
+against ``module_local=True`` and ``module_all=True``.
+Each utility module is only traversed once, however many modules import it.
+
+Usage::
+
+    python benchmarks/bench_traverse.py --modules 200 --attrs 200 --shared 5
+"""
+import argparse
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from autoregistry import Registry
+
+IMPORTS = """\
+import collections
+import json
+import os
+from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache, partial, reduce, wraps
+from itertools import chain, islice, product, repeat
+from os.path import basename, dirname, exists, join, splitext
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+"""
+
+
+def make_package(root: Path, name: str, n_modules: int, n_attrs: int, n_shared: int):
+    pkg = root / name
+    pkg.mkdir()
+    init = [IMPORTS]
+    shared = []
+    for k in range(n_shared):
+        (pkg / f"util_{k}.py").write_text(
+            "\n".join(f"def util_{j}():\n    pass\n" for j in range(n_attrs))
+        )
+        shared.append(f"from . import util_{k}\n")
+    for i in range(n_modules):
+        lines = [IMPORTS, *shared]
+        names = []
+        for j in range(n_attrs):
+            if j % 2:
+                lines.append(f"def func_{j}():\n    pass\n")
+                names.append(f"func_{j}")
+            else:
+                lines.append(f"class Class{j}:\n    pass\n")
+                names.append(f"Class{j}")
+        lines.append(f"__all__ = {names!r}\n")
+        (pkg / f"mod_{i}.py").write_text("\n".join(lines))
+        init.append(f"from . import mod_{i}\n")
+    (pkg / "__init__.py").write_text("\n".join(init))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", type=int, default=200)
+    parser.add_argument("--attrs", type=int, default=200)
+    parser.add_argument("--shared", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        make_package(Path(tmp), "bench_pkg", args.modules, args.attrs, args.shared)
+        sys.path.insert(0, tmp)
+        importlib.invalidate_caches()
+        package = importlib.import_module("bench_pkg")
+
+        for label, config in [
+            ("default", {}),
+            ("module_local", {"module_local": True}),
+            ("module_all", {"module_all": True}),
+        ]:
+            try:
+                Registry(**config)
+            except TypeError:
+                # Option not supported by this version.
+                continue
+            elapsed = []
+            for _ in range(args.repeat):
+                t_start = time.perf_counter()
+                registry = Registry(package, **config)
+                elapsed.append(time.perf_counter() - t_start)
+            keys = sum(len(registry[f"mod_{i}"]) for i in range(args.modules))
+            traversal = getattr(registry.__registry__, "traversal", None)
+            visited = f", {traversal.visited:,} modules" if traversal else ""
+            print(f"{label:>14}: {min(elapsed) * 1e3:8.1f}ms, {keys:,} keys{visited}")
+
+
+if __name__ == "__main__":
+    main()
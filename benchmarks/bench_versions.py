@@ -0,0 +1,75 @@
+"""Lookups of versioned entries.
+
+Registers ``--versions`` versions under each of ``--keys`` keys, then looks up
+``key@^N`` constraints; once resolved against the sorted per-key index with
+the result cache cleared before every lookup, once with the cache, and once by
+the common workaround of encoding versions into key names and filtering all
+keys at lookup.
+
+Usage::
+
+    python benchmarks/bench_versions.py --keys 1000 --versions 50
+"""
+import argparse
+import random
+import time
+
+from autoregistry import Registry
+from autoregistry._versions import Version, parse_constraint
+
+
+def timed(func, keys):
+    t_start = time.perf_counter()
+    for key in keys:
+        func(key)
+    return (time.perf_counter() - t_start) / len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=1_000)
+    parser.add_argument("--versions", type=int, default=50)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+
+    versioned = Registry()
+    encoded = Registry()
+    for i in range(args.keys):
+        for j in range(args.versions):
+            version = f"{j % 5}.{j // 5}.0"
+            versioned(object(), name=f"key{i}", version=version)
+            encoded(object(), name=f"key{i}-{version.replace('.', '_')}")
+
+    rng = random.Random(0)
+    lookups = [
+        (f"key{rng.randrange(args.keys)}", f"^{rng.randrange(5)}")
+        for _ in range(args.lookups)
+    ]
+    keys = [f"{name}@{spec}" for name, spec in lookups]
+    registry = versioned.__registry__
+
+    def uncached(key):
+        registry._resolved_versions.clear()
+        return versioned[key]
+
+    def by_name(key):
+        name, _, spec = key.partition("@")
+        constraint = parse_constraint(spec)
+        best = None
+        for candidate in encoded:
+            prefix, _, version = candidate.rpartition("-")
+            if prefix != name:
+                continue
+            version = Version(version.replace("_", "."))
+            if constraint.admits(version) and (best is None or version > best[0]):
+                best = (version, candidate)
+        return encoded[best[1]]
+
+    print(f"keys: {args.keys:,}, versions per key: {args.versions}")
+    print(f"index:         {timed(uncached, keys) * 1e6:>10.2f} us/lookup")
+    print(f"index, cached: {timed(versioned.__getitem__, keys) * 1e6:>10.2f} us/lookup")
+    print(f"encoded names: {timed(by_name, keys[:200]) * 1e6:>10.2f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
+import importlib
+import sys
 from abc import abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 from autoregistry import Registry
@@ -41,3 +44,25 @@ def construct_functions(**kwargs):
         return x
 
     return registry, foo, bar
+
+
+@contextmanager
+def write_modules(tmp_path, monkeypatch, files):
+    """Write ``{relative path: source}`` under ``tmp_path`` and make it importable.
+
+    On exit, all modules imported from ``tmp_path`` are removed from
+    ``sys.modules``, including ones written by the test itself.
+    """
+    for path, text in files.items():
+        file = tmp_path / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(text)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    try:
+        yield tmp_path
+    finally:
+        root = str(tmp_path)
+        for name, module in list(sys.modules.items()):
+            if (getattr(module, "__file__", None) or "").startswith(root):
+                del sys.modules[name]
@@ -0,0 +1,75 @@
+import pytest
+from common import construct_functions
+
+from autoregistry import Registry
+
+
+def test_call():
+    registry, foo, bar = construct_functions()
+    assert registry.call("foo", 1) == 1
+    assert registry.call("BAR", x=2) == 2
+    assert registry.call("foo://ignored", 3) == 3
+    assert registry.__registry__._calls == {
+        "foo": foo,
+        "BAR": bar,
+        "foo://ignored": foo,
+    }
+    assert registry.call_stats() == {}
+
+    with pytest.raises(KeyError):
+        registry.call("baz")
+
+
+def test_call_cache_invalidated():
+    registry, foo, bar = construct_functions(overwrite=True)
+    assert registry.call("foo", 1) == 1
+
+    @registry(name="foo")
+    def foo2(x):
+        return -x
+
+    assert registry.call("foo", 1) == -1
+
+
+def test_call_nested():
+    inner, foo, bar = construct_functions(overwrite=True)
+    registry = Registry()
+    registry(inner, name="inner")
+    assert registry.call("inner.foo", 1) == 1
+
+    @inner(name="foo")
+    def foo2(x):
+        return -x
+
+    assert registry.call("inner.foo", 1) == -1
+
+
+def test_call_stats():
+    registry, foo, bar = construct_functions(call_sample_rate=0.5)
+
+    @registry
+    def fail():
+        raise ValueError
+
+    for i in range(10):
+        registry.call("foo", i)
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            registry.call("fail")
+
+    stats = registry.call_stats()
+    assert set(stats) == {"foo", "fail"}
+    assert stats["foo"].calls == 10
+    assert stats["foo"].errors == 0
+    assert stats["foo"].sampled == 5
+    assert len(stats["foo"].samples) == 5
+    assert stats["foo"].mean > 0
+    assert stats["foo"].total_time == pytest.approx(stats["foo"].mean * 10)
+    assert 0 < stats["foo"].percentile(50) <= stats["foo"].percentile(99)
+    assert stats["fail"].calls == 3
+    assert stats["fail"].errors == 3
+
+
+def test_call_sample_rate_invalid():
+    with pytest.raises(ValueError):
+        Registry(call_sample_rate=2)
@@ -0,0 +1,131 @@
+import pytest
+
+import autoregistry
+from autoregistry import Registry, checkpoint, rollback
+from autoregistry.testing import registry_checkpoint  # noqa: F401
+
+
+@pytest.fixture
+def pokemon():
+    class Pokemon(Registry, shared_aliases=True):
+        pass
+
+    class Pikachu(Pokemon, aliases=["pika"]):
+        pass
+
+    class Charmander(Pokemon):
+        pass
+
+    return Pokemon
+
+
+def test_checkpoint_rollback_register(pokemon):
+    keys = list(pokemon)
+    cp = checkpoint()
+
+    class Squirtle(pokemon, aliases=["squirt"]):
+        pass
+
+    class Wartortle(Squirtle):
+        pass
+
+    assert "wartortle" in pokemon
+    assert cp.changes > 0
+
+    rollback(cp)
+    assert list(pokemon) == keys
+    assert "squirt" not in pokemon
+    assert cp.changes == 0
+    cp.commit()
+    assert autoregistry._checkpoint.journal is None
+
+
+def test_checkpoint_rollback_preserves_order(pokemon):
+    keys = list(pokemon)
+    with checkpoint():
+        pokemon.__registry__.unregister("pika")
+        pokemon.__registry__.unregister("pikachu")
+        pokemon.clear()
+        assert list(pokemon) == []
+    assert list(pokemon) == keys
+    assert pokemon["pika"] is pokemon["pikachu"]
+
+
+def test_checkpoint_context_manager_commit(pokemon):
+    with checkpoint() as cp:
+
+        class Squirtle(pokemon):
+            pass
+
+        cp.commit()
+    assert not cp.active
+    assert "squirtle" in pokemon
+
+
+def test_checkpoint_nested(pokemon):
+    keys = list(pokemon)
+    with checkpoint() as outer:
+
+        class Squirtle(pokemon):
+            pass
+
+        inner = checkpoint()
+
+        class Bulbasaur(pokemon):
+            pass
+
+        inner.rollback()
+        assert list(pokemon.__registry__) == ["pikachu", "charmander", "squirtle"]
+
+        class Eevee(pokemon):
+            pass
+
+        outer.rollback()
+        assert not inner.active
+        with pytest.raises(RuntimeError):
+            inner.rollback()
+        assert list(pokemon) == keys
+
+
+def test_checkpoint_rollback_invalidates_caches(pokemon):
+    overlay = autoregistry.OverlayRegistry(pokemon)
+    assert "pikachu" in overlay
+    with checkpoint():
+
+        class Squirtle(pokemon):
+            pass
+
+        assert pokemon.get("squirtle") is Squirtle
+        assert "squirtle" in overlay
+    assert pokemon.get("squirtle") is None
+    assert "squirtle" not in overlay
+
+
+def test_checkpoint_events(pokemon):
+    events = []
+    pokemon.subscribe(events.append)
+    with checkpoint():
+
+        class Squirtle(pokemon):
+            pass
+
+        del events[:]
+    assert [(x.kind, x.key) for x in events] == [("unregister", "squirtle")]
+
+
+def test_checkpoint_module(pokemon):
+    from tests import fake_module
+
+    registry = Registry()
+    with checkpoint():
+        registry(fake_module)
+        assert len(registry)
+    assert len(registry) == 0
+    assert not registry.__registry__.sources
+
+
+def test_registry_checkpoint_fixture(pokemon, registry_checkpoint):  # noqa: F811
+    class Squirtle(pokemon):
+        pass
+
+    assert registry_checkpoint.changes > 0
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 from common import construct_pokemon_classes
 
@@ -266,6 +269,24 @@ def test_dict_methods_override():
     assert Base.some_staticmethod() == 2
 
 
+def test_dict_methods_override_bound_cache():
+    class Base(Registry):
+        def get(self, key, default=None):
+            return "instance"
+
+    class Foo(Base):
+        pass
+
+    # Class-level bound methods are cached per class.
+    assert Base.get is Base.get
+    assert Foo.get is Foo.get
+    assert Base.get is not Foo.get
+    assert Base.get("foo") is Foo
+    assert Foo.get("foo") is None
+
+    assert Foo().get("foo") == "instance"
+
+
 def test_dict_methods_override_classmethod():
     class Base(Registry):
         def __init__(self):
@@ -313,6 +334,33 @@ def test_dict_methods_override_redirect_false():
     assert base.keys() == 0
 
 
+def test_dict_attribute_not_redirected():
+    class Base(Registry):
+        stats = {"a": 1}
+
+    class Foo(Base):
+        pass
+
+    assert Base.stats == {"a": 1}
+    assert Base().stats == {"a": 1}
+    assert list(Base) == ["foo"]
+
+
+def test_dict_method_redirect_doesnt_keep_class_alive():
+    class Base(Registry):
+        def get(self):
+            return 0
+
+    class Temporary(Base, skip=True):
+        pass
+
+    assert Temporary.get("foo") is None
+    ref = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert ref() is None
+
+
 def test_dict_method_override_getitem():
     class Base(Registry):
         def __getitem__(self, key):
@@ -405,3 +453,54 @@ def test_dict_method_override_clear():
     assert Base.clear() is None  # pyright: ignore[reportGeneralTypeIssues]
     base = Base()
     assert base.clear() == 5
+
+
+def test_leaf_registry_allocated_on_access():
+    class Base(Registry, suffix="Pokemon"):
+        pass
+
+    class PikachuPokemon(Base):
+        pass
+
+    assert "__registry__" in vars(PikachuPokemon)
+    assert not isinstance(vars(PikachuPokemon)["__registry__"], type(Base.__registry__))
+    assert list(Base) == ["pikachu"]
+    assert repr(PikachuPokemon) == "<PikachuPokemon: []>"
+
+    registry = PikachuPokemon.__registry__
+    assert vars(PikachuPokemon)["__registry__"] is registry
+    assert registry.name == "pikachu"
+    assert registry.cls is PikachuPokemon
+    assert registry.config == Base.__registry__.config
+    assert registry.config is not Base.__registry__.config
+    assert PikachuPokemon().__registry__ is registry
+
+
+def test_leaf_registry_subclass():
+    class Base(Registry):
+        pass
+
+    class Pokemon(Base):
+        pass
+
+    class Pikachu(Pokemon):
+        pass
+
+    assert list(Pokemon) == ["pikachu"]
+    assert list(Base) == ["pokemon", "pikachu"]
+    assert not list(Pikachu)
+
+
+def test_leaf_registry_init_subclass():
+    names = []
+
+    class Base(Registry):
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            names.append(cls.__registry__.name)
+
+    class Pikachu(Base):
+        pass
+
+    assert names == ["pikachu"]
+    assert Base["pikachu"] is Pikachu
@@ -33,6 +33,18 @@ def test_prefix_no_strip():
             pass
 
 
+def test_prefix_skip_still_validated():
+    class Sensor(Registry, prefix="Sensor"):
+        pass
+
+    with pytest.raises(InvalidNameError):
+
+        class Helper(Sensor, skip=True):
+            pass
+
+    assert not list(Sensor)
+
+
 def test_prefix_yes_strip():
     class Sensor(Registry, prefix="Sensor"):
         pass
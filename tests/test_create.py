@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+
+import pytest
+from common import construct_pokemon_classes
+
+from autoregistry import Registry
+from autoregistry._create import BindingPlan
+
+
+def test_create_class():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    charmander = Pokemon.create("charmander", level=1, hp=2)
+    assert isinstance(charmander, Charmander)
+    assert charmander.level == 1
+    assert charmander.hp == 2
+
+    surfing_pikachu = Pokemon.create("pikachu.surfingpikachu", level=3, hp=4)
+    assert isinstance(surfing_pikachu, SurfingPikachu)
+
+
+def test_create_strict():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+
+    with pytest.raises(TypeError, match="Unexpected"):
+        Pokemon.create("charmander", type="charmander", level=1, hp=2)
+
+    with pytest.raises(TypeError, match="Missing"):
+        Pokemon.create("charmander", level=1)
+
+
+def test_create_filter_kwargs():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes(
+        filter_kwargs=True
+    )
+    cfg = {"type": "charmander", "level": 1, "hp": 2}
+    charmander = Pokemon.create(cfg["type"], **cfg)
+    assert isinstance(charmander, Charmander)
+
+    with pytest.raises(TypeError, match="Missing"):
+        Pokemon.create("charmander", type="charmander", level=1)
+
+
+def test_create_function():
+    registry = Registry(filter_kwargs=True)
+
+    @registry
+    def foo(a, b=2, *, c):
+        return a, b, c
+
+    @registry
+    def bar(a, **kwargs):
+        return a, kwargs
+
+    assert registry.create("foo", a=1, c=3, d=4) == (1, 2, 3)
+    assert registry.create("bar", a=1, d=4) == (1, {"d": 4})
+
+
+def test_create_plan_cached():
+    registry = Registry()
+
+    @registry
+    def foo(a):
+        return a
+
+    registry.create("foo", a=1)
+    plan = registry.__registry__._plans[foo]
+    registry.create("foo", a=2)
+    assert registry.__registry__._plans[foo] is plan
+
+    # Invalidated on registration.
+    @registry
+    def bar():
+        pass
+
+    assert foo not in registry.__registry__._plans
+
+
+def test_binding_plan_compile():
+    @dataclass
+    class Foo:
+        a: int
+        b: int = 0
+
+    plan = BindingPlan.compile(Foo)
+    assert plan.accepted == {"a", "b"}
+    assert plan.required == ("a",)
+    assert not plan.var_keyword
+
+    def bar(x, /, y, *args, z=1, **kwargs):
+        pass
+
+    plan = BindingPlan.compile(bar)
+    assert plan.accepted == {"y", "z"}
+    assert plan.required == ("y",)
+    assert plan.var_keyword
@@ -0,0 +1,160 @@
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from functools import singledispatch
+
+import pytest
+
+from autoregistry import KeyCollisionError, OverlayRegistry, Registry
+
+
+def test_dispatch_classes():
+    class Handler(Registry):
+        pass
+
+    class IntHandler(Handler, types=int):
+        pass
+
+    class StrHandler(Handler, types=[str, bytes]):
+        pass
+
+    assert Handler.dispatch(5) is IntHandler
+    assert Handler.dispatch("foo") is StrHandler
+    assert Handler.dispatch(b"foo") is StrHandler
+    assert Handler[int] is IntHandler
+
+    # Name-based lookups are unaffected.
+    assert Handler["inthandler"] is IntHandler
+
+    with pytest.raises(KeyError):
+        Handler.dispatch(1.0)
+    assert float not in Handler
+    assert int in Handler
+
+
+def test_dispatch_mro():
+    class Handler(Registry):
+        pass
+
+    class IntHandler(Handler, types=int):
+        pass
+
+    assert Handler.dispatch(True) is IntHandler
+
+    class BoolHandler(Handler, types=bool):
+        pass
+
+    # Cache is invalidated on registration.
+    assert Handler.dispatch(True) is BoolHandler
+    assert Handler.dispatch(1) is IntHandler
+
+
+def test_dispatch_abc():
+    registry = Registry()
+
+    @registry(types=Mapping)
+    def handle_mapping(x):
+        return "mapping"
+
+    @registry(types=Sequence)
+    def handle_sequence(x):
+        return "sequence"
+
+    assert registry.dispatch({})({}) == "mapping"
+    assert registry.dispatch([1, 2]) is handle_sequence
+    assert registry[tuple] is handle_sequence
+    assert registry.get(set) is None
+
+
+def test_dispatch_abc_over_object():
+    class Handler(Registry):
+        pass
+
+    class Fallback(Handler, types=object):
+        pass
+
+    class MappingHandler(Handler, types=Mapping):
+        pass
+
+    @singledispatch
+    def reference(payload):
+        return Fallback
+
+    reference.register(Mapping, lambda payload: MappingHandler)
+
+    for payload in [{}, OrderedDict(), [], 1]:
+        assert Handler.dispatch(payload) is reference(payload)
+    assert Handler.dispatch({}) is MappingHandler
+    assert OverlayRegistry(Handler).dispatch({}) is MappingHandler
+
+
+def test_dispatch_hierarchy():
+    class Handler(Registry):
+        pass
+
+    class NumberHandler(Handler):
+        pass
+
+    class FloatHandler(NumberHandler, types=float):
+        pass
+
+    assert Handler.dispatch(1.0) is FloatHandler
+    assert NumberHandler.dispatch(1.0) is FloatHandler
+    with pytest.raises(KeyError):
+        FloatHandler.dispatch(1.0)
+
+
+def test_dispatch_hierarchy_not_recursive():
+    class Handler(Registry, recursive=False):
+        pass
+
+    class NumberHandler(Handler):
+        pass
+
+    class FloatHandler(NumberHandler, types=float):
+        pass
+
+    assert NumberHandler.dispatch(1.0) is FloatHandler
+    assert float not in Handler
+
+
+def test_dispatch_collision():
+    registry = Registry()
+
+    @registry(types=int)
+    def foo(x):
+        pass
+
+    with pytest.raises(KeyCollisionError):
+
+        @registry(types=int)
+        def bar(x):
+            pass
+
+
+def test_dispatch_overwrite():
+    registry = Registry(overwrite=True)
+
+    @registry(types=int)
+    def foo(x):
+        pass
+
+    assert registry.dispatch(1) is foo
+
+    @registry(types=int)
+    def bar(x):
+        pass
+
+    assert registry.dispatch(1) is bar
+
+
+def test_dispatch_unregister():
+    registry = Registry()
+
+    @registry(types=int)
+    def foo(x):
+        pass
+
+    assert registry.dispatch(1) is foo
+    registry.__registry__.unregister("foo")
+    with pytest.raises(KeyError):
+        registry.dispatch(1)
@@ -0,0 +1,130 @@
+import pytest
+from common import construct_pokemon_classes
+
+from autoregistry import Registry
+
+
+def test_events_register_and_alias():
+    registry = Registry()
+    events = []
+    registry.subscribe(events.append)
+
+    @registry(aliases="baz")
+    def foo():
+        pass
+
+    assert [(e.kind, e.key, e.obj) for e in events] == [
+        ("register", "foo", foo),
+        ("alias", "baz", foo),
+    ]
+    assert events[0].registry is registry.__registry__
+
+
+def test_events_overwrite():
+    registry = Registry(overwrite=True)
+    events = []
+
+    @registry
+    def foo():
+        pass
+
+    old_foo = foo
+    registry.subscribe(events.append)
+
+    @registry
+    def foo():  # noqa: F811
+        pass
+
+    assert len(events) == 1
+    assert events[0].kind == "overwrite"
+    assert events[0].obj is foo
+    assert events[0].old is old_foo
+
+
+def test_events_unregister_and_clear():
+    registry = Registry()
+
+    @registry
+    def foo():
+        pass
+
+    events = []
+    registry.subscribe(events.append)
+    registry.__registry__.unregister("foo")
+    registry.clear()
+
+    assert [(e.kind, e.key) for e in events] == [("unregister", "foo"), ("clear", None)]
+
+
+def test_events_hierarchy():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    pokemon_events, pikachu_events = [], []
+    Pokemon.subscribe(pokemon_events.append)
+    Pikachu.subscribe(pikachu_events.append)
+
+    class RaichuPikachu(Pikachu):
+        pass
+
+    assert [e.key for e in pokemon_events] == ["raichupikachu"]
+    assert [e.key for e in pikachu_events] == ["raichupikachu"]
+    assert pokemon_events[0].registry is Pokemon.__registry__
+    assert pikachu_events[0].registry is Pikachu.__registry__
+
+
+def test_events_batch():
+    import fake_module
+
+    registry = Registry()
+    batches = []
+    registry.subscribe(batches.append, batch=True)
+
+    @registry
+    def foo():
+        pass
+
+    assert len(batches) == 1
+    assert [e.key for e in batches[0]] == ["foo"]
+
+    registry(fake_module)
+    assert len(batches) == 2
+    assert [e.key for e in batches[1]] == list(registry)[1:]
+
+
+def test_events_batch_manual():
+    registry = Registry()
+    batches, singles = [], []
+    registry.subscribe(batches.append, batch=True)
+    registry.subscribe(singles.append)
+
+    with registry.__registry__.batch():
+
+        @registry
+        def foo():
+            pass
+
+        @registry
+        def bar():
+            pass
+
+        assert batches == []
+        assert len(singles) == 2
+
+    assert len(batches) == 1
+    assert [e.key for e in batches[0]] == ["foo", "bar"]
+
+
+def test_events_unsubscribe():
+    registry = Registry()
+    events = []
+    registry.subscribe(events.append)
+    registry.unsubscribe(events.append)
+    assert registry.__registry__._events is None
+
+    @registry
+    def foo():
+        pass
+
+    assert events == []
+
+    with pytest.raises(ValueError):
+        registry.unsubscribe(events.append)
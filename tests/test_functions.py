@@ -1,8 +1,13 @@
+import importlib
+import sys
+from types import ModuleType
+
 import pytest
-from common import construct_functions
+from common import construct_functions, write_modules
 
 import autoregistry
 from autoregistry import Registry
+from autoregistry._registry import _is_lazy
 from autoregistry.exceptions import ModuleAliasError
 from tests.fake_module import fake_submodule_1
 
@@ -197,3 +202,84 @@ def test_registry_module_alias():
     registry = Registry(fake_module)
     with pytest.raises(ModuleAliasError):
         registry(fake_module, aliases="module_alias")
+
+
+@pytest.fixture
+def overlapping_package(tmp_path, monkeypatch):
+    """Package whose modules import a shared module, and each other."""
+    files = {
+        "overlapping/__init__.py": "from . import a, b, common\n",
+        "overlapping/common.py": "def shared():\n    pass\n",
+        "overlapping/a.py": (
+            "from . import common\n"
+            "\n"
+            "def foo():\n"
+            "    pass\n"
+            "\n"
+            "from . import b\n"
+        ),
+        "overlapping/b.py": "from . import a, common\n\ndef bar():\n    pass\n",
+    }
+    with write_modules(tmp_path, monkeypatch, files):
+        yield importlib.import_module("overlapping")
+
+
+def test_registry_module_shared_subregistries(overlapping_package):
+    registry = Registry(overlapping_package)
+
+    assert registry["a"]["common"] is registry["common"]
+    assert registry["b"]["common"] is registry["common"]
+    assert registry["a"]["b"] is registry["b"]
+    assert registry["a.b.bar"] is overlapping_package.b.bar
+
+    traversal = registry.__registry__.traversal
+    assert traversal.visited == 4
+    assert traversal.reused == 4
+    # ``b`` references ``a`` while ``a`` is still being traversed.
+    assert traversal.cycles == [("overlapping.b", "overlapping.a")]
+    assert registry["b"]["a"] is registry["a"]
+    assert registry["b.a.foo"] is overlapping_package.a.foo
+
+
+def test_registry_module_cycle_setops(overlapping_package):
+    registry = Registry(overlapping_package)
+    copy = Registry()
+    copy.merge(registry)
+    assert copy["a"] is not registry["a"]
+    assert copy["b"]["a"] is copy["a"]
+    assert not registry.diff(Registry(overlapping_package))
+    assert registry.intersection(copy)["b.a.foo"] is overlapping_package.a.foo
+
+
+def test_registry_module_shared_across_registrations(overlapping_package):
+    registry = Registry(overwrite=True)
+    registry(overlapping_package.a)
+    common = registry["common"]
+
+    registry(overlapping_package.b)
+    assert registry["common"] is common
+    assert registry["a.common"] is common
+    # ``b`` and ``a``; ``common`` isn't traversed again.
+    assert registry.__registry__.traversal.visited == 2
+
+    # Not shared between registries with different configurations.
+    other = Registry(case_sensitive=True)
+    other(overlapping_package)
+    assert other["common"] is not common
+
+
+def test_registry_module_keeps_leaf_registries_lazy(overlapping_package):
+    class Shape(Registry):
+        pass
+
+    class Circle(Shape):
+        pass
+
+    module = ModuleType("shapes")
+    module.__file__ = __file__
+    vars(module).update(Shape=Shape, Circle=Circle)
+
+    registry = Registry()
+    registry(module)
+    registry(overlapping_package.common)
+    assert _is_lazy(Circle)
@@ -1,4 +1,9 @@
+import importlib
+import sys
+import threading
+
 import pytest
+from common import write_modules
 
 from autoregistry import Registry
 from autoregistry.exceptions import InvalidNameError, KeyCollisionError
@@ -218,3 +223,175 @@ def test_module_non_recursive():
     registry = Registry(recursive=False)
     registry(fake_module)
     assert list(registry) == ["bar2", "foo2"]
+
+
+@pytest.fixture
+def reexporting_package(tmp_path, monkeypatch):
+    """Package that re-exports objects from its own and from other packages."""
+    files = {
+        "reexporting/__init__.py": (
+            "from collections import OrderedDict\n"
+            "from os.path import join\n"
+            "\n"
+            "from . import codecs\n"
+            "from .codecs import Gzip\n"
+            "\n"
+            "__all__ = ['Gzip', 'codecs', 'join', 'missing']\n"
+        ),
+        "reexporting/codecs.py": (
+            "from json import dumps\n"
+            "\n"
+            "import reexporting_extra\n"
+            "\n"
+            "class Gzip:\n"
+            "    pass\n"
+            "\n"
+            "class Zstd:\n"
+            "    pass\n"
+            "\n"
+            "def helper():\n"
+            "    pass\n"
+        ),
+        # Shares a name prefix, but isn't part of the package.
+        "reexporting_extra.py": "def extra():\n    pass\n",
+    }
+    with write_modules(tmp_path, monkeypatch, files):
+        yield importlib.import_module("reexporting")
+
+
+def test_module_defaults_reexports(reexporting_package):
+    registry = Registry(reexporting_package)
+    assert list(registry) == ["Gzip", "OrderedDict", "codecs", "join"]
+    assert list(registry["codecs"]) == ["Gzip", "Zstd", "dumps", "helper"]
+
+
+def test_module_all(reexporting_package):
+    registry = Registry(reexporting_package, module_all=True)
+    assert list(registry) == ["Gzip", "codecs", "join"]
+
+
+def test_module_local(reexporting_package):
+    registry = Registry(reexporting_package, module_local=True)
+    assert list(registry) == ["Gzip", "codecs"]
+    assert list(registry["codecs"]) == ["Gzip", "Zstd", "helper"]
+
+
+def test_module_include_exclude(reexporting_package):
+    registry = Registry(reexporting_package, module_include=["codecs", "G*"])
+    assert list(registry) == ["Gzip", "codecs"]
+    assert list(registry["codecs"]) == ["Gzip"]
+
+    registry = Registry(reexporting_package, module_exclude="[A-Z]*")
+    assert list(registry) == ["codecs", "join"]
+    assert list(registry["codecs"]) == ["dumps", "helper"]
+
+
+def test_module_filter(reexporting_package):
+    registry = Registry(
+        reexporting_package, module_filter=lambda name, obj: isinstance(obj, type)
+    )
+    assert list(registry) == ["Gzip", "OrderedDict", "codecs"]
+    assert list(registry["codecs"]) == ["Gzip", "Zstd"]
+
+
+def test_decorator_compact():
+    import fake_module
+
+    registry = Registry(compact=True)
+
+    def make(name):
+        def f():
+            pass
+
+        f.__name__ = "".join(["F", name])  # Build a non-interned string.
+        return f
+
+    registry(make("oo"))
+    registry(make("ox"), aliases="".join(["b", "ox"]))
+    key = next(iter(registry))
+    assert key == "foo"
+    assert key is sys.intern("foo")
+    assert list(registry.keys())[-1] is sys.intern("box")
+
+    registry(fake_module)
+    assert registry["fake_module_1"].__registry__.config is registry.__registry__.config
+    assert registry["fake_module_1.foo1"] is fake_module.fake_module_1.foo1
+
+
+def test_decorator_negative_cache():
+    import fake_module
+
+    registry = Registry(negative_cache=2)
+
+    @registry
+    def foo():
+        pass
+
+    assert "bar" not in registry
+    assert registry.get("BAR") is None
+    assert "fake_module.missing" not in registry
+    assert list(registry.__registry__._misses) == ["bar", "fake_module.missing"]
+
+    # Registering invalidates remembered misses.
+    @registry
+    def bar():
+        pass
+
+    assert registry.__registry__._misses == {}
+    assert registry["bar"] is bar
+    assert registry.get("baz", "foo") is foo
+
+    # So do changes to nested registries along a missed path.
+    registry(fake_module)
+    assert "fake_module_1.missing" not in registry
+    assert registry.__registry__._misses
+
+    @registry["fake_module_1"]
+    def missing():
+        pass
+
+    assert registry.__registry__._misses == {}
+    assert registry["fake_module_1.missing"] is missing
+
+
+def test_decorator_negative_cache_threads():
+    # A single slot makes threads race to evict the same key.
+    registry = Registry(negative_cache=1)
+    errors = []
+    barrier = threading.Barrier(8)
+
+    def miss(i):
+        barrier.wait()
+        try:
+            for j in range(20_000):
+                assert f"missing_{i}_{j}" not in registry
+        except Exception as e:
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=miss, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert len(registry.__registry__._misses) <= 1 + 8
+
+
+def test_decorator_nested_case_insensitive():
+    outer = Registry(case_sensitive=True)
+    inner = Registry(case_sensitive=False)
+
+    @inner
+    def foo():
+        pass
+
+    outer(inner, name="Inner")
+    assert outer["Inner.Foo"] is foo
+    assert outer["Inner.FOO"] is foo
+    assert "inner.foo" not in outer
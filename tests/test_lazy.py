@@ -0,0 +1,219 @@
+import importlib
+import sys
+import threading
+
+import pytest
+from common import write_modules
+
+from autoregistry import KeyCollisionError, LazyEntry, Registry
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    """Create an on-disk package that is not imported yet."""
+    files = {
+        "lazy_plugins/__init__.py": "",
+        "lazy_plugins/readers.py": (
+            "IMPORTS = []\n"
+            "IMPORTS.append(1)\n"
+            "\n"
+            "class ParquetReader:\n"
+            "    def __init__(self, path):\n"
+            "        self.path = path\n"
+            "\n"
+            "    class Options:\n"
+            "        pass\n"
+        ),
+        "lazy_plugins/pokemon.py": (
+            "from lazy_pokemon_base import Pokemon\n"
+            "\n"
+            "class Pikachu(Pokemon):\n"
+            "    pass\n"
+        ),
+    }
+    with write_modules(tmp_path, monkeypatch, files):
+        yield tmp_path / "lazy_plugins"
+
+
+def test_lazy_entry_invalid_target():
+    with pytest.raises(ValueError):
+        LazyEntry("lazy_plugins.readers.ParquetReader")
+
+
+def test_register_lazy(lazy_package):
+    registry = Registry()
+    registry.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+    registry.register_lazy("options", "lazy_plugins.readers:ParquetReader.Options")
+
+    # Neither iteration nor membership imports.
+    assert list(registry) == ["parquet", "options"]
+    assert list(registry.keys()) == ["parquet", "options"]
+    assert "parquet" in registry
+    assert "lazy_plugins.readers" not in sys.modules
+
+    reader = registry.create("parquet", path="a.parquet")
+    module = sys.modules["lazy_plugins.readers"]
+    assert isinstance(reader, module.ParquetReader)
+    assert registry["parquet"] is module.ParquetReader
+    assert registry.get("options") is module.ParquetReader.Options
+    assert len(module.IMPORTS) == 1
+
+    # The placeholder was replaced.
+    assert dict.get(registry.__registry__, "parquet") is module.ParquetReader
+
+
+def test_register_lazy_nested(lazy_package):
+    inner = Registry()
+    inner.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+    outer = Registry()
+    outer(inner, name="inner")
+
+    # Membership of a dotted path doesn't import either.
+    assert "inner.parquet" in outer
+    assert "lazy_plugins.readers" not in sys.modules
+
+    module = importlib.import_module("lazy_plugins.readers")
+    assert outer["inner.parquet"] is module.ParquetReader
+    assert dict.get(inner.__registry__, "parquet") is module.ParquetReader
+
+
+def test_register_lazy_values(lazy_package):
+    registry = Registry()
+    registry.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+    module = importlib.import_module("lazy_plugins.readers")
+    assert list(registry.values()) == [module.ParquetReader]
+
+
+def test_register_lazy_threaded(lazy_package):
+    registry = Registry()
+    registry.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry["parquet"]))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    module = sys.modules["lazy_plugins.readers"]
+    assert results == [module.ParquetReader] * 8
+    assert len(module.IMPORTS) == 1
+
+
+def test_register_lazy_import_error(lazy_package):
+    registry = Registry()
+    registry.register_lazy("missing", "lazy_plugins.missing:Missing")
+    with pytest.raises(ImportError):
+        registry["missing"]
+    # The placeholder remains, and is retried on the next access.
+    assert "missing" in registry
+
+
+def test_register_lazy_collision(lazy_package):
+    registry = Registry()
+    registry.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+    with pytest.raises(KeyCollisionError):
+        registry.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+
+
+def test_register_lazy_class(lazy_package):
+    (lazy_package.parent / "lazy_pokemon_base.py").write_text(
+        "from autoregistry import Registry\n"
+        "\n"
+        "class Pokemon(Registry):\n"
+        "    pass\n"
+        "\n"
+        "class Electric(Pokemon):\n"
+        "    pass\n"
+    )
+    from lazy_pokemon_base import Electric, Pokemon
+
+    Electric.register_lazy("pikachu", "lazy_plugins.pokemon:Pikachu")
+    assert list(Pokemon) == ["electric", "pikachu"]
+    assert "lazy_plugins.pokemon" not in sys.modules
+
+    # Importing the module replaces the placeholder in all registries.
+    Pikachu = Electric["pikachu"]
+    assert Pikachu.__name__ == "Pikachu"
+    assert Pokemon["pikachu"] is Pikachu
+    assert dict.get(Pokemon.__registry__, "pikachu") is Pikachu
+
+
+def test_prewarm(lazy_package):
+    registry = Registry()
+    registry.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+    registry.register_lazy("options", "lazy_plugins.readers:ParquetReader.Options")
+    registry.register_lazy("missing", "lazy_plugins.missing:Missing")
+
+    @registry
+    def eager():
+        pass
+
+    calls = []
+    with registry.prewarm(
+        order=["missing", "options"],
+        max_workers=1,
+        callback=lambda key, seconds: calls.append((key, seconds is None)),
+    ) as prewarmer:
+        pass
+
+    assert prewarmer.done()
+    assert prewarmer.progress == 1.0
+    assert prewarmer.total == 3
+    assert prewarmer.elapsed is not None
+    assert calls == [("missing", True), ("options", False), ("parquet", False)]
+    assert set(prewarmer.timings) == {"options", "parquet"}
+    assert isinstance(prewarmer.errors["missing"], ImportError)
+
+    module = sys.modules["lazy_plugins.readers"]
+    assert dict.get(registry.__registry__, "parquet") is module.ParquetReader
+    assert len(module.IMPORTS) == 1
+
+
+def test_prewarm_nothing_pending():
+    registry = Registry()
+    prewarmer = registry.prewarm()
+    assert prewarmer.wait(timeout=1)
+    assert prewarmer.total == 0
+    assert prewarmer.progress == 1.0
+
+
+def test_register_lazy_merge(lazy_package):
+    source = Registry()
+    source.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+    target = Registry()
+    target.merge(source)
+
+    module = importlib.import_module("lazy_plugins.readers")
+    assert list(target.values()) == [module.ParquetReader]
+    assert dict(target.items()) == {"parquet": module.ParquetReader}
+
+
+def test_register_lazy_view(lazy_package):
+    registry = Registry()
+    registry.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+    registry("not a class", name="csv")
+
+    # Prefix filters don't import.
+    assert "parquet" in registry.view(prefix="par")
+    assert "lazy_plugins.readers" not in sys.modules
+
+    classes = registry.view(predicate=lambda key, obj: isinstance(obj, type))
+    assert len(classes) == 1
+    assert "parquet" in classes
+    module = sys.modules["lazy_plugins.readers"]
+    assert classes.get("parquet") is module.ParquetReader
+    assert len(classes) == len(list(classes)) == 1
+
+
+def test_register_lazy_view_count(lazy_package):
+    registry = Registry()
+    registry.register_lazy("parquet", "lazy_plugins.readers:ParquetReader")
+    classes = registry.view(predicate=lambda key, obj: isinstance(obj, type))
+    assert len(classes) == 1
+
+    registry.__registry__.load()
+    assert len(classes) == len(list(classes)) == 1
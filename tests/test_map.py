@@ -0,0 +1,74 @@
+import importlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from common import construct_functions, write_modules
+
+from autoregistry import Registry
+
+
+@pytest.fixture
+def map_module(tmp_path, monkeypatch):
+    """Importable module with a module-level registry of unpicklable functions."""
+    source = (
+        "from autoregistry import Registry\n"
+        "\n"
+        "registry = Registry()\n"
+        'registry(lambda x: x * 2, name="double")\n'
+        'registry(lambda x: -x, name="negate")\n'
+        "\n"
+        "\n"
+        "@registry\n"
+        "def square(x):\n"
+        "    return x * x\n"
+        "\n"
+        "\n"
+        "class Shape(Registry):\n"
+        "    pass\n"
+    )
+    with write_modules(tmp_path, monkeypatch, {"map_plugins.py": source}):
+        yield importlib.import_module("map_plugins")
+
+
+def test_map_serial():
+    registry, foo, bar = construct_functions()
+    assert list(registry.map("foo", range(3))) == [0, 1, 2]
+    assert list(registry.map(["foo", "bar"], range(2))) == [(0, 0), (1, 1)]
+
+    with pytest.raises(KeyError):
+        registry.map("baz", range(3))
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_map_threads(chunksize):
+    registry = Registry()
+    registry(lambda x: x * 2, name="double")
+    with ThreadPoolExecutor(4) as executor:
+        results = registry.map(
+            "double", range(50), executor=executor, chunksize=chunksize
+        )
+        assert list(results) == [x * 2 for x in range(50)]
+
+
+def test_map_reference(map_module):
+    from autoregistry._map import registry_reference
+
+    assert registry_reference(map_module.registry) == "map_plugins:registry"
+
+    registry = Registry()
+    registry(lambda x: x, name="identity")
+    with pytest.raises(ValueError):
+        registry_reference(registry)
+    assert registry_reference(map_module.Shape) == "map_plugins:Shape"
+
+
+def test_map_processes(map_module):
+    registry = map_module.registry
+    with ProcessPoolExecutor(2) as executor:
+        results = registry.map(
+            ["double", "negate"], range(20), executor=executor, chunksize=4
+        )
+        assert list(results) == [(x * 2, -x) for x in range(20)]
+
+        results = registry.map("square", iter(range(10)), executor=executor)
+        assert list(results) == [x * x for x in range(10)]
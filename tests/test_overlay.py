@@ -0,0 +1,215 @@
+import gc
+import tracemalloc
+
+import pytest
+from common import construct_functions, construct_pokemon_classes
+
+from autoregistry import OverlayRegistry, Registry
+
+
+def test_overlay_basic():
+    base, foo, bar = construct_functions()
+    overlay = OverlayRegistry(base)
+
+    assert overlay["foo"] is foo
+    assert "bar" in overlay
+    assert list(overlay) == ["foo", "bar"]
+
+    @overlay(name="foo")
+    def tenant_foo():
+        pass
+
+    @overlay
+    def baz():
+        pass
+
+    assert overlay["foo"] is tenant_foo
+    assert overlay["baz"] is baz
+    assert len(overlay) == 3
+    assert dict(overlay.items()) == {"foo": tenant_foo, "bar": bar, "baz": baz}
+
+    # Only overrides are stored, and the base is untouched.
+    assert dict.keys(overlay.__registry__) == {"foo", "baz"}
+    assert base["foo"] is foo
+    assert "baz" not in base
+
+
+def test_overlay_parent_changes():
+    base, foo, bar = construct_functions(overwrite=True)
+    overlay = OverlayRegistry(base)
+
+    @overlay(name="bar")
+    def tenant_bar():
+        pass
+
+    assert list(overlay) == ["foo", "bar"]
+
+    @base
+    def baz():
+        pass
+
+    assert overlay["baz"] is baz
+
+    @base(name="bar")
+    def new_bar():
+        pass
+
+    assert overlay["bar"] is tenant_bar  # Still shadowed.
+
+    base.__registry__.unregister("foo")
+    assert "foo" not in overlay
+
+    base.clear()
+    assert list(overlay) == ["bar"]
+
+
+def test_overlay_priority():
+    a = Registry()
+    b = Registry()
+
+    @a(name="x")
+    def a_x():
+        pass
+
+    @b(name="x")
+    def b_x():
+        pass
+
+    @b(name="y")
+    def b_y():
+        pass
+
+    overlay = OverlayRegistry(a, b)
+    assert overlay["x"] is a_x
+    assert overlay["y"] is b_y
+
+
+def test_overlay_stacked():
+    base, foo, bar = construct_functions()
+    middle = OverlayRegistry(base)
+    top = OverlayRegistry(middle)
+    assert top["foo"] is foo
+
+    @middle(name="foo")
+    def middle_foo():
+        pass
+
+    assert top["foo"] is middle_foo
+
+    @base
+    def baz():
+        pass
+
+    assert top["baz"] is baz
+
+
+def test_overlay_classes():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    overlay = OverlayRegistry(Pokemon)
+    assert overlay["pikachu.surfingpikachu"] is SurfingPikachu
+    assert overlay.create("charmander", level=1, hp=2).level == 1
+
+    class Bulbasaur(Pokemon):
+        pass
+
+    assert overlay["bulbasaur"] is Bulbasaur
+
+
+def test_overlay_config():
+    base = Registry(case_sensitive=True)
+    overlay = OverlayRegistry(base, overwrite=True)
+    assert overlay.__registry__.config.case_sensitive
+    assert overlay.__registry__.config.overwrite
+    assert not base.__registry__.config.overwrite
+
+
+def test_overlay_garbage_collected():
+    base, foo, bar = construct_functions()
+    overlay = OverlayRegistry(base)
+    assert len(base.__registry__._events.subscribers) == 1
+    del overlay
+    gc.collect()
+
+    @base
+    def baz():
+        pass
+
+    assert base.__registry__._events is None
+
+    with pytest.raises(KeyError):
+        OverlayRegistry()["foo"]
+
+
+def test_overlay_parent_changes_invalidate_caches():
+    base = Registry(overwrite=True)
+    sub = Registry(overwrite=True)
+    base(sub, name="sub")
+    base(lambda: 1, name="foo")
+    base(int, name="x_int", types=int)
+    sub(1, name="x")
+    tenant = OverlayRegistry(base)
+
+    assert tenant.call("foo") == 1
+    assert tenant.get("sub.x") == 1
+    assert tenant[bool] is int
+
+    base(lambda: 2, name="foo")
+    sub(2, name="x")
+    base(bool, name="x_bool", types=bool)
+
+    assert tenant["foo"]() == 2
+    assert tenant.call("foo") == 2
+    assert tenant.get("sub.x") == 2
+    assert tenant["sub.x"] == 2
+    assert tenant[bool] is bool
+
+
+def test_overlay_lookups_agree():
+    base = Registry(case_sensitive=False)
+    base(len, name="foo")
+
+    tenant = OverlayRegistry(base)
+    assert tenant["FOO"] is tenant.get("FOO") is len
+    assert tenant["foo://bar"] is len
+    with pytest.raises(KeyError):
+        tenant["missing"]
+    assert tenant.get("missing") is None
+
+
+def test_overlay_dispatch_and_versions_fall_through():
+    base = Registry()
+    base(len, name="handler", types=int)
+    base("codec-1", name="codec", version="1.0")
+    base("codec-2", name="codec", version="2.0")
+    tenant = OverlayRegistry(base)
+
+    assert tenant[int] is len
+    assert tenant[bool] is len
+    assert tenant["codec@^1"] == "codec-1"
+    assert tenant.get("codec", version=">=2") == "codec-2"
+    assert "codec@^3" not in tenant
+
+    tenant(print, name="tenant_handler", types=bool)
+    tenant("tenant-codec-1", name="codec", version="1.5")
+    assert tenant[bool] is print
+    assert tenant[int] is len
+    assert tenant["codec@^1"] == "tenant-codec-1"
+    assert tenant["codec@^2"] == "codec-2"
+
+
+def test_overlay_lookups_dont_copy_parents():
+    base = Registry()
+    for i in range(20_000):
+        base(i, name=f"op_{i}")
+
+    tracemalloc.start()
+    try:
+        overlays = [OverlayRegistry(base) for _ in range(20)]
+        for overlay in overlays:
+            assert overlay["op_0"] == 0
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # A copy of the parent per overlay would take over 1 MB each.
+    assert current < 2**20
+    assert len(overlays[0]) == 20_000
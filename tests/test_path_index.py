@@ -0,0 +1,81 @@
+from common import construct_pokemon_classes
+
+from autoregistry import Registry
+
+
+def make_nested(depth):
+    root = Registry()
+    registry = root
+    for i in range(depth - 1):
+        child = Registry()
+        registry(child, name=f"level{i}")
+        registry = child
+
+    @registry
+    def leaf():
+        pass
+
+    path = ".".join([f"level{i}" for i in range(depth - 1)] + ["leaf"])
+    return root, registry, path, leaf
+
+
+def test_path_index_lookup():
+    root, _, path, leaf = make_nested(4)
+    assert root[path] is leaf
+    assert root[path.replace(".", "/")] is leaf
+    assert path in root
+    assert root.__registry__._paths == {path: leaf, path.replace(".", "/"): leaf}
+    # Indexed lookups hit the same object.
+    assert root[path] is leaf
+
+
+def test_path_index_missing():
+    root, _, path, _ = make_nested(3)
+    assert "level0.missing" not in root
+    assert root.get("level0.level1.missing") is None
+    assert "level0.missing" not in (root.__registry__._paths or {})
+
+
+def test_path_index_nested_change():
+    root, inner, path, leaf = make_nested(4)
+    assert root[path] is leaf
+    inner.__registry__.config.overwrite = True
+
+    @inner(name="leaf")
+    def replacement():
+        pass
+
+    assert root[path] is replacement
+
+    inner.__registry__.unregister("leaf")
+    assert path not in root
+
+
+def test_path_index_root_change():
+    root, _, path, leaf = make_nested(3)
+    assert root[path] is leaf
+    root.__registry__.unregister("level0")
+    assert path not in root
+
+
+def test_path_index_classes():
+    Pokemon, _, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    assert Pokemon["pikachu.surfingpikachu"] is SurfingPikachu
+    assert Pokemon["PIKACHU.SurfingPikachu"] is SurfingPikachu
+
+    Pikachu.__registry__.unregister("surfingpikachu")
+    assert "pikachu.surfingpikachu" not in Pokemon
+
+
+def test_path_through_plain_mapping_not_indexed():
+    registry = Registry()
+    config = {"a": 1, "f": len}
+    registry(config, name="cfg")
+    assert registry["cfg.a"] == 1
+    assert registry.call("cfg.f", "ab") == 2
+
+    config["a"] = 2
+    config["f"] = str
+    assert registry["cfg.a"] == 2
+    assert registry.get("cfg.a") == 2
+    assert registry.call("cfg.f", 1) == "1"
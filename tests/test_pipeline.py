@@ -0,0 +1,114 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from autoregistry import InvalidPipelineError, Pipeline, Registry
+
+
+def construct_transforms():
+    registry = Registry()
+
+    @registry
+    def parse(record):
+        return int(record)
+
+    @registry
+    def double(record):
+        return record * 2
+
+    @registry
+    def pairwise_sum(batch):
+        return [sum(batch)] * len(batch)
+
+    clean = Registry()
+
+    @clean
+    def negate(record):
+        return -record
+
+    registry(clean, name="clean")
+    return registry
+
+
+def test_pipeline_basic():
+    registry = construct_transforms()
+    pipeline = registry.pipeline(["parse", "double", "clean.negate"])
+    assert isinstance(pipeline, Pipeline)
+    assert repr(pipeline) == "<Pipeline: parse -> double -> clean.negate>"
+    assert list(pipeline(["1", "2", "3"])) == [-2, -4, -6]
+    # Reusable.
+    assert list(pipeline(["4"])) == [-8]
+
+
+def test_pipeline_batch():
+    registry = construct_transforms()
+    pipeline = registry.pipeline(["parse", {"key": "pairwise_sum", "batch_size": 2}])
+    assert list(pipeline(["1", "2", "3"])) == [3, 3, 3]
+
+
+@pytest.mark.parametrize("batch_size", [None, 4])
+def test_pipeline_parallel(batch_size):
+    registry = Registry()
+    threads = set()
+
+    @registry
+    def work(record):
+        threads.add(threading.get_ident())
+        return record + 1
+
+    @registry
+    def work_batch(batch):
+        threads.add(threading.get_ident())
+        return [x + 1 for x in batch]
+
+    key = "work" if batch_size is None else "work_batch"
+    stage = {"key": key, "workers": 2, "batch_size": batch_size}
+    pipeline = registry.pipeline([stage])
+    assert list(pipeline(range(100))) == list(range(1, 101))
+    assert threading.get_ident() not in threads
+
+    with ThreadPoolExecutor(2) as executor:
+        stage = {"key": key, "executor": executor, "batch_size": batch_size}
+        pipeline = registry.pipeline([stage])
+        assert list(pipeline(range(10))) == list(range(1, 11))
+
+
+def test_pipeline_lazy():
+    registry = construct_transforms()
+    consumed = []
+
+    def source():
+        for x in range(1000):
+            consumed.append(x)
+            yield x
+
+    results = registry.pipeline(["double"])(source())
+    assert next(results) == 0
+    assert len(consumed) == 1
+
+
+def test_pipeline_validation():
+    registry = construct_transforms()
+    calls = []
+
+    def source():
+        calls.append(1)
+        yield "1"
+
+    with pytest.raises(InvalidPipelineError) as e:
+        registry.pipeline(
+            [
+                "parse",
+                "missing",
+                {"key": "double", "batch_size": 0},
+                {"key": "double", "color": "red"},
+                {"batch_size": 2},
+            ]
+        )(source())
+    message = str(e.value)
+    assert '"missing" is not registered' in message
+    assert "batch_size must be positive" in message
+    assert "unknown options ['color']" in message
+    assert "stage 4: missing key" in message
+    assert calls == []
@@ -0,0 +1,184 @@
+import asyncio
+
+import pytest
+
+from autoregistry import Registry, RegistryPool
+
+
+def construct_clients():
+    class Client(Registry):
+        instances = []
+
+        def __init__(self, dsn="default"):
+            self.instances.append(self)
+            self.dsn = dsn
+
+    class Postgres(Client):
+        pass
+
+    return Client, Postgres
+
+
+def test_pool_reuse():
+    Client, Postgres = construct_clients()
+    pool = RegistryPool(Client, max_size=2)
+
+    async def main():
+        async with pool.acquire("postgres", dsn="a") as first:
+            assert isinstance(first, Postgres)
+            assert first.dsn == "a"
+        async with pool.acquire("POSTGRES", dsn="a") as second:
+            assert second is first
+        async with pool.acquire("postgres", dsn="b") as third:
+            assert third is not first
+
+    asyncio.run(main())
+    assert len(Client.instances) == 2
+
+    metrics = pool.metrics()
+    a = metrics[("postgres", (), (("dsn", "a"),))]
+    assert a.created == 1
+    assert a.acquires == 2
+    assert a.in_use == 0
+    assert a.idle == 1
+    assert a.waits == 0
+
+
+def test_pool_bounded():
+    Client, Postgres = construct_clients()
+    pool = RegistryPool(Client, max_size=2, create_in_thread=False)
+    active = []
+    peak = []
+
+    async def worker():
+        client = await pool.acquire("postgres")
+        active.append(client)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.remove(client)
+        await pool.release(client)
+
+    async def main():
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+    asyncio.run(main())
+    assert max(peak) == 2
+    assert len(Client.instances) == 2
+
+    (metrics,) = pool.metrics().values()
+    assert metrics.acquires == 6
+    assert metrics.waits == 4
+    assert metrics.max_wait > 0
+    assert metrics.utilization == 0.0
+
+
+def test_pool_cancelled_waiter():
+    Client, Postgres = construct_clients()
+    pool = RegistryPool(Client, max_size=1, create_in_thread=False)
+
+    async def main():
+        client = await pool.acquire("postgres")
+        waiter = asyncio.ensure_future(pool.acquire("postgres"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await pool.release(client)
+        # The cancelled waiter doesn't leak the instance.
+        assert await pool.acquire("postgres") is client
+
+    asyncio.run(main())
+
+
+def test_pool_evict_idle():
+    Client, Postgres = construct_clients()
+    disposed = []
+
+    async def dispose(obj):
+        disposed.append(obj)
+
+    pool = RegistryPool(Client, idle_timeout=None, dispose=dispose)
+
+    async def main():
+        client = await pool.acquire("postgres")
+        await pool.release(client)
+        assert await pool.evict_idle() == 0
+        assert await pool.evict_idle(max_idle=0) == 1
+        assert disposed == [client]
+
+        broken = await pool.acquire("postgres")
+        (metrics,) = pool.metrics().values()
+        await pool.release(broken, discard=True)
+        assert disposed == [client, broken]
+        assert metrics.size == 0
+        assert metrics.evicted == 1
+
+    asyncio.run(main())
+    # Keys without instances are dropped.
+    assert pool.metrics() == {}
+
+
+def test_pool_release_evicts_own_key():
+    Client, Postgres = construct_clients()
+    pool = RegistryPool(Client, idle_timeout=0)
+
+    async def main():
+        # The first release sweeps all keys.
+        await pool.release(await pool.acquire("postgres", dsn=0))
+        assert pool.metrics() == {}
+
+        a = await pool.acquire("postgres", dsn="a")
+        b = await pool.acquire("postgres", dsn="b")
+        pool.idle_timeout = 60
+        await pool.release(a)
+        pool.idle_timeout = 0
+        await pool.release(b)
+        # Only the released key is evicted until the next sweep.
+        assert list(pool.metrics()) == [("postgres", (), (("dsn", "a"),))]
+
+        pool._next_sweep = 0.0
+        await pool.release(await pool.acquire("postgres", dsn="b"))
+        assert pool.metrics() == {}
+
+    asyncio.run(main())
+
+
+def test_pool_release_foreign():
+    Client, Postgres = construct_clients()
+    pool = RegistryPool(Client)
+    with pytest.raises(ValueError):
+        asyncio.run(pool.release(Postgres()))
+
+
+def test_pool_failed_create():
+    registry = Registry()
+
+    @registry
+    def broken():
+        raise RuntimeError
+
+    pool = RegistryPool(registry, max_size=1)
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await pool.acquire("broken")
+
+    asyncio.run(main())
+    assert pool.metrics() == {}
+
+
+def test_pool_coroutine_factory():
+    registry = Registry()
+
+    @registry
+    async def connect(dsn):
+        await asyncio.sleep(0)
+        return {"dsn": dsn}
+
+    pool = RegistryPool(registry)
+
+    async def main():
+        async with pool.acquire("connect", "a") as conn:
+            assert conn == {"dsn": "a"}
+
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+import importlib
+import os
+import time
+
+import pytest
+from common import write_modules
+
+from autoregistry import Registry
+
+
+@pytest.fixture
+def plugin_package(tmp_path, monkeypatch):
+    """Create a small on-disk package that tests can edit."""
+    files = {
+        "reload_plugins/__init__.py": "from . import alpha, beta\n",
+        "reload_plugins/alpha.py": "def foo():\n    return 1\n",
+        "reload_plugins/beta.py": "def bar():\n    return 2\n",
+    }
+    with write_modules(tmp_path, monkeypatch, files):
+        yield importlib.import_module("reload_plugins")
+
+
+def _edit(path, text):
+    path.write_text(text)
+    # Guarantee a different mtime, even on filesystems with coarse timestamps.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_no_changes(plugin_package):
+    registry = Registry(plugin_package)
+    event = registry.reload()
+    assert not event
+    assert event.modules == []
+
+
+def test_reload_changed_module(plugin_package, tmp_path):
+    registry = Registry(plugin_package)
+    beta = registry["beta"]
+    old_foo = registry["alpha.foo"]
+    assert old_foo() == 1
+
+    _edit(
+        tmp_path / "reload_plugins" / "alpha.py",
+        "def foo():\n    return 10\n\ndef baz():\n    return 3\n",
+    )
+    event = registry.reload()
+
+    assert event.modules == ["reload_plugins.alpha"]
+    assert event.updated == ["alpha.foo"]
+    assert event.added == ["alpha.baz"]
+    assert event.removed == []
+    assert registry["alpha.foo"]() == 10
+    assert registry["alpha.baz"]() == 3
+    # Unchanged subregistries are untouched.
+    assert registry["beta"] is beta
+
+
+def test_reload_removed_key(plugin_package, tmp_path):
+    registry = Registry(plugin_package)
+    alpha = registry["alpha"]
+
+    _edit(tmp_path / "reload_plugins" / "alpha.py", "def qux():\n    return 4\n")
+    event = registry.reload()
+
+    assert event.removed == ["alpha.foo"]
+    assert event.added == ["alpha.qux"]
+    assert "alpha.foo" not in registry
+    # Subregistry is updated in place.
+    assert registry["alpha"] is alpha
+
+
+def test_reload_syntax_error(plugin_package, tmp_path):
+    registry = Registry(plugin_package)
+    old_foo = registry["alpha.foo"]
+
+    _edit(tmp_path / "reload_plugins" / "alpha.py", "def foo(:\n")
+    with pytest.raises(SyntaxError):
+        registry.reload()
+
+    # The module isn't left without its previously registered attributes.
+    assert plugin_package.alpha.foo is old_foo
+    assert registry["alpha.foo"] is old_foo
+
+    _edit(tmp_path / "reload_plugins" / "alpha.py", "def foo():\n    return 5\n")
+    registry.reload()
+    assert registry["alpha.foo"]() == 5
+
+
+def test_reload_package_init(plugin_package, tmp_path):
+    registry = Registry(plugin_package)
+    alpha = registry["alpha"]
+
+    _edit(
+        tmp_path / "reload_plugins" / "__init__.py",
+        "from . import alpha, beta\n\ndef top():\n    return 5\n",
+    )
+    event = registry.reload()
+
+    assert event.modules == ["reload_plugins"]
+    assert event.added == ["top"]
+    assert registry["top"]() == 5
+    assert registry["alpha"] is alpha
+
+
+def test_watch(plugin_package, tmp_path):
+    registry = Registry(plugin_package)
+    events = []
+
+    with registry.watch(interval=0.01, callback=events.append):
+        _edit(tmp_path / "reload_plugins" / "beta.py", "def bar():\n    return 20\n")
+        deadline = time.monotonic() + 5
+        while not events and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert len(events) == 1
+    assert events[0].updated == ["beta.bar"]
+    assert registry["beta.bar"]() == 20
+
+
+def test_watch_lock(plugin_package, tmp_path):
+    registry = Registry(plugin_package)
+    events = []
+
+    with registry.watch(interval=0.01, callback=events.append) as watcher:
+        with watcher.lock:
+            _edit(
+                tmp_path / "reload_plugins" / "beta.py", "def bar():\n    return 20\n"
+            )
+            time.sleep(0.1)
+            # Not reloaded while the lock is held.
+            assert not events
+            assert registry["beta.bar"]() == 2
+        deadline = time.monotonic() + 5
+        while not events and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert registry["beta.bar"]() == 20
@@ -0,0 +1,149 @@
+import pytest
+from common import construct_functions, construct_pokemon_classes
+
+from autoregistry import KeyCollisionError, Registry
+
+
+def _registry(*names, **config):
+    registry = Registry(**config)
+    functions = {}
+    for name in names:
+
+        def f():
+            pass
+
+        f.__name__ = name
+        functions[name] = registry(f)
+    return registry, functions
+
+
+def test_diff():
+    a, fa = _registry("foo", "bar", "baz")
+    b, fb = _registry("bar", "qux")
+    b.merge(a, policy="keep")  # "bar" remains b's, "foo" and "baz" are shared.
+    b.__registry__.unregister("baz")
+
+    d = a.diff(b)
+    assert d.added == ["qux"]
+    assert d.removed == ["baz"]
+    assert d.changed == ["bar"]
+    assert d
+    assert not a.diff(a)
+
+
+def test_diff_nested():
+    import fake_module
+
+    a = Registry(fake_module)
+    b = Registry(fake_module)
+    assert not a.diff(b)
+
+    @b["fake_module_1"]
+    def extra():
+        pass
+
+    d = a.diff(b)
+    assert d.added == ["fake_module_1.extra"]
+    assert d.removed == []
+    assert d.changed == []
+
+
+def test_merge_policies():
+    a, fa = _registry("foo", "bar")
+    b, fb = _registry("bar", "baz")
+
+    with pytest.raises(KeyCollisionError):
+        a.merge(b)
+
+    a.merge(b, policy="keep")
+    assert a["bar"] is fa["bar"]
+    assert a["baz"] is fb["baz"]
+
+    a.merge(b, policy="replace")
+    assert a["bar"] is fb["bar"]
+
+    with pytest.raises(ValueError):
+        a.merge(b, policy="foo")
+
+
+def test_merge_nested():
+    import fake_module
+
+    a = Registry(fake_module)
+    b = Registry()
+
+    @b
+    def extra():
+        pass
+
+    b.merge(a)
+    assert b["fake_module_1.foo1"] is fake_module.fake_module_1.foo1
+    # Subregistries are copied, not shared.
+    assert b["fake_module_1"] is not a["fake_module_1"]
+
+    c = Registry(fake_module)
+
+    @c["fake_module_1"]
+    def extra2():
+        pass
+
+    b.merge(c)
+    assert "fake_module_1.extra2" in b
+    assert "fake_module_1.extra2" not in a
+
+
+def test_merge_error_leaves_target_unchanged():
+    a = Registry()
+    a_sub = Registry()
+    b = Registry()
+    b_sub = Registry()
+    a(a_sub, name="asub")
+    b(b_sub, name="asub")
+    a(len, name="foo")
+    b(print, name="foo")
+    b_sub(len, name="y")
+    b_sub(print, name="x")
+    a_sub(len, name="x")
+
+    with pytest.raises(KeyCollisionError) as e:
+        a.merge(b)
+    # All collisions are reported, including nested ones.
+    assert '"asub.x"' in str(e.value)
+    assert '"foo"' in str(e.value)
+    assert "y" not in a["asub"]
+    assert list(a["asub"]) == ["x"]
+    assert a["foo"] is len
+
+
+def test_merge_single_bulk_write():
+    a, _ = _registry("foo")
+    b, _ = _registry("bar", "baz")
+    batches = []
+    a.subscribe(batches.append, batch=True)
+    a.merge(b)
+    assert len(batches) == 1
+    assert [e.key for e in batches[0]] == ["bar", "baz"]
+
+
+def test_union_intersection():
+    a, fa = _registry("foo", "bar")
+    b, fb = _registry("bar", "baz")
+    c, fc = _registry("bar", "foo")
+
+    u = a.union(b, policy="keep")
+    assert list(u) == ["foo", "bar", "baz"]
+    assert u["bar"] is fa["bar"]
+    assert list(a) == ["foo", "bar"]
+
+    i = a.intersection(b, c)
+    assert list(i) == ["bar"]
+    assert i["bar"] is fa["bar"]
+
+
+def test_union_classes():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    registry, foo, bar = construct_functions()
+    u = Pokemon.union(registry)
+    assert list(u) == ["charmander", "pikachu", "surfingpikachu", "foo", "bar"]
+    assert u["pikachu.surfingpikachu"] is SurfingPikachu
+    assert Pokemon.intersection(Pikachu).keys() == {"surfingpikachu"}
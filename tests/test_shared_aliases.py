@@ -0,0 +1,135 @@
+import pytest
+
+from autoregistry import KeyCollisionError, Registry
+
+
+def test_shared_aliases_classes():
+    class Sensor(Registry, shared_aliases=True):
+        pass
+
+    class Gas(Sensor):
+        pass
+
+    class Oxygen(Gas, aliases=["o2", "air"]):
+        pass
+
+    class Temperature(Sensor, aliases="temp"):
+        pass
+
+    table = Sensor.__registry__.alias_table
+    assert table is Gas.__registry__.alias_table
+    assert table is Oxygen.__registry__.alias_table
+    assert table == {
+        "o2": ("oxygen", Oxygen),
+        "air": ("oxygen", Oxygen),
+        "temp": ("temperature", Temperature),
+    }
+
+    # Aliases aren't duplicated into each registry.
+    assert dict.keys(Sensor.__registry__) == {"gas", "oxygen", "temperature"}
+
+    assert Sensor["o2"] is Oxygen
+    assert Gas["air"] is Oxygen
+    assert Sensor["temp"] is Temperature
+    assert "o2" in Sensor
+    assert "o2" in Gas
+    assert "temp" not in Gas
+    with pytest.raises(KeyError):
+        Gas["temp"]
+
+    assert list(Sensor) == ["gas", "oxygen", "temperature", "o2", "air", "temp"]
+    assert list(Gas.keys()) == ["oxygen", "o2", "air"]
+    assert len(Gas) == 3
+    assert dict(Gas.items()) == {"oxygen": Oxygen, "o2": Oxygen, "air": Oxygen}
+
+
+def test_shared_aliases_collision():
+    class Sensor(Registry, shared_aliases=True):
+        pass
+
+    class Oxygen(Sensor, aliases="o2"):
+        pass
+
+    with pytest.raises(KeyCollisionError):
+
+        class Ozone(Sensor, aliases="o2"):
+            pass
+
+    with pytest.raises(KeyCollisionError):
+
+        class O2(Sensor):
+            pass
+
+
+def test_shared_aliases_decorator():
+    registry = Registry(shared_aliases=True)
+
+    @registry(aliases=["bar", "baz"])
+    def foo():
+        pass
+
+    assert registry["bar"] is foo
+    assert registry.get("baz") is foo
+    assert list(registry) == ["foo", "bar", "baz"]
+    assert dict.keys(registry.__registry__) == {"foo"}
+
+    registry.__registry__.unregister("bar")
+    assert list(registry) == ["foo", "baz"]
+
+    registry.__registry__.unregister("foo")
+    assert "baz" not in registry
+    assert list(registry) == []
+
+
+def test_shared_aliases_events():
+    class Sensor(Registry, shared_aliases=True):
+        pass
+
+    events = []
+    Sensor.subscribe(events.append)
+
+    class Oxygen(Sensor, aliases="o2"):
+        pass
+
+    assert [(e.kind, e.key) for e in events] == [
+        ("register", "oxygen"),
+        ("alias", "o2"),
+    ]
+
+
+def test_shared_aliases_unregister_releases_alias():
+    registry = Registry(shared_aliases=True)
+    registry(len, name="foo", aliases=["baz"])
+    registry.__registry__.unregister("foo")
+    assert "baz" not in registry.__registry__.alias_table
+
+    registry(print, name="other", aliases=["baz"])
+    assert registry["baz"] is print
+
+    registry.clear()
+    assert not registry.__registry__.alias_table
+    registry(len, name="foo", aliases=["baz"])
+    assert registry["baz"] is len
+
+
+def test_shared_aliases_visible_cached():
+    class Sensor(Registry, shared_aliases=True):
+        pass
+
+    class Gas(Sensor):
+        pass
+
+    class Oxygen(Gas, aliases=["o2"]):
+        pass
+
+    registry = Gas.__registry__
+    assert registry.visible_aliases() is registry.visible_aliases()
+    assert len(Gas) == 2
+
+    # Registering elsewhere in the hierarchy invalidates the cache.
+    class Ozone(Gas, aliases=["o3"]):
+        pass
+
+    assert list(Gas) == ["oxygen", "ozone", "o2", "o3"]
+    Sensor.__registry__.unregister("o2")
+    assert list(Gas) == ["oxygen", "ozone", "o3"]
@@ -0,0 +1,117 @@
+import tracemalloc
+
+import pytest
+
+from autoregistry import Registry
+
+
+def test_stats_hierarchy():
+    class Base(Registry):
+        pass
+
+    class Pokemon(Base, aliases=["pkmn"]):
+        pass
+
+    class Pikachu(Pokemon):
+        pass
+
+    class Eevee(Pokemon):
+        pass
+
+    class Items(Base):
+        pass
+
+    stats = Base.stats()
+    root = stats.registries[0]
+    assert root.path == ""
+    assert root.depth == 0
+    assert root.keys == 5
+    assert root.entries == 4
+    assert root.aliases == 1
+    assert root.propagated == 2
+    assert root.fan_out == 2
+    assert root.bytes > 0
+
+    by_path = {x.path: x for x in stats.registries}
+    assert list(by_path) == ["", "pokemon", "items", "pokemon.pikachu", "pokemon.eevee"]
+    assert by_path["pokemon"].fan_out == 2
+    assert by_path["pokemon"].propagated == 0
+    assert by_path["pokemon.pikachu"].depth == 2
+
+    assert stats.nested == 4
+    assert stats.max_depth == 2
+    assert stats.max_fan_out == 2
+    assert stats.mean_fan_out == 2.0
+    assert stats.bytes == sum(x.bytes for x in stats.registries)
+
+
+def test_stats_lazy_leaves_not_allocated():
+    class Base(Registry):
+        pass
+
+    class Pikachu(Base):
+        pass
+
+    stats = Base.stats()
+    assert stats.lazy == 1
+    assert stats.registries[1].lazy
+    assert stats.registries[1].bytes == 0
+    assert not isinstance(vars(Pikachu)["__registry__"], type(Base.__registry__))
+
+
+def test_stats_shared_aliases():
+    class Base(Registry, shared_aliases=True):
+        pass
+
+    class Pikachu(Base, aliases=["pika", "chu"]):
+        pass
+
+    assert Base.stats().registries[0].aliases == 2
+
+
+def test_stats_decorator_nested():
+    inner = Registry()
+    outer = Registry()
+
+    @inner
+    def foo():
+        pass
+
+    outer(inner, name="inner")
+
+    stats = outer.stats()
+    assert [x.path for x in stats.registries] == ["", "inner"]
+    assert stats.registries[1].entries == 1
+    assert stats.max_depth == 1
+
+
+def test_stats_trace():
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start(25)
+    try:
+
+        class Base(Registry):
+            pass
+
+        class Pikachu(Base):
+            pass
+
+        allocations = Base.stats(trace=True).allocations
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    assert allocations
+    assert allocations[0].filename == __file__
+    assert allocations[0].size > 0
+
+
+def test_stats_trace_not_tracing():
+    class Base(Registry):
+        pass
+
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc already tracing.")
+    with pytest.raises(RuntimeError):
+        Base.stats(trace=True)
@@ -0,0 +1,86 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from common import construct_pokemon_classes
+
+
+def _records(n):
+    for i in range(n):
+        yield {"type": "charmander" if i % 2 else "pikachu", "level": i, "hp": 1}
+
+
+def test_stream_iterable():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    out = list(Pokemon.stream(_records(10)))
+    assert [x.level for x in out] == list(range(10))
+    assert isinstance(out[0], Pikachu)
+    assert isinstance(out[1], Charmander)
+
+
+def test_stream_jsonl(tmp_path):
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    path = tmp_path / "pokemon.jsonl"
+    with path.open("w") as f:
+        for record in _records(5):
+            f.write(json.dumps(record) + "\n")
+        f.write("\n")  # Blank lines are ignored.
+
+    out = list(Pokemon.stream(path))
+    assert [x.level for x in out] == list(range(5))
+
+    with path.open() as f:
+        out = list(Pokemon.stream(f))
+    assert [x.level for x in out] == list(range(5))
+
+
+def test_stream_key_field():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    records = [{"kind": "charmander", "level": 1, "hp": 2}]
+    (charmander,) = Pokemon.stream(records, key_field="kind")
+    assert isinstance(charmander, Charmander)
+
+
+def test_stream_executor():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    with ThreadPoolExecutor(4) as executor:
+        it = Pokemon.stream(_records(1000), executor=executor, max_in_flight=8)
+        out = list(it)
+    assert [x.level for x in out] == list(range(1000))
+
+
+def test_stream_lazy():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+
+    consumed = []
+
+    def records():
+        for record in _records(1000):
+            consumed.append(record)
+            yield record
+
+    with ThreadPoolExecutor(2) as executor:
+        it = Pokemon.stream(records(), executor=executor, max_in_flight=4)
+        next(it)
+        assert len(consumed) <= 5
+        it.close()
+
+
+def test_stream_strict():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    with pytest.raises(TypeError):
+        list(Pokemon.stream([{"type": "pikachu", "level": 1, "hp": 2, "foo": 3}]))
+
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes(
+        filter_kwargs=True
+    )
+    (pikachu,) = Pokemon.stream([{"type": "pikachu", "level": 1, "hp": 2, "foo": 3}])
+    assert isinstance(pikachu, Pikachu)
+
+
+def test_stream_decorator():
+    from common import construct_functions
+
+    registry, foo, bar = construct_functions()
+    records = [{"type": "foo", "x": 1}, {"type": "bar", "x": 2}]
+    assert list(registry.stream(records)) == [1, 2]
@@ -0,0 +1,174 @@
+import pytest
+
+from autoregistry import (
+    InvalidNameError,
+    InvalidVersionError,
+    KeyCollisionError,
+    Registry,
+    checkpoint,
+)
+from autoregistry._versions import Version, parse_constraint
+
+
+@pytest.fixture
+def codecs():
+    registry = Registry()
+    for version in ["1.0.0", "2.0.0", "2.3.1", "2.10.0", "3.0.0-rc.1", "0.2.5"]:
+        registry(f"codec-{version}", name="codec", version=version)
+    return registry
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("*", "2.10.0"),
+        ("^2", "2.10.0"),
+        ("^2.3", "2.10.0"),
+        ("~2.3", "2.3.1"),
+        ("~2", "2.10.0"),
+        (">=2.1", "2.10.0"),
+        (">=2.1,<2.10", "2.3.1"),
+        (">=2.1 <2.10", "2.3.1"),
+        ("<2", "1.0.0"),
+        ("<=2", "2.0.0"),
+        (">1,!=2.10.0", "2.3.1"),
+        ("2.3.1", "2.3.1"),
+        ("==2", "2.0.0"),
+        ("^0.2", "0.2.5"),
+        ("^3.0.0-rc.1", "3.0.0-rc.1"),
+    ],
+)
+def test_version_constraint(codecs, spec, expected):
+    assert codecs[f"codec@{spec}"] == f"codec-{expected}"
+    assert codecs.get("codec", version=spec) == f"codec-{expected}"
+
+
+def test_version_latest_release(codecs):
+    assert codecs["codec"] == "codec-2.10.0"
+    assert list(codecs) == ["codec"]
+
+
+def test_version_miss(codecs):
+    assert codecs.get("codec", version="^4") is None
+    assert "codec@^4" not in codecs
+    assert "codec@^2" in codecs
+    with pytest.raises(KeyError):
+        codecs["codec@>3"]
+    with pytest.raises(KeyError):
+        codecs["other@^1"]
+
+
+def test_version_invalid(codecs):
+    with pytest.raises(InvalidVersionError):
+        codecs["codec@^two"]
+    # Only lookups that raise on a miss raise for invalid constraints.
+    assert "codec@bogus!" not in codecs
+    assert codecs.get("codec@bogus!") is None
+    assert codecs.get("codec", version="bogus!", default=1) == 1
+    with pytest.raises(InvalidVersionError):
+        codecs("foo", name="foo", version="1.x")
+    with pytest.raises(InvalidNameError):
+        codecs("foo", name="foo@1")
+
+
+def test_version_at_sign_without_versions():
+    # "@" is an ordinary character in registries that don't use versions.
+    registry = Registry()
+    registry("user", name="user@host", aliases=["me@home"])
+    nested = Registry()
+    nested(registry, name="hosts@lan")
+    assert registry["user@host"] == "user"
+    assert "me@home" in registry
+    assert nested["hosts@lan.user@host"] == "user"
+    assert "user@bogus!" not in registry
+    with pytest.raises(KeyError):
+        registry["user@bogus!"]
+
+    # Versions would make such keys ambiguous.
+    with pytest.raises(InvalidNameError):
+        registry("codec", name="codec", version="1.0")
+    registry.__registry__.unregister("user@host")
+    registry.__registry__.unregister("me@home")
+    registry("codec", name="codec", version="1.0")
+    with pytest.raises(InvalidNameError):
+        registry("other", name="other@host")
+
+
+def test_version_collision(codecs):
+    with pytest.raises(KeyCollisionError):
+        codecs("again", name="codec", version="2.3.1")
+    with pytest.raises(KeyCollisionError):
+        codecs("unversioned", name="codec")
+
+
+def test_version_cache_invalidated(codecs):
+    assert codecs["codec@^2"] == "codec-2.10.0"
+    codecs("codec-2.11.0", name="codec", version="2.11.0")
+    assert codecs["codec@^2"] == "codec-2.11.0"
+    assert codecs["codec"] == "codec-2.11.0"
+
+
+def test_version_unregister(codecs):
+    codecs.__registry__.unregister("codec")
+    assert "codec@*" not in codecs
+
+
+def test_version_checkpoint(codecs):
+    with checkpoint():
+        codecs("codec-2.11.0", name="codec", version="2.11.0")
+        assert codecs["codec@^2"] == "codec-2.11.0"
+    assert codecs["codec@^2"] == "codec-2.10.0"
+    assert codecs["codec"] == "codec-2.10.0"
+
+
+def test_version_classes():
+    class Codec(Registry):
+        pass
+
+    class Gzip(Codec):
+        pass
+
+    class GzipV1(Gzip, name="v", version="1.0.0"):
+        pass
+
+    class GzipV2(Gzip, name="v", version="2.1.0"):
+        pass
+
+    class Zstd(Codec, version="1.4"):
+        pass
+
+    assert Gzip["v"] is GzipV2
+    assert Gzip["v@^1"] is GzipV1
+    assert Codec["gzip.v@<2"] is GzipV1
+    assert Codec.get("gzip.v", version=">=2") is GzipV2
+    assert Codec["zstd@~1.4"] is Zstd
+
+
+def test_version_decorator():
+    registry = Registry()
+
+    @registry(name="handler", version="1.0")
+    def handler_v1():
+        pass
+
+    @registry(name="handler", version="1.1")
+    def handler_v2():
+        pass
+
+    assert registry["handler"] is handler_v2
+    assert registry["handler@~1.0"] is handler_v1
+
+
+def test_version_ordering():
+    versions = ["1.0.0-alpha", "1.0.0-alpha.1", "1.0.0-beta", "1.0.0-rc.1", "1.0.0"]
+    parsed = [Version(x) for x in versions]
+    shuffled = [parsed[i] for i in (3, 0, 4, 2, 1)]
+    assert sorted(shuffled) == parsed
+    assert Version("2") == Version("2.0.0")
+    assert Version("2.10") > Version("2.9")
+
+
+def test_parse_constraint_caret_zero():
+    constraint = parse_constraint("^0.0.3")
+    assert constraint.admits(Version("0.0.3"))
+    assert not constraint.admits(Version("0.0.4"))
@@ -0,0 +1,93 @@
+import pytest
+from common import construct_functions, construct_pokemon_classes
+
+from autoregistry import OverlayRegistry, Registry, RegistryView
+
+
+def test_view_unfiltered():
+    registry, foo, bar = construct_functions()
+    view = registry.view()
+    assert isinstance(view, RegistryView)
+    assert list(view) == ["foo", "bar"]
+    assert len(view) == 2
+    assert "FOO" in view
+    assert view["foo"] is foo
+    assert dict(view.items()) == {"foo": foo, "bar": bar}
+    assert view == {"foo", "bar"}
+
+
+def test_view_filters():
+    registry = Registry()
+    for name in ["io_csv", "io_json", "net_http"]:
+        registry(lambda: None, name=name)
+
+    io = registry.view(prefix="IO_")
+    assert list(io) == ["io_csv", "io_json"]
+    assert "net_http" not in io
+    assert "missing" not in io
+    assert io.get("net_http", 0) == 0
+    with pytest.raises(KeyError):
+        io["net_http"]
+
+    # Filters compose.
+    csv = io.filter(predicate=lambda key, obj: key.endswith("csv"))
+    assert list(csv) == ["io_csv"]
+    assert list(io) == ["io_csv", "io_json"]
+
+    # Set operations return plain sets.
+    assert io & registry.view(predicate=lambda k, o: "json" in k) == {"io_json"}
+    assert io - csv == {"io_json"}
+
+
+def test_view_base():
+    Pokemon, Charmander, Pikachu, SurfingPikachu = construct_pokemon_classes()
+    pikachus = Pokemon.view(base=Pikachu)
+    assert list(pikachus) == ["pikachu", "surfingpikachu"]
+    assert "charmander" not in pikachus
+    assert list(pikachus.values()) == [Pikachu, SurfingPikachu]
+
+
+def test_view_live():
+    registry, foo, bar = construct_functions()
+    view = registry.view(prefix="b")
+    assert len(view) == 1
+
+    @registry
+    def baz():
+        pass
+
+    assert len(view) == 2
+    assert "baz" in view
+
+    registry.__registry__.unregister("bar")
+    assert len(view) == 1
+    assert list(view) == ["baz"]
+
+
+def test_view_count_cached():
+    registry, foo, bar = construct_functions()
+    calls = []
+
+    def predicate(key, obj):
+        calls.append(key)
+        return True
+
+    view = registry.view(predicate=predicate)
+    assert len(view) == 2
+    assert len(view) == 2
+    assert calls == ["foo", "bar"]
+
+
+def test_view_overlay():
+    base, foo, bar = construct_functions()
+    overlay = OverlayRegistry(base)
+    view = overlay.view(prefix="b")
+    assert list(view) == ["bar"]
+    assert len(view) == 1
+
+    @base
+    def baz():
+        pass
+
+    assert len(view) == 2
+    assert view["baz"] is baz